@@ -0,0 +1,687 @@
+"""
+Benchmarks das funções públicas do brasil_utils.
+
+Gera conjuntos de dados sintéticos (CPFs e CNPJs válidos e inválidos,
+telefones de 8 a 13 dígitos, datas espalhadas por décadas...), mede cada
+função exportada em ``brasil_utils.__all__`` e grava o resultado em JSON.
+Com ``--comparar``, confronta o resultado com uma execução anterior e
+termina com código 1 se alguma função ficou mais lenta que o limite.
+
+Uso:
+
+    python benchmarks/executar.py --saida baseline.json
+    python benchmarks/executar.py --comparar baseline.json --limite 0.15
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import brasil_utils  # noqa: E402
+from brasil_utils import cep as modulo_cep  # noqa: E402
+from brasil_utils.validadores import calcular_digitos  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Dados sintéticos
+# ---------------------------------------------------------------------------
+
+def _com_digitos(base, tipo, valido):
+    digitos = calcular_digitos(base, tipo)
+    if not valido:
+        digitos = digitos[0] + str((int(digitos[1]) + 1) % 10)
+    return base + digitos
+
+
+def gerar_cpf(aleatorio, valido):
+    base = ''.join(str(aleatorio.randrange(10)) for _ in range(9))
+    texto = _com_digitos(base, 'cpf', valido)
+    if aleatorio.random() < 0.5:
+        texto = f"{texto[:3]}.{texto[3:6]}.{texto[6:9]}-{texto[9:]}"
+    return texto
+
+
+def gerar_cnpj(aleatorio, valido):
+    base = ''.join(str(aleatorio.randrange(10)) for _ in range(8)) + "0001"
+    texto = _com_digitos(base, 'cnpj', valido)
+    if aleatorio.random() < 0.5:
+        texto = f"{texto[:2]}.{texto[2:5]}.{texto[5:8]}/{texto[8:12]}-{texto[12:]}"
+    return texto
+
+
+def gerar_telefone(aleatorio):
+    # Formatos de 8 a 13 dígitos: fixo, celular, com DDD e com código do país
+    tamanho = aleatorio.choice((8, 9, 10, 11, 12, 13))
+    numero = ''.join(str(aleatorio.randrange(10)) for _ in range(tamanho))
+    if tamanho >= 12:
+        numero = '55' + numero[2:]
+    if aleatorio.random() < 0.3:
+        numero = f"({numero[:2]}) {numero[2:]}"
+    return numero
+
+
+def gerar_dados(tamanho, semente=42):
+    """
+    Gera os conjuntos de dados usados pelos benchmarks.
+
+    Args:
+        tamanho (int): Quantidade de itens de cada conjunto
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        dict: Conjuntos de dados por nome
+    """
+    aleatorio = random.Random(semente)
+    inicio = date(1970, 1, 1)
+    dias = (date(2070, 12, 31) - inicio).days
+
+    datas = [inicio + timedelta(days=aleatorio.randrange(dias)) for _ in range(tamanho)]
+    return {
+        'cpfs': [gerar_cpf(aleatorio, aleatorio.random() < 0.5) for _ in range(tamanho)],
+        'cnpjs': [gerar_cnpj(aleatorio, aleatorio.random() < 0.5) for _ in range(tamanho)],
+        'telefones': [gerar_telefone(aleatorio) for _ in range(tamanho)],
+        'valores': [aleatorio.uniform(-1e7, 1e7) for _ in range(tamanho)],
+        'ceps': [f"{aleatorio.randrange(1000, 100000):05d}{aleatorio.randrange(1000):03d}"
+                 for _ in range(tamanho)],
+        'datas': datas,
+        'datas_texto': [
+            d.isoformat() if i % 2 else d.strftime('%d/%m/%Y') for i, d in enumerate(datas)
+        ],
+        'anos': [d.year for d in datas],
+        'intervalos': [
+            (d, d + timedelta(days=aleatorio.randrange(1, 3650))) for d in datas
+        ],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Infraestrutura de CEP local (sem acesso à rede)
+# ---------------------------------------------------------------------------
+
+class _ServidorCep(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Cabeçalhos e corpo saem em escritas separadas: sem isto, o Nagle e o
+    # ACK atrasado somam ~40ms a cada requisição keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        cep = self.path.split("/")[2]
+        corpo = json.dumps({
+            "cep": f"{cep[:5]}-{cep[5:]}", "logradouro": "Rua Teste", "bairro": "Centro",
+            "localidade": "São Paulo", "uf": "SP", "ibge": "3550308"
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+class Ambiente:
+    """Recursos temporários compartilhados pelos benchmarks de CEP."""
+
+    def __init__(self, dados):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.origem = os.path.join(self.diretorio.name, "ceps.jsonl")
+        self.indice = os.path.join(self.diretorio.name, "ceps.idx")
+        with open(self.origem, "w", encoding="utf-8") as arquivo:
+            for cep in dados['ceps']:
+                arquivo.write(json.dumps({"cep": cep, "logradouro": "Rua Teste",
+                                          "localidade": "São Paulo", "uf": "SP"}) + "\n")
+        brasil_utils.construir_indice_cep(self.origem, self.indice)
+        self.base = brasil_utils.BaseCepLocal(self.indice)
+
+        self.servidor = ThreadingHTTPServer(("127.0.0.1", 0), _ServidorCep)
+        self.servidor.daemon_threads = True
+        threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.servidor.server_address[1]}/ws/{{cep}}/json/"
+
+    def fechar(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        self.base.fechar()
+        self.diretorio.cleanup()
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+# nome -> (funções exportadas cobertas, preparação)
+# A preparação recebe (dados, ambiente) e retorna (executar, quantidade_itens)
+# ou (executar, quantidade_itens, finalizar), sendo finalizar chamada após a
+# medição para desfazer alterações no estado global da biblioteca
+BENCHMARKS = {}
+
+
+def benchmark(nome, cobre=None):
+    def registrar(preparar):
+        BENCHMARKS[nome] = (tuple(cobre if cobre is not None else (nome,)), preparar)
+        return preparar
+    return registrar
+
+
+def _laco(funcao, itens):
+    def executar():
+        for item in itens:
+            funcao(item)
+    return executar, len(itens)
+
+
+@benchmark('validar_cpf')
+def _(dados, ambiente):
+    return _laco(brasil_utils.validar_cpf, dados['cpfs'])
+
+
+@benchmark('validar_cpf[metricas]', cobre=())
+def _(dados, ambiente):
+    from brasil_utils import metricas
+    validar_cpf = brasil_utils.validar_cpf
+    cpfs = dados['cpfs']
+
+    # Custo da instrumentação ativada, comparável a validar_cpf, com um
+    # registro próprio: as métricas do processo não são alteradas
+    registro, ativas = metricas._registro, metricas.metricas_ativas()
+    metricas._registro = metricas._RegistroMetricas()
+    metricas.ativar_metricas()
+
+    def executar():
+        for cpf in cpfs:
+            validar_cpf(cpf)
+
+    def finalizar():
+        metricas._registro = registro
+        if not ativas:
+            metricas.desativar_metricas()
+    return executar, len(cpfs), finalizar
+
+
+@benchmark('validar_cnpj')
+def _(dados, ambiente):
+    return _laco(brasil_utils.validar_cnpj, dados['cnpjs'])
+
+
+@benchmark('formatar_cpf')
+def _(dados, ambiente):
+    return _laco(brasil_utils.formatar_cpf, dados['cpfs'])
+
+
+@benchmark('formatar_cnpj')
+def _(dados, ambiente):
+    return _laco(brasil_utils.formatar_cnpj, dados['cnpjs'])
+
+
+@benchmark('validar_cpf_lote')
+def _(dados, ambiente):
+    cpfs = dados['cpfs']
+    return (lambda: brasil_utils.validar_cpf_lote(cpfs)), len(cpfs)
+
+
+@benchmark('validar_cnpj_lote')
+def _(dados, ambiente):
+    cnpjs = dados['cnpjs']
+    return (lambda: brasil_utils.validar_cnpj_lote(cnpjs)), len(cnpjs)
+
+
+@benchmark('validar_documento', cobre=('validar_documento', 'DocumentoValidado'))
+def _(dados, ambiente):
+    return _laco(brasil_utils.validar_documento, dados['cpfs'])
+
+
+@benchmark('validar_documentos', cobre=('validar_documentos', 'LoteDocumentos'))
+def _(dados, ambiente):
+    cpfs = dados['cpfs']
+    return (lambda: brasil_utils.validar_documentos(cpfs).quantidade_validos), len(cpfs)
+
+
+@benchmark('validar_registros', cobre=('validar_registros', 'validar_arquivo_registros'))
+def _(dados, ambiente):
+    # Registros de largura fixa: CPF formatado alinhado em 14 bytes + "\n"
+    registros = b"".join(f"{cpf:<14.14}\n".encode() for cpf in dados['cpfs'])
+    caminho = os.path.join(ambiente.diretorio.name, "cpfs.txt")
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(registros)
+    return (lambda: brasil_utils.validar_arquivo_registros(caminho, 15, 0, 14)), len(dados['cpfs'])
+
+
+@benchmark('validar_em_paralelo')
+def _(dados, ambiente):
+    cnpjs = dados['cnpjs'] * 4
+
+    def executar():
+        for _ in brasil_utils.validar_em_paralelo(
+                cnpjs, tipo='cnpj', workers=2, chunk_size=len(cnpjs) // 8 or 1,
+                limite_sequencial=0):
+            pass
+    return executar, len(cnpjs)
+
+
+@benchmark('validar_cep')
+def _(dados, ambiente):
+    return _laco(brasil_utils.validar_cep, dados['ceps'])
+
+
+@benchmark('formatar_cep')
+def _(dados, ambiente):
+    return _laco(brasil_utils.formatar_cep, dados['ceps'])
+
+
+@benchmark('buscar_cep[local]', cobre=('buscar_cep', 'definir_backend_cep', 'BaseCepLocal'))
+def _(dados, ambiente):
+    ceps = dados['ceps']
+
+    def executar():
+        brasil_utils.definir_backend_cep(ambiente.base)
+        try:
+            for cep in ceps:
+                brasil_utils.buscar_cep(cep)
+        finally:
+            brasil_utils.definir_backend_cep(None)
+    return executar, len(ceps)
+
+
+@benchmark('buscar_endereco[local]', cobre=('buscar_endereco', 'Endereco', 'ErroCep'))
+def _(dados, ambiente):
+    ceps = dados['ceps']
+
+    def executar():
+        for cep in ceps:
+            brasil_utils.buscar_endereco(cep, backend=ambiente.base)
+    return executar, len(ceps)
+
+
+@benchmark('buscar_cep[cache]', cobre=('buscar_cep', 'definir_cache_cep', 'CacheCep'))
+def _(dados, ambiente):
+    ceps = dados['ceps']
+    cache = brasil_utils.CacheCep(tamanho_memoria=len(ceps))
+    for cep in ceps:
+        cache.armazenar(modulo_cep.limpar_cep(cep), {"cep": cep})
+
+    def executar():
+        brasil_utils.definir_cache_cep(cache)
+        try:
+            for cep in ceps:
+                brasil_utils.buscar_cep(cep, offline=True)
+        finally:
+            brasil_utils.definir_cache_cep(None)
+    return executar, len(ceps)
+
+
+@benchmark('buscar_ceps', cobre=('buscar_ceps', 'ResolvedorCep', 'DisjuntorCircuito'))
+def _(dados, ambiente):
+    from brasil_utils.cep_provedores import ProvedorArquivo, ProvedorViaCep
+    ceps = dados['ceps'][:500]
+    # Servidor local na frente; a base local só responde se ele falhar
+    resolvedor = brasil_utils.ResolvedorCep(
+        [ProvedorViaCep(ambiente.url), ProvedorArquivo(ambiente.base)], workers=8
+    )
+    return (lambda: brasil_utils.buscar_ceps(ceps, resolvedor=resolvedor)), len(ceps)
+
+
+@benchmark('buscar_enderecos', cobre=('buscar_enderecos', 'LoteEnderecos'))
+def _(dados, ambiente):
+    ceps = dados['ceps'][:500]
+    return (lambda: brasil_utils.buscar_enderecos(ceps, resolvedor=ambiente.base)), len(ceps)
+
+
+@benchmark('construir_indice_cep')
+def _(dados, ambiente):
+    destino = os.path.join(ambiente.diretorio.name, "bench.idx")
+    return (lambda: brasil_utils.construir_indice_cep(ambiente.origem, destino)), len(dados['ceps'])
+
+
+@benchmark('BaseCepLocal.buscar_prefixo', cobre=('BaseCepLocal',))
+def _(dados, ambiente):
+    prefixos = [cep[:3] for cep in dados['ceps'][:1000]]
+
+    def executar():
+        for prefixo in prefixos:
+            for _ in ambiente.base.buscar_prefixo(prefixo):
+                pass
+    return executar, len(prefixos)
+
+
+@benchmark('AsyncCepClient', cobre=('AsyncCepClient', 'buscar_ceps_async'))
+def _(dados, ambiente):
+    ceps = dados['ceps'][:2000]
+
+    async def consultar():
+        async for _ in brasil_utils.buscar_ceps_async(ceps, url=ambiente.url,
+                                                       limite_conexoes=16):
+            pass
+    return (lambda: asyncio.run(consultar())), len(ceps)
+
+
+@benchmark('gerar_cpf', cobre=('gerar_cpf', 'gerar_cnpj'))
+def _(dados, ambiente):
+    gerar_cpf = brasil_utils.gerar_cpf
+    quantidade = len(dados['cpfs'])
+
+    def executar():
+        for _ in range(quantidade):
+            gerar_cpf()
+    return executar, quantidade
+
+
+@benchmark('GeradorDocumentos')
+def _(dados, ambiente):
+    gerador = brasil_utils.GeradorDocumentos(42)
+    quantidade = len(dados['cpfs'])
+    return (lambda: gerador.lote_cnpj(quantidade, 0.5, formatado=True)), quantidade
+
+
+@benchmark('formatar_real')
+def _(dados, ambiente):
+    return _laco(brasil_utils.formatar_real, dados['valores'])
+
+
+@benchmark('formatar_real_lote')
+def _(dados, ambiente):
+    valores = dados['valores']
+    return (lambda: brasil_utils.formatar_real_lote(valores)), len(valores)
+
+
+@benchmark('formatar_telefone')
+def _(dados, ambiente):
+    return _laco(brasil_utils.formatar_telefone, dados['telefones'])
+
+
+@benchmark('analisar_telefone', cobre=('analisar_telefone', 'TelefoneBR', 'validar_telefone'))
+def _(dados, ambiente):
+    return _laco(brasil_utils.analisar_telefone, dados['telefones'])
+
+
+@benchmark('analisar_telefones', cobre=('analisar_telefones', 'classificar_telefones'))
+def _(dados, ambiente):
+    telefones = dados['telefones']
+    return (lambda: brasil_utils.classificar_telefones(telefones)), len(telefones)
+
+
+@benchmark('formatar_data_brasileira')
+def _(dados, ambiente):
+    return _laco(brasil_utils.formatar_data_brasileira, dados['datas_texto'])
+
+
+@benchmark('converter_data')
+def _(dados, ambiente):
+    return _laco(brasil_utils.converter_data, dados['datas_texto'])
+
+
+@benchmark('converter_datas', cobre=('converter_datas', 'ConversorDatas'))
+def _(dados, ambiente):
+    textos = dados['datas_texto']
+    return (lambda: brasil_utils.converter_datas(textos)), len(textos)
+
+
+@benchmark('todos_feriados')
+def _(dados, ambiente):
+    return _laco(brasil_utils.todos_feriados, dados['anos'])
+
+
+@benchmark('listar_feriados', cobre=('listar_feriados', 'Feriado'))
+def _(dados, ambiente):
+    return _laco(brasil_utils.listar_feriados, dados['anos'])
+
+
+@benchmark('eh_feriado')
+def _(dados, ambiente):
+    return _laco(brasil_utils.eh_feriado, dados['datas'])
+
+
+@benchmark('eh_feriado[texto]', cobre=('eh_feriado',))
+def _(dados, ambiente):
+    return _laco(brasil_utils.eh_feriado, dados['datas_texto'])
+
+
+@benchmark('eh_feriado[municipio]', cobre=('eh_feriado',))
+def _(dados, ambiente):
+    from brasil_utils.feriados_regionais import (
+        UFS_IBGE, limpar_feriados_regionais, registrar_feriado
+    )
+    # Milhares de municípios cadastrados, como numa base completa
+    codigos = [f"{uf}{numero:05d}" for uf in UFS_IBGE for numero in range(200)]
+    for indice, codigo in enumerate(codigos):
+        registrar_feriado(codigo, 'Aniversário', f"{indice % 28 + 1:02d}/{indice % 12 + 1:02d}")
+    pares = list(zip(dados['datas'], codigos * (len(dados['datas']) // len(codigos) + 1)))
+    eh_feriado = brasil_utils.eh_feriado
+
+    def executar():
+        for data, codigo in pares:
+            eh_feriado(data, municipio=codigo)
+
+    def finalizar():
+        # Volta ao cadastro padrão, o único usado pelos demais benchmarks
+        limpar_feriados_regionais(restaurar_padrao=True)
+
+    # Compila as tabelas de cada ano antes da medição (regime permanente,
+    # mesmo com --repeticoes 1)
+    executar()
+    return executar, len(pares), finalizar
+
+
+@benchmark('proximo_feriado')
+def _(dados, ambiente):
+    return _laco(brasil_utils.proximo_feriado, dados['datas'])
+
+
+@benchmark('feriados_por_mes', cobre=())
+def _(dados, ambiente):
+    from brasil_utils.feriados import feriados_por_mes
+    meses = [(d.year, d.month) for d in dados['datas']]
+
+    def executar():
+        for ano, mes in meses:
+            feriados_por_mes(ano, mes)
+    return executar, len(meses)
+
+
+@benchmark('LinhaDoTempoFeriados')
+def _(dados, ambiente):
+    linha = brasil_utils.LinhaDoTempoFeriados(1970, 2090)
+    intervalos = dados['intervalos']
+
+    def executar():
+        for inicio, fim in intervalos:
+            linha.anterior(inicio)
+            linha.entre(inicio, fim)
+    return executar, len(intervalos)
+
+
+@benchmark('dias_uteis_entre', cobre=())
+def _(dados, ambiente):
+    from brasil_utils.feriados import dias_uteis_entre
+    intervalos = dados['intervalos'][:200]
+
+    def executar():
+        for inicio, fim in intervalos:
+            dias_uteis_entre(inicio, fim)
+    return executar, len(intervalos)
+
+
+@benchmark('dias_uteis_lote', cobre=())
+def _(dados, ambiente):
+    import numpy as np
+    from brasil_utils.feriados import dias_uteis_entre_lote, adicionar_dias_uteis_lote
+    inicios, fins = (np.array(coluna, dtype='datetime64[D]') for coluna in zip(*dados['intervalos']))
+
+    def executar():
+        dias_uteis_entre_lote(inicios, fins)
+        adicionar_dias_uteis_lote(inicios, 10)
+    return executar, len(inicios)
+
+
+@benchmark('CalendarioUteis')
+def _(dados, ambiente):
+    calendario = brasil_utils.CalendarioUteis(1970, 2090)
+    intervalos = dados['intervalos']
+
+    def executar():
+        for inicio, fim in intervalos:
+            calendario.dias_uteis_entre(inicio, fim)
+            calendario.adicionar_dias_uteis(inicio, 10)
+    return executar, len(intervalos)
+
+
+# ---------------------------------------------------------------------------
+# Execução e comparação
+# ---------------------------------------------------------------------------
+
+def medir(executar, repeticoes):
+    """
+    Executa uma função várias vezes e retorna o menor tempo, em segundos.
+
+    Args:
+        executar (callable): Função a ser medida
+        repeticoes (int): Quantidade de execuções
+
+    Returns:
+        float: Melhor tempo observado
+    """
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        executar()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def executar_benchmarks(tamanho, repeticoes, filtro=None):
+    """
+    Executa os benchmarks registrados.
+
+    Args:
+        tamanho (int): Quantidade de itens de cada conjunto de dados
+        repeticoes (int): Execuções de cada benchmark (vale a melhor)
+        filtro (str): Executa apenas benchmarks cujo nome contém o texto
+
+    Returns:
+        dict: Resultado pronto para ser gravado em JSON
+    """
+    dados = gerar_dados(tamanho)
+    ambiente = Ambiente(dados)
+    resultados = {}
+    try:
+        for nome, (_, preparar) in BENCHMARKS.items():
+            if filtro and filtro not in nome:
+                continue
+            try:
+                preparado = preparar(dados, ambiente)
+            except ImportError as e:
+                print(f"{nome:35s} ignorado ({e})", file=sys.stderr)
+                continue
+            executar, itens = preparado[:2]
+            try:
+                segundos = medir(executar, repeticoes)
+            finally:
+                if len(preparado) > 2:
+                    preparado[2]()
+            resultados[nome] = {
+                'itens': itens,
+                'segundos': segundos,
+                'ns_por_item': 1e9 * segundos / itens,
+            }
+            print(f"{nome:35s} {resultados[nome]['ns_por_item']:12.1f} ns/item", file=sys.stderr)
+    finally:
+        ambiente.fechar()
+
+    return {
+        'versao': brasil_utils.__version__,
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'tamanho': tamanho,
+        'repeticoes': repeticoes,
+        'resultados': resultados,
+    }
+
+
+def funcoes_sem_benchmark():
+    """
+    Lista as funções exportadas que não têm benchmark.
+
+    Returns:
+        list: Nomes de ``brasil_utils.__all__`` sem cobertura
+    """
+    cobertas = set()
+    for cobre, _ in BENCHMARKS.values():
+        cobertas.update(cobre)
+    return [nome for nome in brasil_utils.__all__ if nome not in cobertas]
+
+
+def comparar(atual, referencia, limite):
+    """
+    Compara um resultado com uma execução de referência.
+
+    Args:
+        atual (dict): Resultado de ``executar_benchmarks``
+        referencia (dict): Resultado anterior, lido do JSON
+        limite (float): Piora relativa tolerada (0.1 = 10%)
+
+    Returns:
+        list: Tuplas (nome, ns_referencia, ns_atual, variacao) das regressões
+    """
+    regressoes = []
+    for nome, resultado in atual['resultados'].items():
+        anterior = referencia.get('resultados', {}).get(nome)
+        if anterior is None:
+            continue
+        variacao = resultado['ns_por_item'] / anterior['ns_por_item'] - 1
+        if variacao > limite:
+            regressoes.append((nome, anterior['ns_por_item'], resultado['ns_por_item'], variacao))
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks do brasil_utils')
+    parser.add_argument('--tamanho', type=int, default=100000,
+                        help='itens por conjunto de dados (padrão: 100000)')
+    parser.add_argument('--repeticoes', type=int, default=3,
+                        help='execuções por benchmark, vale a melhor (padrão: 3)')
+    parser.add_argument('--filtro', help='executa apenas benchmarks com este texto no nome')
+    parser.add_argument('--saida', help='grava o resultado neste arquivo JSON')
+    parser.add_argument('--comparar', metavar='BASELINE',
+                        help='compara com um resultado JSON anterior')
+    parser.add_argument('--limite', type=float, default=0.10,
+                        help='piora relativa tolerada na comparação (padrão: 0.10)')
+    argumentos = parser.parse_args(argv)
+
+    sem_benchmark = funcoes_sem_benchmark()
+    if sem_benchmark:
+        print(f"Aviso: funções exportadas sem benchmark: {', '.join(sem_benchmark)}",
+              file=sys.stderr)
+
+    resultado = executar_benchmarks(argumentos.tamanho, argumentos.repeticoes, argumentos.filtro)
+
+    if argumentos.saida:
+        with open(argumentos.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding='utf-8') as arquivo:
+            referencia = json.load(arquivo)
+        regressoes = comparar(resultado, referencia, argumentos.limite)
+        for nome, anterior, atual, variacao in regressoes:
+            print(f"REGRESSÃO {nome}: {anterior:.1f} -> {atual:.1f} ns/item ({variacao:+.0%})",
+                  file=sys.stderr)
+        if regressoes:
+            return 1
+        print("Nenhuma regressão acima do limite.", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
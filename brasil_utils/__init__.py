@@ -12,30 +12,134 @@ Este pacote oferece funcionalidades essenciais para aplicações brasileiras:
 __version__ = "0.0.1"
 __author__ = "Samuel Lucas"
 
-# Importações principais para facilitar o uso
-from .validadores import validar_cpf, validar_cnpj, formatar_cpf, formatar_cnpj
-from .formatadores import formatar_real, formatar_telefone, formatar_data_brasileira
-from .cep import buscar_cep, validar_cep, formatar_cep
-
-# Importações condicionais (dependem de bibliotecas externas)
-try:
-    from .feriados import todos_feriados, eh_feriado, proximo_feriado
-except ImportError:
-    # Se dateutil não estiver instalado, as funções de feriados não estarão disponíveis
-    pass
+import importlib
+
+# As exportações são carregadas sob demanda (PEP 562): ``import brasil_utils``
+# não importa nenhum submódulo, e dependências pesadas como requests e
+# NumPy só são carregadas quando a função que as usa é chamada.
+_EXPORTACOES = {
+    'validar_cpf': 'validadores',
+    'validar_cnpj': 'validadores',
+    'formatar_cpf': 'validadores',
+    'formatar_cnpj': 'validadores',
+    'validar_cpf_lote': 'validadores',
+    'validar_cnpj_lote': 'validadores',
+    'validar_em_paralelo': 'validadores',
+    'validar_registros': 'validadores',
+    'validar_arquivo_registros': 'validadores',
+    'validar_documento': 'validadores',
+    'validar_documentos': 'validadores',
+    'GeradorDocumentos': 'geradores',
+    'gerar_cpf': 'geradores',
+    'gerar_cnpj': 'geradores',
+    'buscar_cep': 'cep',
+    'buscar_endereco': 'cep',
+    'validar_cep': 'cep',
+    'formatar_cep': 'cep',
+    'definir_cache_cep': 'cep',
+    'definir_backend_cep': 'cep',
+    'CacheCep': 'cep_cache',
+    'BaseCepLocal': 'cep_local',
+    'construir_indice_cep': 'cep_local',
+    'AsyncCepClient': 'cep_async',
+    'buscar_ceps_async': 'cep_async',
+    'ResolvedorCep': 'cep_provedores',
+    'DisjuntorCircuito': 'cep_provedores',
+    'buscar_ceps': 'cep_provedores',
+    'buscar_enderecos': 'cep_provedores',
+    'formatar_real': 'formatadores',
+    'formatar_real_lote': 'formatadores',
+    'formatar_telefone': 'formatadores',
+    'formatar_data_brasileira': 'formatadores',
+    'ConversorDatas': 'datas',
+    'converter_data': 'datas',
+    'converter_datas': 'datas',
+    'TelefoneBR': 'telefones',
+    'analisar_telefone': 'telefones',
+    'analisar_telefones': 'telefones',
+    'classificar_telefones': 'telefones',
+    'validar_telefone': 'telefones',
+    'todos_feriados': 'feriados',
+    'eh_feriado': 'feriados',
+    'proximo_feriado': 'feriados',
+    'CalendarioUteis': 'feriados',
+    'LinhaDoTempoFeriados': 'feriados',
+    'listar_feriados': 'feriados',
+    'Endereco': 'tipos',
+    'ErroCep': 'tipos',
+    'Feriado': 'tipos',
+    'DocumentoValidado': 'tipos',
+    'LoteDocumentos': 'tipos',
+    'LoteEnderecos': 'tipos',
+}
+
+
+def __getattr__(nome):
+    modulo = _EXPORTACOES.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(importlib.import_module(f'.{modulo}', __name__), nome)
+    # Guarda no módulo para que os próximos acessos não passem por aqui
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     'validar_cpf',
     'validar_cnpj', 
     'formatar_cpf',
     'formatar_cnpj',
+    'validar_cpf_lote',
+    'validar_cnpj_lote',
+    'validar_em_paralelo',
+    'validar_registros',
+    'validar_arquivo_registros',
+    'validar_documento',
+    'validar_documentos',
+    'GeradorDocumentos',
+    'gerar_cpf',
+    'gerar_cnpj',
     'buscar_cep',
+    'buscar_endereco',
     'validar_cep',
     'formatar_cep',
+    'definir_cache_cep',
+    'CacheCep',
+    'definir_backend_cep',
+    'BaseCepLocal',
+    'construir_indice_cep',
+    'AsyncCepClient',
+    'buscar_ceps_async',
+    'ResolvedorCep',
+    'DisjuntorCircuito',
+    'buscar_ceps',
+    'buscar_enderecos',
     'formatar_real',
+    'formatar_real_lote',
     'formatar_telefone',
     'formatar_data_brasileira',
+    'ConversorDatas',
+    'converter_data',
+    'converter_datas',
+    'TelefoneBR',
+    'analisar_telefone',
+    'analisar_telefones',
+    'classificar_telefones',
+    'validar_telefone',
     'todos_feriados',
     'eh_feriado',
-    'proximo_feriado'
+    'proximo_feriado',
+    'CalendarioUteis',
+    'LinhaDoTempoFeriados',
+    'listar_feriados',
+    'Endereco',
+    'ErroCep',
+    'Feriado',
+    'DocumentoValidado',
+    'LoteDocumentos',
+    'LoteEnderecos'
 ]
\ No newline at end of file
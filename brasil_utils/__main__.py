@@ -0,0 +1,10 @@
+"""
+Permite executar a linha de comando com ``python -m brasil_utils``.
+"""
+
+import sys
+
+from .cli import main
+
+
+sys.exit(main())
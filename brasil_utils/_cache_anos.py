@@ -0,0 +1,92 @@
+"""
+Cache LRU de tabelas calculadas por ano, usado pelos feriados nacionais e
+regionais.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+# Quantidade padrão de anos mantidos no cache de feriados
+TAMANHO_CACHE_PADRAO = 128
+
+
+class CacheAnos:
+    """
+    Cache LRU das tabelas calculadas por ano.
+
+    Args:
+        montar (callable): Calcula a tabela de um ano (chamada fora do lock)
+        tamanho_maximo (int): Quantidade máxima de anos mantidos (None para
+            ilimitado, 0 para desativar o cache)
+    """
+
+    def __init__(self, montar, tamanho_maximo=TAMANHO_CACHE_PADRAO):
+        self._montar = montar
+        self._lock = threading.Lock()
+        self._tabelas = OrderedDict()
+        # Incrementada a cada invalidação: uma tabela montada antes dela não
+        # é guardada
+        self._geracao = 0
+        self.tamanho_maximo = tamanho_maximo
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, ano):
+        with self._lock:
+            tabela = self._tabelas.get(ano)
+            if tabela is not None:
+                self._tabelas.move_to_end(ano)
+                self.acertos += 1
+                return tabela
+            self.falhas += 1
+            geracao = self._geracao
+
+        tabela = self._montar(ano)
+
+        with self._lock:
+            if self.tamanho_maximo != 0 and geracao == self._geracao:
+                self._tabelas[ano] = tabela
+                self._reduzir()
+        return tabela
+
+    def _reduzir(self):
+        if self.tamanho_maximo is None:
+            return
+        while len(self._tabelas) > self.tamanho_maximo:
+            self._tabelas.popitem(last=False)
+
+    def configurar(self, tamanho_maximo):
+        with self._lock:
+            self.tamanho_maximo = tamanho_maximo
+            self._reduzir()
+
+    def invalidar(self):
+        """Descarta as tabelas (os dados de origem mudaram), sem zerar as estatísticas."""
+        with self._lock:
+            self._tabelas.clear()
+            self._geracao += 1
+
+    def limpar(self, ano=None):
+        with self._lock:
+            self._geracao += 1
+            if ano is None:
+                self._tabelas.clear()
+                self.acertos = 0
+                self.falhas = 0
+            else:
+                self._tabelas.pop(ano, None)
+
+    def __len__(self):
+        return len(self._tabelas)
+
+    def estatisticas(self):
+        with self._lock:
+            consultas = self.acertos + self.falhas
+            return {
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+                'tamanho': len(self._tabelas),
+                'tamanho_maximo': self.tamanho_maximo
+            }
@@ -0,0 +1,47 @@
+"""
+Carregamento sob demanda de dependências opcionais.
+
+Importar o NumPy custa dezenas de milissegundos; por isso ele só é
+importado na primeira função que realmente precisa dele, e não ao importar
+``brasil_utils``.
+"""
+
+_numpy = None
+_numpy_verificado = False
+
+
+def carregar_numpy():
+    """
+    Importa o NumPy na primeira chamada.
+
+    Returns:
+        module: O módulo ``numpy`` ou None se não estiver instalado
+    """
+    global _numpy, _numpy_verificado
+    if not _numpy_verificado:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+        _numpy_verificado = True
+    return _numpy
+
+
+def exigir_numpy(mensagem):
+    """
+    Importa o NumPy, que é obrigatório para quem chama.
+
+    Args:
+        mensagem (str): Texto do erro, indicando o que requer o NumPy
+
+    Returns:
+        module: O módulo ``numpy``
+
+    Raises:
+        ImportError: Se o NumPy não estiver instalado
+    """
+    numpy = carregar_numpy()
+    if numpy is None:
+        raise ImportError(f"{mensagem} Instale com: pip install numpy")
+    return numpy
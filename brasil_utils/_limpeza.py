@@ -0,0 +1,59 @@
+"""
+Funções e tabelas internas para limpar documentos (CPF, CNPJ, CEP).
+
+Ficam aqui para que validadores, cep e tipos as compartilhem sem importar
+uns aos outros. As tabelas são usadas com ``bytes.translate``, que remove e
+converte os caracteres numa única passada, sem converter os bytes em str.
+"""
+
+import re
+
+# Remove tudo que não é dígito ASCII
+NAO_DIGITO_BYTES = bytes(range(256)).translate(None, b'0123456789')
+
+# Remove tudo que não é dígito ou letra ASCII
+NAO_ALFANUMERICO_BYTES = bytes(range(256)).translate(
+    None, b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+)
+
+# Converte letras ASCII em maiúsculas
+MAIUSCULAS_BYTES = bytes.maketrans(
+    b'abcdefghijklmnopqrstuvwxyz', b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+)
+
+
+# Caracteres que não fazem parte de um CNPJ (numérico ou alfanumérico)
+_NAO_ALFANUMERICO = re.compile(r'[^\dA-Za-z]')
+
+
+def limpar_documento(documento):
+    """
+    Remove caracteres especiais de um documento.
+    
+    Args:
+        documento (str): Documento a ser limpo
+        
+    Returns:
+        str: Documento apenas com números
+    """
+    return re.sub(r'\D', '', str(documento))
+
+
+def limpar_cnpj(cnpj):
+    """
+    Remove a formatação de um CNPJ numérico ou alfanumérico.
+
+    As letras só são mantidas quando, sem a pontuação, sobram exatamente 14
+    caracteres (formato alfanumérico); caso contrário ficam apenas os
+    números, como em ``limpar_documento`` (ex.: "CNPJ: 11.222.333/0001-81").
+
+    Args:
+        cnpj (str): CNPJ a ser limpo
+
+    Returns:
+        str: CNPJ apenas com números e letras maiúsculas
+    """
+    limpo = _NAO_ALFANUMERICO.sub('', str(cnpj))
+    if len(limpo) != 14:
+        return limpar_documento(limpo)
+    return limpo.upper()
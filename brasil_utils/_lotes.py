@@ -0,0 +1,70 @@
+"""
+Utilitários internos para processar dados em lotes, opcionalmente em
+paralelo com um pool de processos.
+"""
+
+from collections import deque
+from itertools import islice
+
+
+def agrupar(iteravel, tamanho):
+    """
+    Divide um iterável em listas de até ``tamanho`` itens, sob demanda.
+
+    Args:
+        iteravel (iterable): Itens de entrada
+        tamanho (int): Tamanho máximo de cada lote
+
+    Yields:
+        list: Próximo lote
+    """
+    if tamanho < 1:
+        raise ValueError("O tamanho do lote deve ser positivo")
+
+    iterador = iter(iteravel)
+    while True:
+        lote = list(islice(iterador, tamanho))
+        if not lote:
+            return
+        yield lote
+
+
+def mapear_lotes(funcao, lotes, processos=None):
+    """
+    Aplica ``funcao`` a cada lote preservando a ordem de entrada.
+
+    Com mais de um processo, os lotes são distribuídos num
+    ``ProcessPoolExecutor``; apenas ``2 * processos`` lotes ficam pendentes
+    por vez, de modo que o uso de memória continua limitado mesmo para
+    entradas muito grandes.
+
+    Args:
+        funcao (callable): Função aplicada a cada lote (deve ser importável
+            pelos processos filhos)
+        lotes (iterable): Lotes de entrada
+        processos (int): Quantidade de processos (None ou 1 para executar
+            no processo atual)
+
+    Yields:
+        Resultado de ``funcao`` para cada lote, na ordem de entrada
+    """
+    if not processos or processos <= 1:
+        for lote in lotes:
+            yield funcao(lote)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    limite = 2 * processos
+    pendentes = deque()
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        try:
+            for lote in lotes:
+                pendentes.append(executor.submit(funcao, lote))
+                if len(pendentes) >= limite:
+                    yield pendentes.popleft().result()
+            while pendentes:
+                yield pendentes.popleft().result()
+        finally:
+            for futuro in pendentes:
+                futuro.cancel()
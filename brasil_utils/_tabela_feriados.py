@@ -0,0 +1,22 @@
+"""
+Tabela pré-calculada da Páscoa de 1900 a 2200.
+
+Todos os feriados nacionais de um ano são fixos ou definidos a partir da
+Páscoa, de modo que um byte por ano basta para obter qualquer data da
+tabela sem cálculo. O byte de cada ano é ``ord('0')`` mais o número de dias
+entre 22 de março e a Páscoa (0 a 34). Anos fora do intervalo são
+calculados por ``feriados.calcular_pascoa``.
+"""
+
+ANO_INICIAL = 1900
+ANO_FINAL = 2200
+
+PASCOA = (
+    b'H@8E<PH9LD5I@1E=PA9M=5I:ME=JA9M>5I:NE6JB2F>RB:N?6J'  # 1900-1949
+    b'B3F>KC:N?7J;OG7KC4G?7D;OG8KC4H?LD<O@8L<4H9LD<I@8E='  # 1950-1999
+    b'PH9MD5IA1E=QA9M>5I:NE=JB9M>6I:NF6JB3F>RC:N?7JB3G>K'  # 2000-2049
+    b'C;N?7K;OG8KC4H?7D<OG8LC4H@LD<P@8L=4H9MD<IA8E=QH9ME'  # 2050-2099
+    b'6JB3F>KC:N?7J;OG7KC4G?7D;OG8KC4H?LD<O@8L<4H9LD<I@8'  # 2100-2149
+    b'E=PH9MD5IA1E=QA9M>5I:NE=JB9M>6I:NF6JB3F>RC:N?7JB3G'  # 2150-2199
+    b'?'  # 2200-2200
+)
@@ -2,8 +2,17 @@
 Módulo para consulta de CEP via API do ViaCEP.
 """
 
-import requests
 import re
+import threading
+import time
+
+from ._limpeza import NAO_DIGITO_BYTES
+from .metricas import incrementar, instrumentar, registrar_chamada
+from .tipos import CAMPOS_ENDERECO, Endereco, ErroCep, resultado_cep
+
+
+# Endereço da API do ViaCEP; {cep} é substituído pelo CEP com 8 dígitos
+URL_VIACEP = "https://viacep.com.br/ws/{cep}/json/"
 
 
 def limpar_cep(cep):
@@ -33,50 +42,268 @@ def validar_cep(cep):
     return len(cep_limpo) == 8 and cep_limpo.isdigit()
 
 
-def buscar_cep(cep):
+def validar_cep_bytes(cep):
     """
-    Busca informações de endereço através do CEP usando a API do ViaCEP.
-    
+    Valida o formato de um CEP em bytes ASCII, sem convertê-lo em str.
+
     Args:
-        cep (str): CEP a ser consultado
-        
+        cep (bytes, bytearray ou memoryview): CEP com ou sem formatação
+
     Returns:
-        dict: Dicionário com informações do endereço ou None se não encontrado
+        bool: True se o CEP tiver 8 dígitos
     """
-    if not validar_cep(cep):
-        return {"erro": "CEP inválido"}
-    
-    cep_limpo = limpar_cep(cep)
-    
+    return len(bytes(cep).translate(None, NAO_DIGITO_BYTES)) == 8
+
+
+def interpretar_resposta(dados):
+    """
+    Converte a resposta JSON do ViaCEP (ou de uma API com os mesmos campos)
+    em ``Endereco`` ou ``ErroCep``.
+
+    Args:
+        dados (dict): Resposta decodificada da API
+
+    Returns:
+        Endereco ou ErroCep: Endereço ou erro "CEP não encontrado"
+    """
+    if "erro" in dados:
+        return ErroCep("nao_encontrado", "CEP não encontrado")
+
+    return Endereco._make([dados.get(campo, "") for campo in CAMPOS_ENDERECO])
+
+
+def normalizar_resposta(dados):
+    """
+    Converte a resposta JSON do ViaCEP no formato retornado por buscar_cep.
+
+    Args:
+        dados (dict): Resposta decodificada da API
+
+    Returns:
+        dict: Dicionário com informações do endereço ou com a chave "erro"
+    """
+    return interpretar_resposta(dados).como_dict()
+
+
+def _consultar_viacep(cep_limpo):
+    # Importado na primeira consulta: o requests é pesado e desnecessário
+    # para quem só valida ou formata CEPs
+    import requests
+
     try:
-        url = f"https://viacep.com.br/ws/{cep_limpo}/json/"
+        url = URL_VIACEP.format(cep=cep_limpo)
         response = requests.get(url, timeout=10)
         response.raise_for_status()
         
-        dados = response.json()
-        
-        if "erro" in dados:
-            return {"erro": "CEP não encontrado"}
-        
-        return {
-            "cep": dados.get("cep", ""),
-            "logradouro": dados.get("logradouro", ""),
-            "complemento": dados.get("complemento", ""),
-            "bairro": dados.get("bairro", ""),
-            "localidade": dados.get("localidade", ""),
-            "uf": dados.get("uf", ""),
-            "ibge": dados.get("ibge", ""),
-            "gia": dados.get("gia", ""),
-            "ddd": dados.get("ddd", ""),
-            "siafi": dados.get("siafi", "")
-        }
+        return interpretar_resposta(response.json())
         
     except requests.exceptions.RequestException as e:
-        return {"erro": f"Erro na consulta: {str(e)}"}
+        return ErroCep("erro_consulta", f"Erro na consulta: {str(e)}")
     except Exception as e:
-        return {"erro": f"Erro inesperado: {str(e)}"}
+        return ErroCep("erro_inesperado", f"Erro inesperado: {str(e)}")
+
+
+def classificar_resposta_cep(resposta):
+    """
+    Resume um resultado de consulta de CEP no rótulo usado pelas métricas.
+
+    Args:
+        resposta (dict, Endereco ou ErroCep): Retorno de buscar_cep ou de
+            um backend
+
+    Returns:
+        str: "ok", "cep_invalido", "nao_encontrado", "offline",
+        "erro_consulta", "erro_inesperado" ou "erro"
+    """
+    if isinstance(resposta, Endereco):
+        return "ok"
+    if isinstance(resposta, ErroCep):
+        return resposta.motivo
+    erro = resposta.get("erro")
+    if erro is None:
+        return "ok"
+    return ErroCep.de_mensagem(erro).motivo
+
+
+class _Voo:
+    __slots__ = ("concluido", "resultado", "erro")
+
+    def __init__(self):
+        self.concluido = threading.Event()
+        self.resultado = None
+        self.erro = None
+
+
+class _ConsultasEmAndamento:
+    """
+    Agrupa consultas simultâneas à mesma chave ("single-flight"): apenas a
+    primeira executa; as demais esperam e recebem o mesmo resultado (ou a
+    mesma exceção).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._voos = {}
+        self.coalescidas = 0
+
+    def executar(self, chave, funcao):
+        with self._lock:
+            voo = self._voos.get(chave)
+            if voo is None:
+                voo = self._voos[chave] = _Voo()
+                lider = True
+            else:
+                self.coalescidas += 1
+                lider = False
+
+        if not lider:
+            incrementar("consultas_cep_coalescidas")
+            voo.concluido.wait()
+            if voo.erro is not None:
+                raise voo.erro
+            # Endereco é imutável: todos recebem o mesmo objeto
+            return voo.resultado
+
+        try:
+            voo.resultado = funcao()
+        except BaseException as erro:
+            voo.erro = erro
+            raise
+        finally:
+            with self._lock:
+                del self._voos[chave]
+            voo.concluido.set()
+        return voo.resultado
+
+
+_em_andamento = _ConsultasEmAndamento()
+
+
+# Cache e backend usados por buscar_cep quando nenhum é informado na chamada
+_cache_padrao = None
+_backend_padrao = None
+
+
+def definir_cache_cep(cache):
+    """
+    Define o cache usado por padrão em buscar_cep.
+
+    Args:
+        cache: Instância de ``CacheCep`` (ou compatível), ou None para
+            desativar o cache padrão
+    """
+    global _cache_padrao
+    _cache_padrao = cache
+
+
+def definir_backend_cep(backend):
+    """
+    Define a fonte de dados usada por padrão em buscar_cep.
+
+    Args:
+        backend: Objeto com o método ``consultar(cep_limpo)`` que retorna
+            ``Endereco`` ou ``ErroCep`` (ex.: ``BaseCepLocal``), ou None para
+            voltar a usar a API do ViaCEP. Backends que retornam um
+            dicionário no formato de buscar_cep também são aceitos.
+    """
+    global _backend_padrao
+    _backend_padrao = backend
+
+
+@instrumentar(classificar=classificar_resposta_cep)
+def buscar_cep(cep, cache=None, offline=False, backend=None):
+    """
+    Busca informações de endereço através do CEP usando a API do ViaCEP.
+
+    Chamadas simultâneas (em threads diferentes) para o mesmo CEP, com o mesmo
+    cache e a mesma fonte de dados, compartilham uma única consulta.
+
+    Mantida por compatibilidade: é ``buscar_endereco`` convertido em
+    dicionário.
+    
+    Args:
+        cep (str): CEP a ser consultado
+        cache: Cache a ser consultado antes da API (padrão: o definido em
+            ``definir_cache_cep``, se houver)
+        offline (bool): Se True, responde apenas a partir do cache
+        backend: Fonte de dados a ser usada no lugar do ViaCEP (padrão: a
+            definida em ``definir_backend_cep``, se houver)
+        
+    Returns:
+        dict: Dicionário com informações do endereço ou com a chave "erro"
+    """
+    return _buscar(cep, cache, offline, backend).como_dict()
+
+
+@instrumentar()
+def buscar_endereco(cep, cache=None, offline=False, backend=None):
+    """
+    Busca o endereço de um CEP.
+
+    Args:
+        cep (str): CEP a ser consultado
+        cache, offline, backend: Como em buscar_cep
+
+    Returns:
+        Endereco: Endereço encontrado
+
+    Raises:
+        ErroCep: Se o CEP for inválido, não for encontrado ou a consulta
+            falhar (o motivo fica em ``ErroCep.motivo``)
+    """
+    resultado = _buscar(cep, cache, offline, backend)
+    if isinstance(resultado, ErroCep):
+        # Novo objeto: o resultado pode estar em cache ou com outras threads
+        raise ErroCep(resultado.motivo, resultado.mensagem)
+    return resultado
+
+
+def _buscar(cep, cache, offline, backend):
+    """Consulta um CEP; retorna ``Endereco`` ou ``ErroCep`` (sem levantar)."""
+    # Mesma regra de validar_cep, limpando o CEP uma única vez
+    cep_limpo = limpar_cep(cep)
+    if len(cep_limpo) != 8:
+        return ErroCep("cep_invalido", "CEP inválido")
+
+    if cache is None:
+        cache = _cache_padrao
+
+    if cache is not None:
+        resultado = cache.obter(cep_limpo)
+        if resultado is not None:
+            return resultado_cep(resultado)
+
+    if offline:
+        return ErroCep("offline", "CEP não disponível no cache (modo offline)")
+
+    if backend is None:
+        backend = _backend_padrao
+
+    return _em_andamento.executar(
+        (id(backend), id(cache), cep_limpo), lambda: _consultar(cep_limpo, cache, backend)
+    )
+
+
+def _consultar(cep_limpo, cache, backend):
+    inicio = time.perf_counter()
+    if backend is None:
+        resultado = _consultar_viacep(cep_limpo)
+    else:
+        resultado = backend.consultar(cep_limpo)
+    duracao = time.perf_counter() - inicio
+    resultado = resultado_cep(resultado)
+
+    # Apenas as consultas que chegaram à API (ou ao backend), sem o cache
+    registrar_chamada("consulta_cep", classificar_resposta_cep(resultado), duracao)
+
+    if cache is not None:
+        cache.registrar_consulta(duracao)
+        cache.armazenar(cep_limpo, resultado)
+
+    return resultado
 
 
+@instrumentar()
 def formatar_cep(cep):
     """
     Formata um CEP com hífen.
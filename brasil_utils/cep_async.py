@@ -0,0 +1,325 @@
+"""
+Módulo para consulta assíncrona de CEP em grande volume.
+
+Usa apenas a biblioteca padrão (asyncio): mantém um pool de conexões
+HTTP/1.1 keep-alive, limita o número de requisições simultâneas, repete
+consultas que falharam com espera exponencial e entrega os resultados à
+medida que ficam prontos. Consultas simultâneas ao mesmo CEP compartilham
+uma única requisição.
+"""
+
+import asyncio
+import json
+import ssl
+from urllib.parse import urlsplit
+
+from .cep import URL_VIACEP, validar_cep, limpar_cep, normalizar_resposta
+from .metricas import incrementar
+
+
+# Respostas HTTP que valem uma nova tentativa
+STATUS_REPETIR = frozenset({429, 500, 502, 503, 504})
+
+
+class _RespostaHTTP:
+    __slots__ = ("status", "corpo", "reutilizavel")
+
+    def __init__(self, status, corpo, reutilizavel):
+        self.status = status
+        self.corpo = corpo
+        self.reutilizavel = reutilizavel
+
+
+async def _ler_cabecalho(leitor):
+    linha_status = await leitor.readline()
+    if not linha_status:
+        raise ConnectionError("Conexão encerrada pelo servidor")
+
+    partes = linha_status.decode("latin-1").split(None, 2)
+    if len(partes) < 2 or not partes[0].startswith("HTTP/"):
+        raise ConnectionError(f"Resposta HTTP inválida: {linha_status!r}")
+
+    cabecalhos = {}
+    while True:
+        linha = await leitor.readline()
+        if linha in (b"\r\n", b"\n", b""):
+            break
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        cabecalhos[nome.strip().lower()] = valor.strip()
+    return partes[0], int(partes[1]), cabecalhos
+
+
+async def _ler_resposta(leitor):
+    versao, status, cabecalhos = await _ler_cabecalho(leitor)
+    # Respostas informativas (1xx) precedem a resposta final
+    while 100 <= status < 200:
+        versao, status, cabecalhos = await _ler_cabecalho(leitor)
+
+    conexao = cabecalhos.get("connection", "").lower()
+    reutilizavel = conexao != "close" and (versao != "HTTP/1.0" or conexao == "keep-alive")
+
+    if status in (204, 304):
+        # Sem corpo, mesmo sem Content-Length: ler até o fim bloquearia a
+        # conexão keep-alive até o timeout
+        corpo = b""
+    elif "chunked" in cabecalhos.get("transfer-encoding", "").lower():
+        pedacos = []
+        while True:
+            tamanho = int((await leitor.readline()).split(b";")[0], 16)
+            if tamanho == 0:
+                # Descarta trailers até a linha em branco
+                while (await leitor.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                break
+            pedacos.append(await leitor.readexactly(tamanho))
+            await leitor.readline()
+        corpo = b"".join(pedacos)
+    elif "content-length" in cabecalhos:
+        corpo = await leitor.readexactly(int(cabecalhos["content-length"]))
+    else:
+        corpo = await leitor.read()
+        reutilizavel = False
+
+    return _RespostaHTTP(status, corpo, reutilizavel)
+
+
+class _VooAsync:
+    __slots__ = ("tarefa", "aguardando")
+
+    def __init__(self, tarefa):
+        self.tarefa = tarefa
+        self.aguardando = 0
+
+
+class AsyncCepClient:
+    """
+    Cliente assíncrono para consulta de CEP com pool de conexões.
+
+    Args:
+        url (str): Modelo de URL com ``{cep}`` (padrão: API do ViaCEP)
+        limite_conexoes (int): Máximo de requisições simultâneas
+        timeout (float): Tempo máximo de cada tentativa, em segundos
+        tentativas (int): Número máximo de tentativas por CEP
+        espera_inicial (float): Espera antes da segunda tentativa, dobrada a
+            cada nova falha
+    """
+
+    def __init__(self, url=URL_VIACEP, limite_conexoes=10, timeout=10,
+                 tentativas=3, espera_inicial=0.5):
+        partes = urlsplit(url.replace("{cep}", "00000000"))
+        if partes.scheme not in ("http", "https"):
+            raise ValueError(f"Esquema de URL não suportado: {partes.scheme}")
+
+        self.url = url
+        self.limite_conexoes = limite_conexoes
+        self.timeout = timeout
+        self.tentativas = tentativas
+        self.espera_inicial = espera_inicial
+
+        self._host = partes.hostname
+        self._porta = partes.port or (443 if partes.scheme == "https" else 80)
+        self._ssl = ssl.create_default_context() if partes.scheme == "https" else None
+        self._cabecalho_host = partes.netloc
+        inicio_caminho = url.find("/", url.find("//") + 2)
+        self._modelo_caminho = url[inicio_caminho:] if inicio_caminho >= 0 else "/"
+
+        self._ociosas = []
+        self._semaforo = None
+        self._em_andamento = {}
+        # Conexões abertas no momento (ociosas ou em uso)
+        self.conexoes_abertas = 0
+        self.coalescidas = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.fechar()
+
+    async def fechar(self):
+        """Fecha todas as conexões ociosas do pool."""
+        ociosas, self._ociosas = self._ociosas, []
+        for _, escritor in ociosas:
+            self._descartar(escritor)
+        for _, escritor in ociosas:
+            try:
+                await escritor.wait_closed()
+            except (OSError, ConnectionError):
+                pass
+
+    def _obter_semaforo(self):
+        # Criado sob demanda para ficar associado ao loop em execução
+        if self._semaforo is None:
+            self._semaforo = asyncio.Semaphore(self.limite_conexoes)
+        return self._semaforo
+
+    async def _requisitar(self, caminho):
+        requisicao = (
+            f"GET {caminho} HTTP/1.1\r\n"
+            f"Host: {self._cabecalho_host}\r\n"
+            "Accept: application/json\r\n"
+            "Connection: keep-alive\r\n"
+            "User-Agent: brasil-utils\r\n"
+            "\r\n"
+        ).encode("ascii")
+
+        async with self._obter_semaforo():
+            if self._ociosas:
+                try:
+                    return await self._enviar(self._ociosas.pop(), requisicao)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # Conexão keep-alive encerrada pelo servidor: tenta numa nova
+                    pass
+
+            conexao = await asyncio.open_connection(self._host, self._porta, ssl=self._ssl)
+            self.conexoes_abertas += 1
+            return await self._enviar(conexao, requisicao)
+
+    def _descartar(self, escritor):
+        escritor.close()
+        self.conexoes_abertas -= 1
+
+    async def _enviar(self, conexao, requisicao):
+        leitor, escritor = conexao
+        try:
+            escritor.write(requisicao)
+            await escritor.drain()
+            resposta = await _ler_resposta(leitor)
+        except BaseException:
+            self._descartar(escritor)
+            raise
+
+        if resposta.reutilizavel:
+            self._ociosas.append(conexao)
+        else:
+            self._descartar(escritor)
+        return resposta
+
+    async def buscar(self, cep):
+        """
+        Busca informações de endereço através do CEP.
+
+        Se o mesmo CEP já estiver sendo consultado, aguarda a consulta em
+        andamento em vez de abrir outra requisição (contadas em
+        ``coalescidas``).
+
+        Args:
+            cep (str): CEP a ser consultado
+
+        Returns:
+            dict: Mesmo formato retornado por ``buscar_cep``
+        """
+        if not validar_cep(cep):
+            return {"erro": "CEP inválido"}
+
+        cep_limpo = limpar_cep(cep)
+        voo = self._em_andamento.get(cep_limpo)
+        # Uma consulta abandonada por todos (cancelada) não é reaproveitada
+        lider = voo is None or voo.tarefa.cancelled()
+        if lider:
+            voo = self._em_andamento[cep_limpo] = _VooAsync(
+                asyncio.ensure_future(self._consultar(cep_limpo))
+            )
+            voo.tarefa.add_done_callback(lambda _: self._em_andamento.pop(cep_limpo, None))
+        else:
+            self.coalescidas += 1
+            incrementar("consultas_cep_async_coalescidas")
+
+        voo.aguardando += 1
+        try:
+            # shield: o cancelamento de quem espera não interrompe a consulta
+            # compartilhada com os demais
+            resultado = await asyncio.shield(voo.tarefa)
+        finally:
+            voo.aguardando -= 1
+            if not voo.aguardando and not voo.tarefa.done():
+                voo.tarefa.cancel()
+        return resultado if lider else dict(resultado)
+
+    async def _consultar(self, cep_limpo):
+        caminho = self._modelo_caminho.format(cep=cep_limpo)
+        erro = None
+
+        for tentativa in range(self.tentativas):
+            if tentativa:
+                await asyncio.sleep(self.espera_inicial * 2 ** (tentativa - 1))
+            try:
+                resposta = await asyncio.wait_for(self._requisitar(caminho), self.timeout)
+            except asyncio.TimeoutError:
+                erro = f"Tempo esgotado após {self.timeout}s"
+                continue
+            except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+                erro = str(e) or e.__class__.__name__
+                continue
+
+            if resposta.status in STATUS_REPETIR:
+                erro = f"HTTP {resposta.status}"
+                continue
+            if resposta.status >= 400:
+                return {"erro": f"Erro na consulta: HTTP {resposta.status}"}
+
+            try:
+                return normalizar_resposta(json.loads(resposta.corpo))
+            except ValueError as e:
+                return {"erro": f"Erro inesperado: {str(e)}"}
+
+        return {"erro": f"Erro na consulta: {erro}"}
+
+    async def buscar_varios(self, ceps):
+        """
+        Busca vários CEPs, entregando cada resultado assim que fica pronto.
+
+        Apenas um número limitado de consultas fica pendente por vez, de modo
+        que listas muito grandes não são carregadas todas em tarefas.
+
+        Args:
+            ceps (iterable): CEPs a serem consultados
+
+        Yields:
+            tuple: (cep, resultado) na ordem em que as consultas terminam
+        """
+        ceps = iter(ceps)
+        fim = object()
+        pendentes = {}
+        maximo_pendentes = self.limite_conexoes * 2
+
+        async def consultar(cep):
+            return cep, await self.buscar(cep)
+
+        try:
+            while True:
+                while len(pendentes) < maximo_pendentes:
+                    cep = next(ceps, fim)
+                    if cep is fim:
+                        break
+                    tarefa = asyncio.ensure_future(consultar(cep))
+                    pendentes[tarefa] = cep
+
+                if not pendentes:
+                    break
+
+                prontas, _ = await asyncio.wait(
+                    pendentes, return_when=asyncio.FIRST_COMPLETED
+                )
+                for tarefa in prontas:
+                    del pendentes[tarefa]
+                    yield tarefa.result()
+        finally:
+            for tarefa in pendentes:
+                tarefa.cancel()
+
+
+async def buscar_ceps_async(ceps, **opcoes):
+    """
+    Busca vários CEPs de forma assíncrona com um cliente temporário.
+
+    Args:
+        ceps (iterable): CEPs a serem consultados
+        **opcoes: Opções repassadas para ``AsyncCepClient``
+
+    Yields:
+        tuple: (cep, resultado) na ordem em que as consultas terminam
+    """
+    async with AsyncCepClient(**opcoes) as cliente:
+        async for item in cliente.buscar_varios(ceps):
+            yield item
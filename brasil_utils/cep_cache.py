@@ -0,0 +1,235 @@
+"""
+Módulo de cache para consultas de CEP.
+
+Combina um cache LRU em memória com um armazenamento persistente opcional
+em SQLite. Cada entrada tem validade (TTL) própria e respostas
+"CEP não encontrado" também são guardadas (cache negativo), com validade
+menor. Erros de rede nunca são guardados.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from .tipos import Endereco, resultado_cep
+
+
+# Validade padrão de um endereço encontrado (30 dias)
+TTL_PADRAO = 30 * 24 * 60 * 60
+
+# Validade padrão de uma resposta "CEP não encontrado" (1 dia)
+TTL_NEGATIVO_PADRAO = 24 * 60 * 60
+
+
+class CacheCep:
+    """
+    Cache de resultados de ``buscar_cep`` em memória e, opcionalmente, em disco.
+
+    Os resultados ficam em memória como ``Endereco``/``ErroCep`` (imutáveis,
+    entregues sem cópia) e no disco como JSON no formato de ``buscar_cep``.
+    Qualquer objeto com os métodos ``obter``, ``armazenar`` e
+    ``registrar_consulta`` pode ser usado no lugar desta classe; ``obter``
+    também pode retornar dicionários.
+
+    Args:
+        caminho (str): Arquivo SQLite para persistência (None para usar
+            apenas a memória)
+        tamanho_memoria (int): Quantidade máxima de CEPs mantidos em memória
+        ttl (float): Validade de um endereço encontrado, em segundos
+        ttl_negativo (float): Validade de uma resposta "CEP não encontrado",
+            em segundos
+    """
+
+    def __init__(self, caminho=None, tamanho_memoria=1024, ttl=TTL_PADRAO,
+                 ttl_negativo=TTL_NEGATIVO_PADRAO):
+        self.caminho = caminho
+        self.tamanho_memoria = tamanho_memoria
+        self.ttl = ttl
+        self.ttl_negativo = ttl_negativo
+
+        self._lock = threading.Lock()
+        self._memoria = OrderedDict()
+        self._conexao = None
+        if caminho is not None:
+            self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+            self._conexao.execute(
+                "CREATE TABLE IF NOT EXISTS ceps ("
+                "cep TEXT PRIMARY KEY, dados TEXT NOT NULL, expira REAL NOT NULL)"
+            )
+            self._conexao.commit()
+
+        self._zerar_estatisticas()
+
+    def _zerar_estatisticas(self):
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.falhas = 0
+        self.expirados = 0
+        self.consultas_rede = 0
+        self._tempo_rede = 0.0
+        self._tempo_rede_max = 0.0
+        self._tempo_cache = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def obter(self, cep):
+        """
+        Busca um CEP no cache.
+
+        Args:
+            cep (str): CEP com 8 dígitos
+
+        Returns:
+            Endereco ou ErroCep: Resultado guardado ou None se ausente ou
+            expirado
+        """
+        inicio = time.perf_counter()
+        agora = time.time()
+
+        with self._lock:
+            try:
+                expirado = False
+                entrada = self._memoria.get(cep)
+                if entrada is not None:
+                    resultado, expira = entrada
+                    if expira > agora:
+                        self._memoria.move_to_end(cep)
+                        self.acertos_memoria += 1
+                        return resultado
+                    del self._memoria[cep]
+                    expirado = True
+
+                if self._conexao is not None:
+                    linha = self._conexao.execute(
+                        "SELECT dados, expira FROM ceps WHERE cep = ?", (cep,)
+                    ).fetchone()
+                    if linha is not None:
+                        if linha[1] > agora:
+                            resultado = resultado_cep(json.loads(linha[0]))
+                            self._guardar_memoria(cep, resultado, linha[1])
+                            self.acertos_disco += 1
+                            return resultado
+                        expirado = True
+
+                if expirado:
+                    self.expirados += 1
+                self.falhas += 1
+                return None
+            finally:
+                self._tempo_cache += time.perf_counter() - inicio
+
+    def _guardar_memoria(self, cep, resultado, expira):
+        if self.tamanho_memoria == 0:
+            return
+        self._memoria[cep] = (resultado, expira)
+        self._memoria.move_to_end(cep)
+        while len(self._memoria) > self.tamanho_memoria:
+            self._memoria.popitem(last=False)
+
+    def armazenar(self, cep, resultado):
+        """
+        Guarda o resultado de uma consulta.
+
+        Endereços encontrados usam ``ttl`` e respostas "CEP não encontrado"
+        usam ``ttl_negativo``; outros erros não são guardados.
+
+        Args:
+            cep (str): CEP com 8 dígitos
+            resultado (Endereco, ErroCep ou dict): Resultado da consulta
+        """
+        resultado = resultado_cep(resultado)
+        if isinstance(resultado, Endereco):
+            ttl = self.ttl
+        elif resultado.motivo == "nao_encontrado":
+            ttl = self.ttl_negativo
+        else:
+            return
+
+        expira = time.time() + ttl
+        with self._lock:
+            self._guardar_memoria(cep, resultado, expira)
+            if self._conexao is not None:
+                self._conexao.execute(
+                    "INSERT OR REPLACE INTO ceps (cep, dados, expira) VALUES (?, ?, ?)",
+                    (cep, json.dumps(resultado.como_dict(), ensure_ascii=False), expira)
+                )
+                self._conexao.commit()
+
+    def registrar_consulta(self, segundos):
+        """
+        Registra a latência de uma consulta feita à rede por falta no cache.
+
+        Args:
+            segundos (float): Duração da consulta
+        """
+        with self._lock:
+            self.consultas_rede += 1
+            self._tempo_rede += segundos
+            if segundos > self._tempo_rede_max:
+                self._tempo_rede_max = segundos
+
+    def limpar(self, remover_expirados_apenas=False):
+        """
+        Remove entradas do cache.
+
+        Args:
+            remover_expirados_apenas (bool): Se True, remove apenas as
+                entradas vencidas; caso contrário, esvazia o cache
+        """
+        agora = time.time()
+        with self._lock:
+            if remover_expirados_apenas:
+                for cep in [c for c, (_, expira) in self._memoria.items() if expira <= agora]:
+                    del self._memoria[cep]
+                if self._conexao is not None:
+                    self._conexao.execute("DELETE FROM ceps WHERE expira <= ?", (agora,))
+            else:
+                self._memoria.clear()
+                if self._conexao is not None:
+                    self._conexao.execute("DELETE FROM ceps")
+            if self._conexao is not None:
+                self._conexao.commit()
+
+    def estatisticas(self):
+        """
+        Retorna as métricas de uso do cache.
+
+        Returns:
+            dict: Acertos (memória e disco), falhas, taxa de acerto, consultas
+            à rede e latências médias/máximas em milissegundos
+        """
+        with self._lock:
+            acertos = self.acertos_memoria + self.acertos_disco
+            buscas = acertos + self.falhas
+            return {
+                'acertos_memoria': self.acertos_memoria,
+                'acertos_disco': self.acertos_disco,
+                'falhas': self.falhas,
+                'expirados': self.expirados,
+                'taxa_acerto': acertos / buscas if buscas else 0.0,
+                'tamanho_memoria': len(self._memoria),
+                'consultas_rede': self.consultas_rede,
+                'latencia_cache_media_ms': 1000 * self._tempo_cache / buscas if buscas else 0.0,
+                'latencia_rede_media_ms': (
+                    1000 * self._tempo_rede / self.consultas_rede if self.consultas_rede else 0.0
+                ),
+                'latencia_rede_max_ms': 1000 * self._tempo_rede_max
+            }
+
+    def zerar_estatisticas(self):
+        """Zera as métricas sem remover as entradas do cache."""
+        with self._lock:
+            self._zerar_estatisticas()
+
+    def fechar(self):
+        """Fecha o arquivo SQLite, se houver."""
+        with self._lock:
+            if self._conexao is not None:
+                self._conexao.close()
+                self._conexao = None
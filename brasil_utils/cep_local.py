@@ -0,0 +1,245 @@
+"""
+Módulo para consulta de CEP em uma base local, sem acesso à rede.
+
+A base é construída a partir de um arquivo CSV ou JSON lines fornecido pelo
+usuário e gravada em um índice binário ordenado. Na consulta o índice é
+mapeado em memória (mmap): abrir a base não exige leitura nem conversão dos
+dados e cada busca é uma pesquisa binária sobre as chaves.
+
+Formato do índice (inteiros little-endian de 32 bits):
+
+- cabeçalho: ``b"BRCEPIDX"``, versão, quantidade N de CEPs
+- N chaves: os CEPs como inteiros, em ordem crescente
+- N + 1 posições: início de cada registro na área de dados
+- dados: campos de cada endereço em UTF-8, separados por ``\\x1f``
+"""
+
+import bisect
+import csv
+import json
+import mmap
+import struct
+import sys
+
+from .cep import CAMPOS_ENDERECO, limpar_cep, formatar_cep
+from .tipos import Endereco, ErroCep
+
+
+ASSINATURA = b"BRCEPIDX"
+VERSAO = 1
+
+_CABECALHO = struct.Struct("<8sII")
+_INTEIRO = struct.Struct("<I")
+_SEPARADOR = "\x1f"
+
+# O CEP do registro é derivado da chave; os demais campos são gravados
+_CAMPOS_GRAVADOS = CAMPOS_ENDERECO[1:]
+
+
+def _ler_registros(origem, formato):
+    with open(origem, encoding="utf-8", newline="") as arquivo:
+        if formato == "csv":
+            yield from csv.DictReader(arquivo)
+        else:
+            for linha in arquivo:
+                if linha.strip():
+                    yield json.loads(linha)
+
+
+def construir_indice_cep(origem, destino, formato=None):
+    """
+    Constrói o índice binário de CEPs a partir de um arquivo CSV ou JSONL.
+
+    Cada registro deve ter o campo ``cep``; os demais campos de endereço
+    (``logradouro``, ``bairro``, ``localidade``, ``uf``, ``ibge``...) são
+    opcionais. Registros com CEP inválido são ignorados e, em caso de CEP
+    repetido, vale o último.
+
+    Args:
+        origem (str): Arquivo de entrada
+        destino (str): Arquivo do índice a ser gerado
+        formato (str): "csv" ou "jsonl" (padrão: deduzido pela extensão)
+
+    Returns:
+        int: Quantidade de CEPs gravados
+    """
+    if formato is None:
+        formato = "csv" if str(origem).lower().endswith(".csv") else "jsonl"
+    if formato not in ("csv", "jsonl"):
+        raise ValueError(f"Formato não suportado: {formato}")
+
+    enderecos = {}
+    for registro in _ler_registros(origem, formato):
+        cep_limpo = limpar_cep(registro.get("cep", ""))
+        if len(cep_limpo) != 8:
+            continue
+        enderecos[int(cep_limpo)] = _SEPARADOR.join(
+            str(registro.get(campo) or "").replace(_SEPARADOR, " ")
+            for campo in _CAMPOS_GRAVADOS
+        ).encode("utf-8")
+
+    chaves = sorted(enderecos)
+    posicoes = [0]
+    for chave in chaves:
+        posicoes.append(posicoes[-1] + len(enderecos[chave]))
+
+    with open(destino, "wb") as arquivo:
+        arquivo.write(_CABECALHO.pack(ASSINATURA, VERSAO, len(chaves)))
+        arquivo.write(struct.pack(f"<{len(chaves)}I", *chaves))
+        arquivo.write(struct.pack(f"<{len(posicoes)}I", *posicoes))
+        for chave in chaves:
+            arquivo.write(enderecos[chave])
+
+    return len(chaves)
+
+
+class _Chaves:
+    """Sequência somente leitura das chaves, lidas direto do mmap."""
+
+    __slots__ = ("_mapa", "_inicio", "_quantidade")
+
+    def __init__(self, mapa, inicio, quantidade):
+        self._mapa = mapa
+        self._inicio = inicio
+        self._quantidade = quantidade
+
+    def __len__(self):
+        return self._quantidade
+
+    def __getitem__(self, indice):
+        return _INTEIRO.unpack_from(self._mapa, self._inicio + 4 * indice)[0]
+
+
+class BaseCepLocal:
+    """
+    Base local de CEPs mapeada em memória.
+
+    Pode ser usada diretamente ou como backend de ``buscar_cep``
+    (veja ``definir_backend_cep``).
+
+    Args:
+        caminho (str): Arquivo gerado por ``construir_indice_cep``
+    """
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._arquivo = open(caminho, "rb")
+        try:
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Arquivo vazio não pode ser mapeado
+            self._arquivo.close()
+            raise ValueError(f"Índice de CEP inválido: {caminho}")
+
+        if len(self._mapa) < _CABECALHO.size:
+            self.fechar()
+            raise ValueError(f"Índice de CEP inválido: {caminho}")
+        assinatura, versao, quantidade = _CABECALHO.unpack_from(self._mapa, 0)
+        if assinatura != ASSINATURA or versao != VERSAO:
+            self.fechar()
+            raise ValueError(f"Índice de CEP inválido ou de versão incompatível: {caminho}")
+
+        self._quantidade = quantidade
+        self._inicio_posicoes = _CABECALHO.size + 4 * quantidade
+        self._inicio_dados = self._inicio_posicoes + 4 * (quantidade + 1)
+
+        if sys.byteorder == "little":
+            # Sem cópia: as chaves são lidas como inteiros nativos
+            self._visao = memoryview(self._mapa)
+            self._chaves = self._visao[_CABECALHO.size:self._inicio_posicoes].cast("I")
+        else:
+            self._visao = None
+            self._chaves = _Chaves(self._mapa, _CABECALHO.size, quantidade)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def __len__(self):
+        return self._quantidade
+
+    def __contains__(self, cep):
+        return self._posicao(limpar_cep(cep)) is not None
+
+    def fechar(self):
+        """Libera o mapeamento e fecha o arquivo."""
+        if getattr(self, "_visao", None) is not None:
+            self._chaves.release()
+            self._visao.release()
+            self._visao = None
+        if getattr(self, "_mapa", None) is not None:
+            self._mapa.close()
+            self._mapa = None
+        self._arquivo.close()
+
+    def _posicao(self, cep_limpo):
+        if len(cep_limpo) != 8:
+            return None
+        chave = int(cep_limpo)
+        indice = bisect.bisect_left(self._chaves, chave)
+        if indice < self._quantidade and self._chaves[indice] == chave:
+            return indice
+        return None
+
+    def _endereco(self, indice):
+        inicio, fim = struct.unpack_from("<II", self._mapa, self._inicio_posicoes + 4 * indice)
+        valores = self._mapa[self._inicio_dados + inicio:self._inicio_dados + fim]
+        return Endereco(
+            formatar_cep(f"{self._chaves[indice]:08d}"), *valores.decode("utf-8").split(_SEPARADOR)
+        )
+
+    def _registro(self, indice):
+        return self._endereco(indice).como_dict()
+
+    def buscar(self, cep):
+        """
+        Busca um CEP na base local.
+
+        Args:
+            cep (str): CEP com ou sem formatação
+
+        Returns:
+            dict: Endereço no formato de ``buscar_cep`` ou None se ausente
+        """
+        indice = self._posicao(limpar_cep(cep))
+        if indice is None:
+            return None
+        return self._registro(indice)
+
+    def buscar_prefixo(self, prefixo):
+        """
+        Lista os endereços cujo CEP começa com o prefixo informado.
+
+        Args:
+            prefixo (str): De 1 a 8 dígitos iniciais do CEP (ex.: "01310")
+
+        Yields:
+            dict: Endereços em ordem crescente de CEP
+        """
+        prefixo = limpar_cep(prefixo)
+        if not prefixo or len(prefixo) > 8:
+            return
+
+        escala = 10 ** (8 - len(prefixo))
+        menor = int(prefixo) * escala
+        inicio = bisect.bisect_left(self._chaves, menor)
+        fim = bisect.bisect_left(self._chaves, menor + escala, inicio)
+        for indice in range(inicio, fim):
+            yield self._registro(indice)
+
+    def consultar(self, cep_limpo):
+        """
+        Interface de backend usada por ``buscar_cep``.
+
+        Args:
+            cep_limpo (str): CEP com 8 dígitos
+
+        Returns:
+            Endereco ou ErroCep: Endereço ou erro "CEP não encontrado"
+        """
+        indice = self._posicao(cep_limpo)
+        if indice is None:
+            return ErroCep("nao_encontrado", "CEP não encontrado")
+        return self._endereco(indice)
@@ -0,0 +1,492 @@
+"""
+Módulo para consulta de CEP em vários provedores, com failover.
+
+Cada provedor (ViaCEP, BrasilAPI, OpenCEP ou uma base local) responde com
+``Endereco`` ou ``ErroCep``. O ``ResolvedorCep`` consulta os provedores em
+ordem de preferência:
+
+- se um provedor falha (erro de rede, HTTP 5xx, resposta inválida), o
+  próximo é consultado;
+- se um provedor demora mais que ``atraso_hedge``, o próximo é consultado em
+  paralelo e vale a primeira resposta definitiva ("hedged requests");
+- cada provedor tem um disjuntor (``DisjuntorCircuito``): após várias falhas
+  seguidas ele deixa de ser consultado por um tempo.
+
+O resolvedor pode ser usado como backend de ``buscar_cep`` (veja
+``definir_backend_cep``), mantendo o cache e o agrupamento de consultas.
+"""
+
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from . import cep
+from .cep import (
+    URL_VIACEP, classificar_resposta_cep, formatar_cep, interpretar_resposta, limpar_cep,
+    validar_cep
+)
+from .cep_local import BaseCepLocal
+from .metricas import incrementar, registrar_chamada
+from .tipos import Endereco, ErroCep, LoteEnderecos, resultado_cep
+
+
+URL_BRASILAPI = "https://brasilapi.com.br/api/cep/v1/{cep}"
+URL_OPENCEP = "https://opencep.com/v1/{cep}"
+
+# Resultados (de classificar_resposta_cep) que encerram a busca; os demais
+# são falhas do provedor
+_DEFINITIVOS = frozenset({"ok", "nao_encontrado"})
+
+
+class ProvedorHttp:
+    """
+    Provedor de CEP acessado por HTTP (requer requests).
+
+    Args:
+        url (str): Modelo de URL com ``{cep}`` (CEP com 8 dígitos)
+        timeout (float): Tempo máximo de cada requisição, em segundos
+        nome (str): Nome do provedor (usado nos disjuntores e nas métricas)
+    """
+
+    nome = "http"
+
+    def __init__(self, url, timeout=5, nome=None):
+        self.url = url
+        self.timeout = timeout
+        if nome is not None:
+            self.nome = nome
+        self._sessao = None
+        self._lock = threading.Lock()
+
+    def _obter_sessao(self):
+        # Sessão com pool de conexões keep-alive, criada na primeira consulta;
+        # o lock evita sessões duplicadas com o resolvedor em várias threads
+        with self._lock:
+            if self._sessao is None:
+                import requests
+                self._sessao = requests.Session()
+            return self._sessao
+
+    def normalizar(self, dados):
+        """
+        Converte a resposta JSON do provedor em ``Endereco`` ou ``ErroCep``.
+
+        Args:
+            dados (dict): Resposta decodificada
+
+        Returns:
+            Endereco ou ErroCep: Resultado
+        """
+        return interpretar_resposta(dados)
+
+    def consultar(self, cep_limpo):
+        """
+        Interface de backend usada por ``buscar_cep``.
+
+        Args:
+            cep_limpo (str): CEP com 8 dígitos
+
+        Returns:
+            Endereco ou ErroCep: Resultado
+        """
+        import requests
+
+        try:
+            resposta = self._obter_sessao().get(
+                self.url.format(cep=cep_limpo), timeout=self.timeout,
+                headers={"Accept": "application/json"}
+            )
+            if resposta.status_code == 404:
+                return ErroCep("nao_encontrado", "CEP não encontrado")
+            resposta.raise_for_status()
+            return self.normalizar(resposta.json())
+        except requests.exceptions.RequestException as e:
+            return ErroCep("erro_consulta", f"Erro na consulta: {str(e)}")
+        except Exception as e:
+            return ErroCep("erro_inesperado", f"Erro inesperado: {str(e)}")
+
+    def fechar(self):
+        """Fecha as conexões abertas."""
+        with self._lock:
+            sessao, self._sessao = self._sessao, None
+        if sessao is not None:
+            sessao.close()
+
+
+class ProvedorViaCep(ProvedorHttp):
+    """Provedor ViaCEP (https://viacep.com.br)."""
+
+    nome = "viacep"
+
+    def __init__(self, url=URL_VIACEP, timeout=5, nome=None):
+        super().__init__(url, timeout, nome)
+
+
+class ProvedorBrasilApi(ProvedorHttp):
+    """Provedor BrasilAPI (https://brasilapi.com.br)."""
+
+    nome = "brasilapi"
+
+    def __init__(self, url=URL_BRASILAPI, timeout=5, nome=None):
+        super().__init__(url, timeout, nome)
+
+    def normalizar(self, dados):
+        return Endereco(
+            cep=formatar_cep(dados.get("cep", "")),
+            logradouro=dados.get("street") or "",
+            bairro=dados.get("neighborhood") or "",
+            localidade=dados.get("city") or "",
+            uf=dados.get("state") or "",
+        )
+
+
+class ProvedorOpenCep(ProvedorHttp):
+    """Provedor OpenCEP (https://opencep.com), com os campos do ViaCEP."""
+
+    nome = "opencep"
+
+    def __init__(self, url=URL_OPENCEP, timeout=5, nome=None):
+        super().__init__(url, timeout, nome)
+
+
+class ProvedorArquivo:
+    """
+    Provedor de CEP a partir de uma base local (sem rede).
+
+    Args:
+        base (str ou BaseCepLocal): Índice gerado por
+            ``construir_indice_cep`` ou uma base já aberta
+        nome (str): Nome do provedor
+    """
+
+    nome = "arquivo"
+
+    def __init__(self, base, nome=None):
+        if isinstance(base, (str, os.PathLike)):
+            base = BaseCepLocal(base)
+        self.base = base
+        if nome is not None:
+            self.nome = nome
+
+    def consultar(self, cep_limpo):
+        """Interface de backend usada por ``buscar_cep``."""
+        return self.base.consultar(cep_limpo)
+
+    def fechar(self):
+        """Fecha a base local."""
+        self.base.fechar()
+
+
+class DisjuntorCircuito:
+    """
+    Disjuntor ("circuit breaker") de um provedor.
+
+    Fechado, deixa passar todas as consultas. Após ``limite_falhas`` falhas
+    seguidas, abre e recusa as consultas por ``tempo_reabertura`` segundos;
+    depois disso deixa passar uma consulta de teste (meio aberto), que fecha
+    o disjuntor se der certo ou o abre de novo se falhar.
+
+    Args:
+        limite_falhas (int): Falhas seguidas que abrem o disjuntor
+        tempo_reabertura (float): Segundos até a consulta de teste
+        relogio (callable): Fonte de tempo, em segundos
+    """
+
+    FECHADO = "fechado"
+    ABERTO = "aberto"
+    MEIO_ABERTO = "meio_aberto"
+
+    def __init__(self, limite_falhas=5, tempo_reabertura=30.0, relogio=time.monotonic):
+        if limite_falhas < 1:
+            raise ValueError("limite_falhas deve ser pelo menos 1")
+        self.limite_falhas = limite_falhas
+        self.tempo_reabertura = tempo_reabertura
+        self._relogio = relogio
+        self._lock = threading.Lock()
+        self._falhas = 0
+        self._aberto_em = None
+        self._testando = False
+
+    def _estado(self):
+        if self._aberto_em is None:
+            return self.FECHADO
+        if self._relogio() - self._aberto_em >= self.tempo_reabertura:
+            return self.MEIO_ABERTO
+        return self.ABERTO
+
+    @property
+    def estado(self):
+        """str: "fechado", "aberto" ou "meio_aberto"."""
+        with self._lock:
+            return self._estado()
+
+    def permite(self):
+        """
+        Indica se uma consulta pode ser feita agora.
+
+        No estado meio aberto apenas a primeira chamada recebe True, até que
+        o resultado dela seja registrado.
+
+        Returns:
+            bool: True se a consulta deve ser feita
+        """
+        with self._lock:
+            estado = self._estado()
+            if estado == self.FECHADO:
+                return True
+            if estado == self.MEIO_ABERTO and not self._testando:
+                self._testando = True
+                return True
+            return False
+
+    def registrar_sucesso(self):
+        """Registra uma consulta bem-sucedida, fechando o disjuntor."""
+        with self._lock:
+            self._falhas = 0
+            self._aberto_em = None
+            self._testando = False
+
+    def registrar_falha(self):
+        """Registra uma falha, abrindo o disjuntor se necessário."""
+        with self._lock:
+            self._falhas += 1
+            if self._testando or self._falhas >= self.limite_falhas:
+                if self._aberto_em is None or self._testando:
+                    incrementar("disjuntores_cep_abertos")
+                self._aberto_em = self._relogio()
+            self._testando = False
+
+
+class ResolvedorCep:
+    """
+    Consulta CEPs em vários provedores com failover, hedging e disjuntores.
+
+    Args:
+        provedores (list): Provedores em ordem de preferência, cada um com
+            ``nome`` e ``consultar(cep_limpo)`` (padrão: ViaCEP, BrasilAPI e
+            OpenCEP)
+        atraso_hedge (float): Segundos de espera por um provedor antes de
+            consultar também o próximo (None para apenas failover)
+        timeout (float): Tempo máximo de uma busca, em segundos
+        limite_falhas (int): Falhas seguidas que abrem o disjuntor de um
+            provedor
+        tempo_reabertura (float): Segundos até o provedor ser testado de novo
+        workers (int): Threads usadas nas consultas
+    """
+
+    def __init__(self, provedores=None, atraso_hedge=0.5, timeout=10, limite_falhas=5,
+                 tempo_reabertura=30.0, workers=16):
+        if provedores is None:
+            provedores = (ProvedorViaCep(), ProvedorBrasilApi(), ProvedorOpenCep())
+        self.provedores = tuple(provedores)
+        if not self.provedores:
+            raise ValueError("Informe pelo menos um provedor")
+
+        self.disjuntores = {}
+        for provedor in self.provedores:
+            if provedor.nome in self.disjuntores:
+                raise ValueError(f"Nome de provedor repetido: {provedor.nome!r}")
+            self.disjuntores[provedor.nome] = DisjuntorCircuito(limite_falhas, tempo_reabertura)
+
+        self.atraso_hedge = atraso_hedge
+        self.timeout = timeout
+        self.workers = workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def fechar(self):
+        """Encerra as threads e fecha as conexões dos provedores."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        for provedor in self.provedores:
+            fechar = getattr(provedor, "fechar", None)
+            if fechar is not None:
+                fechar()
+
+    def _obter_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix="brasil_utils-cep"
+                )
+            return self._executor
+
+    def _consultar_provedor(self, provedor, cep_limpo):
+        inicio = time.perf_counter()
+        try:
+            # Provedores que ainda retornam dicionários também são aceitos
+            resultado = resultado_cep(provedor.consultar(cep_limpo))
+        except Exception as e:
+            resultado = ErroCep("erro_inesperado", f"Erro inesperado: {str(e)}")
+        duracao = time.perf_counter() - inicio
+
+        classificacao = classificar_resposta_cep(resultado)
+        disjuntor = self.disjuntores[provedor.nome]
+        if classificacao in _DEFINITIVOS:
+            disjuntor.registrar_sucesso()
+        else:
+            disjuntor.registrar_falha()
+        registrar_chamada(f"provedor_cep_{provedor.nome}", classificacao, duracao)
+        return resultado
+
+    def consultar(self, cep_limpo):
+        """
+        Interface de backend usada por ``buscar_cep``.
+
+        Args:
+            cep_limpo (str): CEP com 8 dígitos
+
+        Returns:
+            Endereco ou ErroCep: Primeira resposta definitiva (endereço ou
+            "CEP não encontrado") ou o erro do último provedor que falhou
+        """
+        executor = self._obter_executor()
+        limite = time.monotonic() + self.timeout
+        restantes = iter(self.provedores)
+        pendentes = set()
+
+        def disparar():
+            # Consulta o próximo provedor com o disjuntor fechado, se houver
+            for provedor in restantes:
+                if self.disjuntores[provedor.nome].permite():
+                    pendentes.add(executor.submit(self._consultar_provedor, provedor, cep_limpo))
+                    return True
+            return False
+
+        if not disparar():
+            return ErroCep(
+                "erro_consulta", "Erro na consulta: nenhum provedor disponível (disjuntores abertos)"
+            )
+
+        ultimo_erro = None
+        while pendentes:
+            espera = limite - time.monotonic()
+            if espera <= 0:
+                break
+            if self.atraso_hedge is not None:
+                espera = min(espera, self.atraso_hedge)
+
+            prontos, pendentes = wait(pendentes, timeout=espera, return_when=FIRST_COMPLETED)
+            if not prontos:
+                # Provedor lento: consulta também o próximo, sem cancelar este
+                if self.atraso_hedge is not None and disparar():
+                    incrementar("consultas_cep_hedge")
+                continue
+
+            # Uma resposta definitiva entre as prontas encerra a busca; só
+            # então as falhas levam a consultar (um) próximo provedor
+            for futuro in prontos:
+                resultado = futuro.result()
+                if classificar_resposta_cep(resultado) in _DEFINITIVOS:
+                    return resultado
+                ultimo_erro = resultado
+            disparar()
+
+        if pendentes:
+            return ErroCep("erro_consulta", f"Erro na consulta: tempo esgotado após {self.timeout}s")
+        return ultimo_erro
+
+    def buscar(self, cep):
+        """
+        Busca um CEP (sem cache; veja ``buscar_cep`` e ``buscar_ceps``).
+
+        Args:
+            cep (str): CEP com ou sem formatação
+
+        Returns:
+            dict: Mesmo formato retornado por ``buscar_cep``
+        """
+        if not validar_cep(cep):
+            return {"erro": "CEP inválido"}
+        return self.consultar(limpar_cep(cep)).como_dict()
+
+
+_resolvedor_padrao = None
+_lock_padrao = threading.Lock()
+
+
+def _obter_resolvedor_padrao():
+    global _resolvedor_padrao
+    with _lock_padrao:
+        if _resolvedor_padrao is None:
+            _resolvedor_padrao = ResolvedorCep()
+        return _resolvedor_padrao
+
+
+@atexit.register
+def _fechar_resolvedor_padrao():
+    # Encerra as threads e conexões do resolvedor criado por buscar_ceps
+    global _resolvedor_padrao
+    with _lock_padrao:
+        resolvedor, _resolvedor_padrao = _resolvedor_padrao, None
+    if resolvedor is not None:
+        resolvedor.fechar()
+
+
+def buscar_ceps(ceps, resolvedor=None, cache=None, workers=8):
+    """
+    Busca vários CEPs em paralelo, com failover entre provedores.
+
+    Cada CEP distinto é consultado uma única vez, pelo mesmo caminho de
+    ``buscar_cep`` (com validação, cache e agrupamento de consultas
+    simultâneas).
+
+    Args:
+        ceps (iterable): CEPs com ou sem formatação
+        resolvedor: Backend das consultas (padrão: o definido em
+            ``definir_backend_cep`` ou, se nenhum, um ``ResolvedorCep`` com
+            ViaCEP, BrasilAPI e OpenCEP)
+        cache: Cache repassado a ``buscar_cep``
+        workers (int): Consultas simultâneas
+
+    Returns:
+        list: Um resultado (no formato de ``buscar_cep``) por CEP, na ordem
+        recebida
+    """
+    limpos, resultados = _buscar_unicos(ceps, resolvedor, cache, workers)
+    return [resultados[c].como_dict() for c in limpos]
+
+
+def buscar_enderecos(ceps, resolvedor=None, cache=None, workers=8):
+    """
+    Busca vários CEPs como ``buscar_ceps``, com o resultado guardado por coluna.
+
+    Args:
+        ceps (iterable): CEPs com ou sem formatação
+        resolvedor: Backend das consultas (ver ``buscar_ceps``)
+        cache: Cache repassado a ``buscar_cep``
+        workers (int): Consultas simultâneas
+
+    Returns:
+        LoteEnderecos: Um ``Endereco`` ou ``ErroCep`` por CEP, na ordem recebida
+    """
+    ceps = list(ceps)
+    limpos, resultados = _buscar_unicos(ceps, resolvedor, cache, workers)
+    return LoteEnderecos.de_resultados(ceps, (resultados[c] for c in limpos))
+
+
+def _buscar_unicos(ceps, resolvedor, cache, workers):
+    """Consulta cada CEP distinto uma vez; retorna (CEPs limpos, CEP -> Endereco/ErroCep)."""
+    limpos = [limpar_cep(c) for c in ceps]
+    if resolvedor is None:
+        # Comparação com None: uma BaseCepLocal vazia tem len() == 0
+        resolvedor = cep._backend_padrao
+        if resolvedor is None:
+            resolvedor = _obter_resolvedor_padrao()
+
+    unicos = list(dict.fromkeys(limpos))
+    with ThreadPoolExecutor(max(1, min(workers, len(unicos)))) as executor:
+        resultados = dict(zip(unicos, executor.map(
+            lambda c: cep._buscar(c, cache, False, resolvedor), unicos
+        )))
+    return limpos, resultados
@@ -0,0 +1,374 @@
+"""
+Interface de linha de comando do brasil_utils.
+
+Exemplo:
+
+    brasil-utils limpar clientes.csv -c documento:cpf -c fone:telefone \\
+        -o clientes_limpos.csv -r rejeitados.csv --processos 4
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+from functools import partial
+
+from ._lotes import agrupar, mapear_lotes
+from .validadores import validar_cpf, validar_cnpj, formatar_cpf, formatar_cnpj
+from .formatadores import formatar_real
+from .cep import validar_cep, formatar_cep
+from .telefones import TelefoneBR, validar_telefone
+
+
+def _numero(valor):
+    # Aceita "1234.56", o formato brasileiro "1.234,56" e o americano
+    # "1,234.56": o último separador é o decimal
+    if valor.rfind(',') > valor.rfind('.'):
+        valor = valor.replace('.', '').replace(',', '.')
+    else:
+        valor = valor.replace(',', '')
+    numero = float(valor)
+    if not math.isfinite(numero):
+        raise ValueError(f"Valor não finito: {valor!r}")
+    return numero
+
+
+def validar_valor(valor):
+    """
+    Verifica se um texto representa um valor numérico.
+
+    Args:
+        valor (str): Valor a ser verificado
+
+    Returns:
+        bool: True se o valor puder ser convertido em número
+    """
+    try:
+        _numero(valor)
+    except ValueError:
+        return False
+    return True
+
+
+def formatar_valor(valor):
+    """
+    Formata um valor numérico em texto como moeda brasileira.
+
+    Args:
+        valor (str): Valor a ser formatado
+
+    Returns:
+        str: Valor formatado como moeda brasileira
+    """
+    return formatar_real(_numero(valor))
+
+
+def formatar_telefone_br(telefone):
+    """
+    Formata um telefone no padrão brasileiro, pela mesma regra de
+    ``validar_telefone`` (ex.: "(11) 3222-1234", "0800 123 4567").
+
+    Args:
+        telefone (str): Telefone em qualquer formatação
+
+    Returns:
+        str: Telefone formatado
+    """
+    interpretado = TelefoneBR.analisar(telefone)
+    if interpretado is None:
+        raise ValueError(f"Telefone inválido: {telefone!r}")
+    return interpretado.formatado
+
+
+def formatar_e164(telefone):
+    """
+    Converte um telefone para o formato E.164 (ex.: +5511999887766).
+
+    Args:
+        telefone (str): Telefone em qualquer formatação
+
+    Returns:
+        str: Telefone no formato E.164
+    """
+    interpretado = TelefoneBR.analisar(telefone)
+    if interpretado is None or interpretado.e164 is None:
+        raise ValueError(f"Telefone sem DDD ou inválido: {telefone!r}")
+    return interpretado.e164
+
+
+# Validadores: recebem o texto e retornam bool
+VALIDADORES = {
+    'validar_cpf': validar_cpf,
+    'validar_cnpj': validar_cnpj,
+    'validar_cep': validar_cep,
+    'validar_telefone': validar_telefone,
+    'validar_valor': validar_valor,
+}
+
+# Formatadores: recebem o texto e retornam o texto formatado
+FORMATADORES = {
+    'formatar_cpf': formatar_cpf,
+    'formatar_cnpj': formatar_cnpj,
+    'formatar_cep': formatar_cep,
+    'formatar_telefone': formatar_telefone_br,
+    'formatar_real': formatar_valor,
+    'formatar_e164': formatar_e164,
+}
+
+# Atalhos que combinam validação e formatação
+ATALHOS = {
+    'cpf': ('validar_cpf', 'formatar_cpf'),
+    'cnpj': ('validar_cnpj', 'formatar_cnpj'),
+    'cep': ('validar_cep', 'formatar_cep'),
+    'telefone': ('validar_telefone', 'formatar_telefone'),
+    'real': ('validar_valor', 'formatar_real'),
+}
+
+
+def interpretar_regra(texto):
+    """
+    Converte uma regra ``coluna:operacao[,operacao...]`` em tupla.
+
+    Args:
+        texto (str): Regra informada na linha de comando
+
+    Returns:
+        tuple: (coluna, operacoes)
+    """
+    coluna, separador, operacoes = texto.rpartition(':')
+    if not separador or not coluna or not operacoes:
+        raise ValueError(f"Regra inválida: {texto!r} (use coluna:operacao)")
+
+    nomes = []
+    for nome in operacoes.split(','):
+        nome = nome.strip()
+        if nome in ATALHOS:
+            nomes.extend(ATALHOS[nome])
+        elif nome in VALIDADORES or nome in FORMATADORES:
+            nomes.append(nome)
+        else:
+            raise ValueError(f"Operação desconhecida: {nome!r}")
+    return coluna, tuple(nomes)
+
+
+def processar_lote(regras, linhas):
+    """
+    Aplica as regras de validação e formatação a um lote de linhas.
+
+    Args:
+        regras (tuple): Pares (coluna, operacoes)
+        linhas (list): Linhas como dicionários
+
+    Returns:
+        tuple: (linhas_limpas, rejeitadas) onde ``rejeitadas`` é uma lista
+        de pares (linha_original, motivo)
+    """
+    limpas = []
+    rejeitadas = []
+
+    for linha in linhas:
+        nova = dict(linha)
+        motivo = None
+
+        for coluna, operacoes in regras:
+            valor = nova.get(coluna)
+            if valor is None:
+                motivo = f"{coluna}: coluna ausente"
+                break
+            valor = str(valor)
+
+            for operacao in operacoes:
+                validador = VALIDADORES.get(operacao)
+                if validador is not None:
+                    if not validador(valor):
+                        motivo = f"{coluna}: {operacao}"
+                        break
+                else:
+                    try:
+                        valor = FORMATADORES[operacao](valor)
+                    except (TypeError, ValueError):
+                        motivo = f"{coluna}: {operacao}"
+                        break
+
+            if motivo:
+                break
+            nova[coluna] = valor
+
+        if motivo:
+            rejeitadas.append((linha, motivo))
+        else:
+            limpas.append(nova)
+
+    return limpas, rejeitadas
+
+
+class _EscritorCsv:
+    def __init__(self, arquivo, campos, delimitador):
+        self._escritor = csv.DictWriter(
+            arquivo, fieldnames=campos, delimiter=delimitador, extrasaction='ignore'
+        )
+        self._escritor.writeheader()
+
+    def escrever(self, linha):
+        self._escritor.writerow(linha)
+
+
+class _EscritorJsonl:
+    def __init__(self, arquivo):
+        self._arquivo = arquivo
+
+    def escrever(self, linha):
+        self._arquivo.write(json.dumps(linha, ensure_ascii=False))
+        self._arquivo.write('\n')
+
+
+def _ler_jsonl(arquivo):
+    for linha in arquivo:
+        if linha.strip():
+            yield json.loads(linha)
+
+
+def limpar_arquivo(entrada, saida, rejeitados, regras, formato=None,
+                   tamanho_lote=10000, processos=None, delimitador=','):
+    """
+    Valida e formata um arquivo CSV ou JSONL em fluxo, lote a lote.
+
+    Args:
+        entrada (str): Arquivo de entrada
+        saida (str): Arquivo com as linhas aceitas (já formatadas)
+        rejeitados (str): Arquivo com as linhas recusadas e o motivo
+        regras (list): Pares (coluna, operacoes) ou textos ``coluna:operacao``
+        formato (str): "csv" ou "jsonl" (padrão: deduzido pela extensão)
+        tamanho_lote (int): Quantidade de linhas por lote
+        processos (int): Processos usados em paralelo (None para um só)
+        delimitador (str): Delimitador do CSV
+
+    Returns:
+        tuple: (linhas_aceitas, linhas_rejeitadas)
+    """
+    if formato is None:
+        formato = 'jsonl' if entrada.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+    regras = tuple(interpretar_regra(r) if isinstance(r, str) else r for r in regras)
+
+    aceitas = recusadas = 0
+    with open(entrada, encoding='utf-8', newline='') as arquivo_entrada, \
+            open(saida, 'w', encoding='utf-8', newline='') as arquivo_saida, \
+            open(rejeitados, 'w', encoding='utf-8', newline='') as arquivo_rejeitados:
+
+        if formato == 'csv':
+            leitor = csv.DictReader(arquivo_entrada, delimiter=delimitador)
+            campos = list(leitor.fieldnames or [])
+            escritor = _EscritorCsv(arquivo_saida, campos, delimitador)
+            escritor_rejeitados = _EscritorCsv(
+                arquivo_rejeitados, campos + ['erro'], delimitador
+            )
+        elif formato == 'jsonl':
+            leitor = _ler_jsonl(arquivo_entrada)
+            escritor = _EscritorJsonl(arquivo_saida)
+            escritor_rejeitados = _EscritorJsonl(arquivo_rejeitados)
+        else:
+            raise ValueError(f"Formato não suportado: {formato}")
+
+        lotes = agrupar(leitor, tamanho_lote)
+        for limpas, rejeitadas in mapear_lotes(partial(processar_lote, regras), lotes, processos):
+            for linha in limpas:
+                escritor.escrever(linha)
+            for linha, motivo in rejeitadas:
+                escritor_rejeitados.escrever(dict(linha, erro=motivo))
+            aceitas += len(limpas)
+            recusadas += len(rejeitadas)
+
+    return aceitas, recusadas
+
+
+def _caminho_derivado(entrada, sufixo):
+    base, extensao = os.path.splitext(entrada)
+    return f"{base}.{sufixo}{extensao}"
+
+
+def criar_parser():
+    """
+    Cria o parser de argumentos da linha de comando.
+
+    Returns:
+        argparse.ArgumentParser: Parser configurado
+    """
+    parser = argparse.ArgumentParser(
+        prog='brasil-utils',
+        description='Utilitários para dados brasileiros'
+    )
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+
+    limpar = subcomandos.add_parser(
+        'limpar',
+        help='valida e formata colunas de um arquivo CSV ou JSONL',
+        description=(
+            'Valida e formata colunas de um arquivo CSV ou JSONL. Operações: '
+            + ', '.join(sorted(ATALHOS)) + ' (atalhos), '
+            + ', '.join(sorted(VALIDADORES)) + ', '
+            + ', '.join(sorted(FORMATADORES)) + '.'
+        )
+    )
+    limpar.add_argument('entrada', help='arquivo de entrada')
+    limpar.add_argument(
+        '-c', '--coluna', action='append', required=True, metavar='COLUNA:OPERACAO',
+        help='regra para uma coluna, ex.: documento:cpf ou valor:validar_valor,formatar_real'
+    )
+    limpar.add_argument('-o', '--saida', help='arquivo de saída (padrão: ENTRADA.limpo.EXT)')
+    limpar.add_argument(
+        '-r', '--rejeitados', help='arquivo de rejeitados (padrão: ENTRADA.rejeitados.EXT)'
+    )
+    limpar.add_argument('--formato', choices=('csv', 'jsonl'), help='formato da entrada')
+    limpar.add_argument('--delimitador', default=',', help='delimitador do CSV (padrão: ,)')
+    limpar.add_argument(
+        '--tamanho-lote', type=int, default=10000, help='linhas por lote (padrão: 10000)'
+    )
+    limpar.add_argument(
+        '-p', '--processos', type=int, default=1,
+        help='processos em paralelo (0 para usar todos os núcleos)'
+    )
+    return parser
+
+
+def main(argv=None):
+    """
+    Ponto de entrada do comando ``brasil-utils``.
+
+    Args:
+        argv (list): Argumentos (padrão: os da linha de comando)
+
+    Returns:
+        int: Código de saída
+    """
+    parser = criar_parser()
+    argumentos = parser.parse_args(argv)
+
+    try:
+        regras = [interpretar_regra(regra) for regra in argumentos.coluna]
+    except ValueError as e:
+        parser.error(str(e))
+
+    processos = argumentos.processos or os.cpu_count()
+    saida = argumentos.saida or _caminho_derivado(argumentos.entrada, 'limpo')
+    rejeitados = argumentos.rejeitados or _caminho_derivado(argumentos.entrada, 'rejeitados')
+
+    try:
+        aceitas, recusadas = limpar_arquivo(
+            argumentos.entrada, saida, rejeitados, regras,
+            formato=argumentos.formato,
+            tamanho_lote=argumentos.tamanho_lote,
+            processos=processos,
+            delimitador=argumentos.delimitador
+        )
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{aceitas} linhas aceitas, {recusadas} rejeitadas", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
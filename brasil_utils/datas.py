@@ -0,0 +1,147 @@
+"""
+Módulo para conversão rápida de datas em texto (ISO e padrão brasileiro).
+
+Não usa ``datetime.strptime`` nem exceções para controle de fluxo: cada
+formato é reconhecido pela posição do separador e pelo tamanho das partes.
+Um ``ConversorDatas`` lembra o último formato que funcionou, de modo que
+numa coluna ou fluxo homogêneo os valores seguintes não passam pela
+detecção.
+"""
+
+from datetime import date
+
+
+# formato -> (separador, posição do ano, posição do mês, posição do dia)
+FORMATOS = {
+    '%Y-%m-%d': ('-', 0, 1, 2),
+    '%d/%m/%Y': ('/', 2, 1, 0),
+    '%d-%m-%Y': ('-', 2, 1, 0),
+    '%Y/%m/%d': ('/', 0, 1, 2),
+}
+
+FORMATOS_PADRAO = tuple(FORMATOS)
+
+_DIAS_POR_MES = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _converter(texto, formato):
+    separador, posicao_ano, posicao_mes, posicao_dia = formato
+    partes = texto.split(separador)
+    if len(partes) != 3:
+        return None
+
+    ano = partes[posicao_ano]
+    mes = partes[posicao_mes]
+    dia = partes[posicao_dia]
+    if len(ano) != 4 or not 0 < len(mes) < 3 or not 0 < len(dia) < 3:
+        return None
+
+    digitos = ano + mes + dia
+    if not (digitos.isascii() and digitos.isdigit()):
+        return None
+
+    ano = int(ano)
+    mes = int(mes)
+    dia = int(dia)
+    if ano < 1 or mes < 1 or mes > 12 or dia < 1:
+        return None
+
+    limite = _DIAS_POR_MES[mes]
+    if mes == 2 and ano % 4 == 0 and (ano % 100 != 0 or ano % 400 == 0):
+        limite = 29
+    if dia > limite:
+        return None
+
+    return date(ano, mes, dia)
+
+
+class ConversorDatas:
+    """
+    Conversor de datas em texto que memoriza o formato detectado.
+
+    Args:
+        formatos (tuple): Formatos aceitos, no estilo de ``strptime``
+            (subconjunto de ``FORMATOS``), na ordem em que são testados
+    """
+
+    __slots__ = ('formatos', 'formato')
+
+    def __init__(self, formatos=FORMATOS_PADRAO):
+        for formato in formatos:
+            if formato not in FORMATOS:
+                raise ValueError(f"Formato de data não suportado: {formato!r}")
+        self.formatos = tuple(formatos)
+        # Último formato que funcionou, testado antes dos demais
+        self.formato = None
+
+    def converter(self, texto):
+        """
+        Converte um texto em data.
+
+        Args:
+            texto (str): Data em um dos formatos aceitos
+
+        Returns:
+            date: Data convertida ou None se o texto não for uma data válida
+        """
+        atual = self.formato
+        if atual is not None:
+            data = _converter(texto, FORMATOS[atual])
+            if data is not None:
+                return data
+
+        for formato in self.formatos:
+            if formato != atual:
+                data = _converter(texto, FORMATOS[formato])
+                if data is not None:
+                    self.formato = formato
+                    return data
+        return None
+
+    def converter_lote(self, textos):
+        """
+        Converte uma coluna de datas em texto.
+
+        Args:
+            textos (iterable): Datas em texto
+
+        Returns:
+            list: Datas convertidas (None para valores inválidos)
+        """
+        converter = self.converter
+        return [converter(texto) for texto in textos]
+
+
+def converter_data(texto, formatos=FORMATOS_PADRAO):
+    """
+    Converte um texto em data, detectando o formato.
+
+    Args:
+        texto (str): Data no formato ISO (2024-12-25, 2024/12/25) ou
+            brasileiro (25/12/2024, 25-12-2024)
+        formatos (tuple): Formatos aceitos
+
+    Returns:
+        date: Data convertida ou None se o texto não for uma data válida
+    """
+    for formato in formatos:
+        data = _converter(texto, FORMATOS[formato])
+        if data is not None:
+            return data
+    return None
+
+
+def converter_datas(textos, formatos=FORMATOS_PADRAO):
+    """
+    Converte uma coluna de datas em texto de uma vez.
+
+    O formato detectado no primeiro valor é testado primeiro nos seguintes.
+
+    Args:
+        textos (iterable): Datas em texto
+        formatos (tuple): Formatos aceitos
+
+    Returns:
+        list: Datas convertidas (None para valores inválidos)
+    """
+    return ConversorDatas(formatos).converter_lote(textos)
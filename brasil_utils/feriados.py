@@ -2,20 +2,30 @@
 Módulo para cálculo de feriados nacionais brasileiros.
 """
 
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
 from datetime import datetime, date, timedelta
-from dateutil.easter import easter
+from functools import lru_cache
+from types import MappingProxyType
 
+from ._cache_anos import TAMANHO_CACHE_PADRAO, CacheAnos  # noqa: F401 (reexportado)
+from ._dependencias import exigir_numpy
+from ._tabela_feriados import ANO_INICIAL, ANO_FINAL, PASCOA
+from .datas import ConversorDatas
+from .metricas import instrumentar
+from .tipos import Feriado
+from .feriados_regionais import (
+    eh_feriado_regional, feriados_regionais, datas_feriados_regionais,
+    _calendario as _calendario_regional
+)
 
-def feriados_fixos(ano):
-    """
-    Retorna os feriados fixos do Brasil para um determinado ano.
-    
-    Args:
-        ano (int): Ano para calcular os feriados
-        
-    Returns:
-        dict: Dicionário com os feriados fixos
-    """
+# NumPy é opcional: só é necessário (e importado) nos cálculos sobre arrays
+_MENSAGEM_NUMPY = "Os cálculos de dias úteis em lote requerem o NumPy."
+
+
+
+
+def _calcular_fixos(ano):
     return {
         'Ano Novo': date(ano, 1, 1),
         'Tiradentes': date(ano, 4, 21),
@@ -28,18 +38,42 @@ def feriados_fixos(ano):
     }
 
 
-def feriados_moveis(ano):
+def _pascoa_gregoriana(ano):
+    # Algoritmo anônimo gregoriano (Meeus/Jones/Butcher)
+    a = ano % 19
+    b, c = divmod(ano, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    mes, dia = divmod(h + l - 7 * m + 114, 31)
+    return date(ano, mes, dia + 1)
+
+
+def calcular_pascoa(ano):
     """
-    Retorna os feriados móveis do Brasil para um determinado ano.
-    
+    Calcula a data da Páscoa (calendário gregoriano).
+
+    Anos de 1900 a 2200 são lidos de uma tabela pré-calculada; os demais
+    são calculados.
+
     Args:
-        ano (int): Ano para calcular os feriados
-        
+        ano (int): Ano
+
     Returns:
-        dict: Dicionário com os feriados móveis
+        date: Domingo de Páscoa
     """
-    pascoa = easter(ano)
-    
+    if ANO_INICIAL <= ano <= ANO_FINAL:
+        return date(ano, 3, 22) + timedelta(days=PASCOA[ano - ANO_INICIAL] - 48)
+    return _pascoa_gregoriana(ano)
+
+
+def _calcular_moveis(ano):
+    pascoa = calcular_pascoa(ano)
+
     return {
         'Carnaval': pascoa - timedelta(days=47),  # Segunda-feira de carnaval
         'Sexta-feira Santa': pascoa - timedelta(days=2),
@@ -47,53 +81,195 @@ def feriados_moveis(ano):
     }
 
 
-def todos_feriados(ano):
+# Tabelas imutáveis de um ano, compartilhadas por todas as consultas
+_TabelaAno = namedtuple('_TabelaAno', ['fixos', 'moveis', 'todos', 'datas', 'feriados'])
+
+
+def _montar_tabela(ano):
+    fixos = _calcular_fixos(ano)
+    moveis = _calcular_moveis(ano)
+    todos = dict(fixos)
+    todos.update(moveis)
+
+    return _TabelaAno(
+        fixos=MappingProxyType(fixos),
+        moveis=MappingProxyType(moveis),
+        todos=MappingProxyType(todos),
+        datas=frozenset(todos.values()),
+        feriados=tuple(sorted(Feriado(data, nome) for nome, data in todos.items()))
+    )
+
+
+_cache = CacheAnos(_montar_tabela)
+
+
+def configurar_cache_feriados(tamanho_maximo):
+    """
+    Define o número máximo de anos mantidos no cache de feriados (nacionais
+    e regionais).
+
+    Args:
+        tamanho_maximo (int): Quantidade máxima de anos (None para ilimitado,
+            0 para desativar o cache)
+    """
+    _cache.configurar(tamanho_maximo)
+    _calendario_regional.anos.configurar(tamanho_maximo)
+
+
+def limpar_cache_feriados(ano=None):
+    """
+    Invalida o cache de feriados (nacionais e regionais).
+
+    Args:
+        ano (int): Ano a ser removido do cache (padrão: todos, zerando também
+            as estatísticas)
+    """
+    _cache.limpar(ano)
+    _calendario_regional.anos.limpar(ano)
+
+
+def estatisticas_cache_feriados():
+    """
+    Retorna as estatísticas de uso do cache de feriados.
+
+    Returns:
+        dict: Acertos, falhas, taxa de acerto, tamanho atual e máximo do
+        cache dos feriados nacionais, e as mesmas informações do cache dos
+        regionais em ``regionais``
+    """
+    estatisticas = _cache.estatisticas()
+    estatisticas['regionais'] = _calendario_regional.anos.estatisticas()
+    return estatisticas
+
+
+def feriados_fixos(ano):
     """
-    Retorna todos os feriados nacionais brasileiros para um determinado ano.
+    Retorna os feriados fixos do Brasil para um determinado ano.
     
     Args:
         ano (int): Ano para calcular os feriados
         
     Returns:
-        dict: Dicionário com todos os feriados
+        Mapping: Mapeamento imutável com os feriados fixos
     """
-    feriados = {}
-    feriados.update(feriados_fixos(ano))
-    feriados.update(feriados_moveis(ano))
+    return _cache.obter(ano).fixos
+
+
+def feriados_moveis(ano):
+    """
+    Retorna os feriados móveis do Brasil para um determinado ano.
     
-    return feriados
+    Args:
+        ano (int): Ano para calcular os feriados
+        
+    Returns:
+        Mapping: Mapeamento imutável com os feriados móveis
+    """
+    return _cache.obter(ano).moveis
+
+
+@instrumentar()
+def todos_feriados(ano, uf=None, municipio=None):
+    """
+    Retorna todos os feriados brasileiros para um determinado ano.
+    
+    Args:
+        ano (int): Ano para calcular os feriados
+        uf (str): Sigla da UF, para incluir os feriados estaduais
+        municipio (str): Código IBGE do município, para incluir os feriados
+            estaduais e municipais
+        
+    Returns:
+        Mapping: Mapeamento imutável com todos os feriados
+    """
+    todos = _cache.obter(ano).todos
+    if uf is None and municipio is None:
+        return todos
+
+    feriados = dict(todos)
+    feriados.update(feriados_regionais(ano, uf, municipio))
+    return MappingProxyType(feriados)
 
 
-def eh_feriado(data_verificar):
+def feriados_ordenados(ano):
     """
-    Verifica se uma data é feriado nacional no Brasil.
+    Retorna os feriados nacionais de um ano ordenados por data.
+
+    Args:
+        ano (int): Ano para calcular os feriados
+
+    Returns:
+        tuple: ``Feriado(data, nome)`` em ordem de data (o mesmo que
+        ``listar_feriados(ano)``)
+    """
+    return _cache.obter(ano).feriados
+
+
+@instrumentar()
+def listar_feriados(ano, uf=None, municipio=None):
+    """
+    Lista os feriados de um ano em ordem cronológica.
+
+    Mesmo conteúdo de ``todos_feriados``, como tuplas ``Feriado(data, nome)``
+    já ordenadas; a lista nacional é montada uma vez por ano e reaproveitada.
+
+    Args:
+        ano (int): Ano para calcular os feriados
+        uf (str): Sigla da UF, para incluir os feriados estaduais
+        municipio (str): Código IBGE do município, para incluir os feriados
+            estaduais e municipais
+
+    Returns:
+        tuple: ``Feriado`` em ordem de data
+    """
+    if uf is None and municipio is None:
+        return _cache.obter(ano).feriados
+    return tuple(sorted(
+        Feriado(data, nome) for nome, data in todos_feriados(ano, uf, municipio).items()
+    ))
+
+
+# Formatos aceitos por eh_feriado; o último formato reconhecido é testado primeiro
+_conversor_datas = ConversorDatas(('%Y-%m-%d', '%d/%m/%Y'))
+
+
+def _classificar_feriado(feriado):
+    return 'feriado' if feriado else 'dia_comum'
+
+
+@instrumentar(classificar=_classificar_feriado)
+def eh_feriado(data_verificar, uf=None, municipio=None):
+    """
+    Verifica se uma data é feriado no Brasil.
     
     Args:
         data_verificar (date/datetime/str): Data a ser verificada
+        uf (str): Sigla da UF, para considerar também os feriados estaduais
+        municipio (str): Código IBGE do município (ex.: o campo ``ibge`` de
+            ``buscar_cep``), para considerar os feriados estaduais e
+            municipais
         
     Returns:
         bool: True se for feriado, False caso contrário
     """
     # Converte string para date se necessário
     if isinstance(data_verificar, str):
-        try:
-            data_verificar = datetime.strptime(data_verificar, '%Y-%m-%d').date()
-        except ValueError:
-            try:
-                data_verificar = datetime.strptime(data_verificar, '%d/%m/%Y').date()
-            except ValueError:
-                return False
+        data_verificar = _conversor_datas.converter(data_verificar)
+        if data_verificar is None:
+            return False
     
     # Converte datetime para date se necessário
     if isinstance(data_verificar, datetime):
         data_verificar = data_verificar.date()
     
-    ano = data_verificar.year
-    feriados = todos_feriados(ano)
-    
-    return data_verificar in feriados.values()
+    if data_verificar in _cache.obter(data_verificar.year).datas:
+        return True
+    if uf is None and municipio is None:
+        return False
+    return eh_feriado_regional(data_verificar, uf, municipio)
 
 
+@instrumentar()
 def proximo_feriado(data_referencia=None):
     """
     Retorna o próximo feriado nacional a partir de uma data de referência.
@@ -101,6 +277,9 @@ def proximo_feriado(data_referencia=None):
     Args:
         data_referencia (date/datetime): Data de referência (padrão: hoje)
         
+    Mantida por compatibilidade: o par segue a ordem (nome, data) original;
+    ``LinhaDoTempoFeriados.proximo`` retorna o ``Feriado`` equivalente.
+
     Returns:
         tuple: (nome_feriado, data_feriado) ou None se não houver
     """
@@ -110,7 +289,11 @@ def proximo_feriado(data_referencia=None):
     if isinstance(data_referencia, datetime):
         data_referencia = data_referencia.date()
     
-    # Verifica feriados do ano atual
+    if ANO_INICIAL <= data_referencia.year < ANO_FINAL:
+        data, nome = _linha_do_tempo_nacional().proximo(data_referencia)
+        return nome, data
+    
+    # Fora da linha do tempo: verifica feriados do ano atual
     ano_atual = data_referencia.year
     feriados_ano = todos_feriados(ano_atual)
     
@@ -133,6 +316,7 @@ def proximo_feriado(data_referencia=None):
     return None
 
 
+@instrumentar()
 def dias_uteis_entre(data_inicio, data_fim, incluir_feriados=False):
     """
     Calcula o número de dias úteis entre duas datas.
@@ -168,6 +352,7 @@ def dias_uteis_entre(data_inicio, data_fim, incluir_feriados=False):
     return dias_uteis
 
 
+@instrumentar()
 def feriados_por_mes(ano, mes):
     """
     Retorna os feriados de um mês específico.
@@ -179,6 +364,9 @@ def feriados_por_mes(ano, mes):
     Returns:
         dict: Feriados do mês especificado
     """
+    if ANO_INICIAL <= ano <= ANO_FINAL:
+        return {nome: data for data, nome in _linha_do_tempo_nacional().por_mes(ano, mes)}
+    
     todos_feriados_ano = todos_feriados(ano)
     
     feriados_mes = {
@@ -187,3 +375,409 @@ def feriados_por_mes(ano, mes):
     }
     
     return feriados_mes
+
+
+def _datas_feriados(ano, uf=None, municipio=None):
+    datas = _cache.obter(ano).datas
+    if uf is None and municipio is None:
+        return datas
+    return datas.union(datas_feriados_regionais(ano, uf, municipio))
+
+
+@lru_cache(maxsize=32)
+def _calendario_numpy(ano_inicio, ano_fim, incluir_feriados, uf, municipio, versao):
+    np = exigir_numpy(_MENSAGEM_NUMPY)
+    feriados = set()
+    if not incluir_feriados:
+        for ano in range(ano_inicio, ano_fim + 1):
+            feriados.update(_datas_feriados(ano, uf, municipio))
+    return np.busdaycalendar(holidays=np.array(sorted(feriados), dtype='datetime64[D]'))
+
+
+def _calendario_para(datas, margem, incluir_feriados, uf, municipio):
+    np = exigir_numpy(_MENSAGEM_NUMPY)
+    versao = 0 if uf is None and municipio is None else _calendario_regional.versao
+    # Feriados de todos os anos das datas, com ``margem`` anos de folga
+    # para os resultados que caem em anos seguintes ou anteriores
+    anos = datas[~np.isnat(datas)].astype('datetime64[Y]').astype(np.int64) + 1970
+    if not anos.size:
+        return _calendario_numpy(1970, 1970, incluir_feriados, uf, municipio, versao)
+    return _calendario_numpy(
+        max(int(anos.min()) - margem, 1), min(int(anos.max()) + margem, 9999),
+        incluir_feriados, uf, municipio, versao
+    )
+
+
+def _como_datetime64(datas):
+    return exigir_numpy(_MENSAGEM_NUMPY).asarray(datas, dtype='datetime64[D]')
+
+
+@instrumentar()
+def dias_uteis_entre_lote(datas_inicio, datas_fim, incluir_feriados=False,
+                          uf=None, municipio=None):
+    """
+    Calcula o número de dias úteis entre pares de datas, elemento a elemento.
+
+    Equivale a chamar ``dias_uteis_entre`` para cada par (intervalo
+    inclusivo, com as datas trocadas se o início for posterior ao fim).
+
+    Args:
+        datas_inicio (array-like): Datas de início (``datetime64``, ``date``
+            ou texto ISO; ex.: uma coluna do pandas)
+        datas_fim (array-like): Datas de fim, do mesmo tamanho
+        incluir_feriados (bool): Se feriados devem ser considerados dias úteis
+        uf (str): Sigla da UF, para considerar os feriados estaduais
+        municipio (str): Código IBGE do município, para considerar os
+            feriados estaduais e municipais
+
+    Returns:
+        numpy.ndarray: Número de dias úteis de cada par, ou -1 nos pares em
+        que uma das datas é ``NaT`` (ex.: valores ausentes do pandas)
+    """
+    np = exigir_numpy(_MENSAGEM_NUMPY)
+    inicio, fim = np.broadcast_arrays(_como_datetime64(datas_inicio),
+                                      _como_datetime64(datas_fim))
+    menor = np.minimum(inicio, fim)
+    maior = np.maximum(inicio, fim)
+
+    calendario = _calendario_para(np.concatenate((menor.ravel(), maior.ravel())), 0,
+                                  incluir_feriados, uf, municipio)
+    # np.busday_count não aceita NaT: conta apenas os pares completos
+    validos = ~(np.isnat(menor) | np.isnat(maior))
+    resultado = np.full(menor.shape, -1, dtype=np.int64)
+    resultado[validos] = np.busday_count(menor[validos], maior[validos] + 1,
+                                         busdaycal=calendario)
+    return resultado
+
+
+@instrumentar()
+def adicionar_dias_uteis_lote(datas, dias, incluir_feriados=False, uf=None, municipio=None):
+    """
+    Soma (ou subtrai) um número de dias úteis a cada data de um array.
+
+    Segue a mesma regra de ``CalendarioUteis.adicionar_dias_uteis``: somar N
+    a um sábado conta a partir da segunda-feira, subtrair conta a partir da
+    sexta-feira e somar zero retorna a própria data.
+
+    Args:
+        datas (array-like): Datas de referência (``datetime64``, ``date`` ou
+            texto ISO)
+        dias (int/array-like): Quantidade de dias úteis (um valor para
+            todas as datas ou um por data)
+        incluir_feriados (bool): Se feriados devem ser considerados dias úteis
+        uf (str): Sigla da UF, para considerar os feriados estaduais
+        municipio (str): Código IBGE do município, para considerar os
+            feriados estaduais e municipais
+
+    Returns:
+        numpy.ndarray: Datas resultantes (``datetime64[D]``)
+    """
+    np = exigir_numpy(_MENSAGEM_NUMPY)
+    datas = _como_datetime64(datas)
+    dias = np.asarray(dias, dtype=np.int64)
+
+    # Cada ano tem bem mais de 200 dias úteis
+    margem = int(np.abs(dias).max()) // 200 + 1 if dias.size else 1
+    calendario = _calendario_para(datas.ravel(), margem, incluir_feriados, uf, municipio)
+
+    # Para dias negativos, partir de um dia não útil equivale a partir do
+    # dia útil seguinte; com roll='backward' isso é um dia útil a menos
+    ajuste = dias + ((dias < 0) & ~np.is_busday(datas, busdaycal=calendario))
+    resultado = np.busday_offset(datas, ajuste, roll='backward', busdaycal=calendario)
+    return np.where(dias == 0, datas, resultado)
+
+
+def _como_date(data):
+    if isinstance(data, datetime):
+        return data.date()
+    return data
+
+
+class CalendarioUteis:
+    """
+    Calendário de dias úteis pré-calculado para um intervalo de anos.
+
+    Guarda a contagem acumulada de dias úteis de cada dia do intervalo, de
+    modo que contar dias úteis entre duas datas ou somar N dias úteis a uma
+    data sejam consultas em tempo constante.
+
+    Args:
+        ano_inicio (int): Primeiro ano coberto pelo calendário
+        ano_fim (int): Último ano coberto pelo calendário
+        incluir_feriados (bool): Se feriados devem ser considerados dias úteis
+        uf (str): Sigla da UF, para considerar os feriados estaduais
+        municipio (str): Código IBGE do município, para considerar os
+            feriados estaduais e municipais
+    """
+
+    def __init__(self, ano_inicio=1970, ano_fim=2100, incluir_feriados=False,
+                 uf=None, municipio=None):
+        if ano_inicio > ano_fim:
+            raise ValueError("ano_inicio deve ser menor ou igual a ano_fim")
+
+        self.ano_inicio = ano_inicio
+        self.ano_fim = ano_fim
+        self.inicio = date(ano_inicio, 1, 1)
+        self.fim = date(ano_fim, 12, 31)
+
+        feriados = set()
+        if not incluir_feriados:
+            for ano in range(ano_inicio, ano_fim + 1):
+                feriados.update(_datas_feriados(ano, uf, municipio))
+
+        base = self.inicio.toordinal()
+        total_dias = self.fim.toordinal() - base + 1
+
+        # acumulado[i] = dias úteis antes do i-ésimo dia do intervalo
+        # uteis[k] = posição do (k+1)-ésimo dia útil do intervalo
+        acumulado = [0] * (total_dias + 1)
+        uteis = []
+        contagem = 0
+        dia_semana = self.inicio.weekday()
+        for indice in range(total_dias):
+            if dia_semana < 5 and date.fromordinal(base + indice) not in feriados:
+                uteis.append(indice)
+                contagem += 1
+            acumulado[indice + 1] = contagem
+            dia_semana = (dia_semana + 1) % 7
+
+        self._base = base
+        self._acumulado = acumulado
+        self._uteis = uteis
+
+    def _indice(self, data):
+        data = _como_date(data)
+        indice = data.toordinal() - self._base
+        if indice < 0 or indice >= len(self._acumulado) - 1:
+            raise ValueError(
+                f"Data {data} fora do intervalo do calendário "
+                f"({self.ano_inicio}-{self.ano_fim})"
+            )
+        return indice
+
+    def _dia_util(self, posicao):
+        if posicao < 0 or posicao >= len(self._uteis):
+            raise ValueError(
+                f"Resultado fora do intervalo do calendário "
+                f"({self.ano_inicio}-{self.ano_fim})"
+            )
+        return date.fromordinal(self._base + self._uteis[posicao])
+
+    def eh_dia_util(self, data):
+        """
+        Verifica se uma data é dia útil.
+
+        Args:
+            data (date/datetime): Data a ser verificada
+
+        Returns:
+            bool: True se for dia útil, False caso contrário
+        """
+        indice = self._indice(data)
+        return self._acumulado[indice + 1] > self._acumulado[indice]
+
+    def dias_uteis_entre(self, data_inicio, data_fim):
+        """
+        Calcula o número de dias úteis entre duas datas (inclusive).
+
+        Args:
+            data_inicio (date/datetime): Data de início
+            data_fim (date/datetime): Data de fim
+
+        Returns:
+            int: Número de dias úteis
+        """
+        inicio = self._indice(data_inicio)
+        fim = self._indice(data_fim)
+        if inicio > fim:
+            inicio, fim = fim, inicio
+        return self._acumulado[fim + 1] - self._acumulado[inicio]
+
+    def adicionar_dias_uteis(self, data, dias):
+        """
+        Soma (ou subtrai, se negativo) um número de dias úteis a uma data.
+
+        Args:
+            data (date/datetime): Data de referência
+            dias (int): Quantidade de dias úteis
+
+        Returns:
+            date: Data resultante (a própria data se ``dias`` for zero)
+        """
+        indice = self._indice(data)
+        if dias > 0:
+            return self._dia_util(self._acumulado[indice + 1] + dias - 1)
+        if dias < 0:
+            return self._dia_util(self._acumulado[indice] + dias)
+        return _como_date(data)
+
+    def proximo_dia_util(self, data):
+        """
+        Retorna o primeiro dia útil depois de uma data.
+
+        Args:
+            data (date/datetime): Data de referência
+
+        Returns:
+            date: Próximo dia útil
+        """
+        return self.adicionar_dias_uteis(data, 1)
+
+    def dia_util_anterior(self, data):
+        """
+        Retorna o último dia útil antes de uma data.
+
+        Args:
+            data (date/datetime): Data de referência
+
+        Returns:
+            date: Dia útil anterior
+        """
+        return self.adicionar_dias_uteis(data, -1)
+
+
+class LinhaDoTempoFeriados:
+    """
+    Feriados de um intervalo de anos em ordem cronológica.
+
+    As consultas são pesquisas binárias (``bisect``) sobre a lista de datas;
+    os ``Feriado(data, nome)`` retornados são os próprios itens da linha do
+    tempo, sem cópias.
+
+    Args:
+        ano_inicio (int): Primeiro ano coberto
+        ano_fim (int): Último ano coberto
+        uf (str): Sigla da UF, para incluir os feriados estaduais
+        municipio (str): Código IBGE do município, para incluir os feriados
+            estaduais e municipais
+    """
+
+    def __init__(self, ano_inicio=1970, ano_fim=2100, uf=None, municipio=None):
+        if ano_inicio > ano_fim:
+            raise ValueError("ano_inicio deve ser menor ou igual a ano_fim")
+
+        self.ano_inicio = ano_inicio
+        self.ano_fim = ano_fim
+        self.inicio = date(ano_inicio, 1, 1)
+        self.fim = date(ano_fim, 12, 31)
+
+        feriados = []
+        for ano in range(ano_inicio, ano_fim + 1):
+            if uf is None and municipio is None:
+                # Monta a tabela diretamente para não ocupar o cache por ano
+                feriados.extend(_montar_tabela(ano).feriados)
+            else:
+                feriados.extend(listar_feriados(ano, uf, municipio))
+
+        self._feriados = feriados
+        self._datas = [feriado.data for feriado in feriados]
+
+    def _verificar(self, data):
+        data = _como_date(data)
+        if data < self.inicio or data > self.fim:
+            raise ValueError(
+                f"Data {data} fora do intervalo da linha do tempo "
+                f"({self.ano_inicio}-{self.ano_fim})"
+            )
+        return data
+
+    def __len__(self):
+        return len(self._feriados)
+
+    def __iter__(self):
+        return iter(self._feriados)
+
+    def proximo(self, data):
+        """
+        Retorna o primeiro feriado depois de uma data.
+
+        Args:
+            data (date/datetime): Data de referência
+
+        Returns:
+            Feriado: Feriado encontrado
+        """
+        indice = bisect_right(self._datas, self._verificar(data))
+        if indice == len(self._datas):
+            raise ValueError(
+                f"Resultado fora do intervalo da linha do tempo "
+                f"({self.ano_inicio}-{self.ano_fim})"
+            )
+        return self._feriados[indice]
+
+    def anterior(self, data):
+        """
+        Retorna o último feriado antes de uma data.
+
+        Args:
+            data (date/datetime): Data de referência
+
+        Returns:
+            Feriado: Feriado encontrado
+        """
+        indice = bisect_left(self._datas, self._verificar(data))
+        if indice == 0:
+            raise ValueError(
+                f"Resultado fora do intervalo da linha do tempo "
+                f"({self.ano_inicio}-{self.ano_fim})"
+            )
+        return self._feriados[indice - 1]
+
+    def proximos(self, data, quantidade):
+        """
+        Retorna os N primeiros feriados depois de uma data.
+
+        Args:
+            data (date/datetime): Data de referência
+            quantidade (int): Quantidade de feriados
+
+        Returns:
+            list: ``Feriado``, no máximo ``quantidade`` (menos se a linha do
+            tempo terminar antes)
+        """
+        indice = bisect_right(self._datas, self._verificar(data))
+        return self._feriados[indice:indice + quantidade]
+
+    def entre(self, data_inicio, data_fim):
+        """
+        Retorna os feriados entre duas datas (inclusive).
+
+        Args:
+            data_inicio (date/datetime): Data de início
+            data_fim (date/datetime): Data de fim
+
+        Returns:
+            list: ``Feriado`` em ordem cronológica
+        """
+        inicio = self._verificar(data_inicio)
+        fim = self._verificar(data_fim)
+        if inicio > fim:
+            inicio, fim = fim, inicio
+        return self._feriados[bisect_left(self._datas, inicio):bisect_right(self._datas, fim)]
+
+    def por_mes(self, ano, mes):
+        """
+        Retorna os feriados de um mês.
+
+        Args:
+            ano (int): Ano
+            mes (int): Mês (1-12)
+
+        Returns:
+            list: ``Feriado`` em ordem cronológica
+        """
+        inicio = self._verificar(date(ano, mes, 1))
+        fim = date(ano + 1, 1, 1) if mes == 12 else date(ano, mes + 1, 1)
+        return self._feriados[bisect_left(self._datas, inicio):bisect_left(self._datas, fim)]
+
+
+# Linha do tempo nacional usada por proximo_feriado e feriados_por_mes,
+# montada no primeiro uso para o intervalo da tabela da Páscoa
+_linha_do_tempo = None
+
+
+def _linha_do_tempo_nacional():
+    global _linha_do_tempo
+    if _linha_do_tempo is None:
+        _linha_do_tempo = LinhaDoTempoFeriados(ANO_INICIAL, ANO_FINAL)
+    return _linha_do_tempo
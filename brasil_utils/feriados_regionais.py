@@ -0,0 +1,358 @@
+"""
+Módulo de feriados estaduais e municipais.
+
+Os feriados são organizados em camadas: os nacionais (módulo ``feriados``),
+os de cada UF (chaveados pela sigla) e os de cada município (chaveados pelo
+código IBGE de 7 dígitos, o mesmo retornado por ``buscar_cep`` no campo
+``ibge``). Um município herda os feriados da sua UF, identificada pelos dois
+primeiros dígitos do código.
+
+As regras cadastradas são compiladas, ano a ano e sob demanda, em inteiros
+usados como conjuntos de bits (bit N = N-ésimo dia do ano). Verificar se uma
+data é feriado num município é uma consulta a dicionário seguida de um
+deslocamento de bits, independente de quantos municípios estejam carregados.
+"""
+
+import csv
+import threading
+from collections import namedtuple
+from datetime import date, timedelta
+
+from ._cache_anos import CacheAnos
+
+
+# Código IBGE de cada UF (dois primeiros dígitos do código do município)
+UFS_IBGE = {
+    '11': 'RO', '12': 'AC', '13': 'AM', '14': 'RR', '15': 'PA', '16': 'AP', '17': 'TO',
+    '21': 'MA', '22': 'PI', '23': 'CE', '24': 'RN', '25': 'PB', '26': 'PE', '27': 'AL',
+    '28': 'SE', '29': 'BA',
+    '31': 'MG', '32': 'ES', '33': 'RJ', '35': 'SP',
+    '41': 'PR', '42': 'SC', '43': 'RS',
+    '50': 'MS', '51': 'MT', '52': 'GO', '53': 'DF',
+}
+
+UFS = frozenset(UFS_IBGE.values())
+
+# Regra de um feriado: data fixa (dia/mês) ou deslocamento em dias a partir
+# da Páscoa, válida de ano_inicio a ano_fim (None para sem limite)
+RegraFeriado = namedtuple(
+    'RegraFeriado', ['nome', 'dia', 'mes', 'pascoa', 'ano_inicio', 'ano_fim']
+)
+
+# Feriados estaduais e municipais cadastrados por padrão
+FERIADOS_PADRAO = {
+    'AC': [('Dia do Evangélico', '23/01'), ('Aniversário do Acre', '15/06'),
+           ('Dia da Amazônia', '05/09'), ('Tratado de Petrópolis', '17/11')],
+    'AL': [('São João', '24/06'), ('São Pedro', '29/06'),
+           ('Emancipação Política de Alagoas', '16/09'), ('Consciência Negra', '20/11')],
+    'AM': [('Elevação do Amazonas a Província', '05/09'), ('Consciência Negra', '20/11')],
+    'AP': [('São José', '19/03'), ('Criação do Estado do Amapá', '13/09'),
+           ('Consciência Negra', '20/11')],
+    'BA': [('Independência da Bahia', '02/07')],
+    'CE': [('São José', '19/03'), ('Data Magna do Ceará', '25/03')],
+    'DF': [('Dia do Evangélico', '30/11')],
+    'MA': [('Adesão do Maranhão à Independência', '28/07')],
+    'MS': [('Criação do Estado de Mato Grosso do Sul', '11/10')],
+    'MT': [('Consciência Negra', '20/11')],
+    'PA': [('Adesão do Pará à Independência', '15/08')],
+    'PB': [('Fundação do Estado da Paraíba', '05/08')],
+    'PE': [('Revolução Pernambucana', '06/03')],
+    'PI': [('Dia do Piauí', '19/10')],
+    'PR': [('Emancipação Política do Paraná', '19/12')],
+    'RJ': [('São Jorge', '23/04'), ('Consciência Negra', '20/11')],
+    'RN': [('Mártires de Cunhaú e Uruaçu', '03/10')],
+    'RO': [('Criação do Estado de Rondônia', '04/01'), ('Dia do Evangélico', '18/06')],
+    'RR': [('Criação do Estado de Roraima', '05/10')],
+    'RS': [('Revolução Farroupilha', '20/09')],
+    'SE': [('Emancipação Política de Sergipe', '08/07')],
+    'SP': [('Revolução Constitucionalista', '09/07')],
+    'TO': [('Nossa Senhora da Natividade', '08/09'), ('Criação do Estado do Tocantins', '05/10')],
+    # Capitais
+    '3550308': [('Aniversário de São Paulo', '25/01'), ('Consciência Negra', '20/11')],
+    '3304557': [('São Sebastião', '20/01')],
+    '3106200': [('Assunção de Nossa Senhora', '15/08'), ('Imaculada Conceição', '08/12')],
+    '2927408': [('São João', '24/06'), ('Imaculada Conceição', '08/12')],
+    '4314902': [('Nossa Senhora dos Navegantes', '02/02')],
+    '4106902': [('Nossa Senhora da Luz dos Pinhais', '08/09')],
+}
+
+
+def normalizar_local(local):
+    """
+    Normaliza a chave de uma camada de feriados.
+
+    Args:
+        local (str/int): Sigla da UF (ex.: "SP") ou código IBGE do município
+            (ex.: 3550308)
+
+    Returns:
+        str: Sigla da UF em maiúsculas ou código IBGE com 7 dígitos
+    """
+    texto = str(local).strip().upper()
+    if texto in UFS:
+        return texto
+    if len(texto) == 7 and texto.isdigit() and texto[:2] in UFS_IBGE:
+        return texto
+    raise ValueError(f"UF ou código IBGE de município inválido: {local!r}")
+
+
+def interpretar_data_regra(texto):
+    """
+    Interpreta a data de uma regra de feriado.
+
+    Args:
+        texto (str): Data fixa "DD/MM" ou deslocamento a partir da Páscoa,
+            como "pascoa+60" ou "pascoa-2"
+
+    Returns:
+        tuple: (dia, mes, pascoa), com None nos campos não usados
+    """
+    texto = texto.strip().lower()
+    if texto.startswith('pascoa'):
+        deslocamento = texto[len('pascoa'):]
+        return None, None, int(deslocamento) if deslocamento else 0
+
+    dia, separador, mes = texto.partition('/')
+    if not separador:
+        raise ValueError(f"Data de feriado inválida: {texto!r} (use DD/MM ou pascoa+N)")
+    dia, mes = int(dia), int(mes)
+    # 2000 é bissexto: aceita 29/02
+    date(2000, mes, dia)
+    return dia, mes, None
+
+
+def _pascoa(ano):
+    # Importado aqui porque o módulo feriados importa este módulo
+    from .feriados import calcular_pascoa
+    return calcular_pascoa(ano)
+
+
+def _data_regra(regra, ano, pascoa):
+    if regra.ano_inicio is not None and ano < regra.ano_inicio:
+        return None
+    if regra.ano_fim is not None and ano > regra.ano_fim:
+        return None
+    if regra.pascoa is not None:
+        return pascoa + timedelta(days=regra.pascoa)
+    if regra.mes == 2 and regra.dia == 29 and not (ano % 4 == 0 and (ano % 100 or ano % 400 == 0)):
+        return None
+    return date(ano, regra.mes, regra.dia)
+
+
+# Tabela compilada de um ano: ``estados`` e ``municipios`` mapeiam a chave
+# para um inteiro com um bit por dia do ano (municípios já incluem a UF)
+_TabelaRegional = namedtuple('_TabelaRegional', ['base', 'estados', 'municipios'])
+
+
+class _CalendarioRegional:
+    """Regras de feriados regionais e suas tabelas compiladas por ano."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._regras = {}
+        # Cache LRU das tabelas, o mesmo usado pelos feriados nacionais
+        self.anos = CacheAnos(self._compilar)
+        # Incrementada a cada alteração, para invalidar caches derivados
+        self.versao = 0
+
+    def registrar(self, local, regra):
+        with self._lock:
+            self._regras.setdefault(local, []).append(regra)
+            self.versao += 1
+        self.anos.invalidar()
+
+    def limpar(self):
+        with self._lock:
+            self._regras.clear()
+            self.versao += 1
+        self.anos.invalidar()
+
+    def regras(self, local):
+        with self._lock:
+            return tuple(self._regras.get(local, ()))
+
+    def tabela(self, ano):
+        return self.anos.obter(ano)
+
+    def _compilar(self, ano):
+        base = date(ano, 1, 1).toordinal()
+        pascoa = _pascoa(ano)
+        estados = {}
+        municipios = {}
+
+        with self._lock:
+            for local, regras in self._regras.items():
+                bits = 0
+                for regra in regras:
+                    data = _data_regra(regra, ano, pascoa)
+                    if data is not None and data.year == ano:
+                        bits |= 1 << (data.toordinal() - base)
+                if local in UFS:
+                    estados[local] = estados.get(local, 0) | bits
+                else:
+                    municipios[local] = bits
+
+        for codigo in municipios:
+            municipios[codigo] |= estados.get(UFS_IBGE[codigo[:2]], 0)
+        return _TabelaRegional(base, estados, municipios)
+
+    def bits(self, ano, uf, municipio):
+        tabela = self.tabela(ano)
+        if municipio is not None:
+            bits = tabela.municipios.get(municipio)
+            if bits is None:
+                codigo = normalizar_local(municipio)
+                bits = tabela.municipios.get(codigo)
+                if bits is None:
+                    return tabela, tabela.estados.get(UFS_IBGE[codigo[:2]], 0)
+            return tabela, bits
+        elif uf is None:
+            return tabela, 0
+
+        bits = tabela.estados.get(uf)
+        if bits is None:
+            bits = tabela.estados.get(normalizar_local(uf), 0)
+        return tabela, bits
+
+
+_calendario = _CalendarioRegional()
+
+
+def _carregar_padrao():
+    for local, feriados in FERIADOS_PADRAO.items():
+        for nome, data in feriados:
+            registrar_feriado(local, nome, data)
+
+
+def registrar_feriado(local, nome, data, ano_inicio=None, ano_fim=None):
+    """
+    Cadastra um feriado estadual ou municipal.
+
+    Args:
+        local (str/int): Sigla da UF ou código IBGE do município
+        nome (str): Nome do feriado
+        data (str): Data fixa "DD/MM" ou deslocamento a partir da Páscoa,
+            como "pascoa+60"
+        ano_inicio (int): Primeiro ano em que o feriado vale (padrão: sempre)
+        ano_fim (int): Último ano em que o feriado vale (padrão: sempre)
+    """
+    dia, mes, pascoa = interpretar_data_regra(data)
+    _calendario.registrar(
+        normalizar_local(local), RegraFeriado(nome, dia, mes, pascoa, ano_inicio, ano_fim)
+    )
+
+
+def carregar_feriados(caminho, delimitador=','):
+    """
+    Cadastra feriados a partir de um arquivo CSV.
+
+    O arquivo deve ter as colunas ``local`` (UF ou código IBGE), ``nome`` e
+    ``data`` ("DD/MM" ou "pascoa+N") e, opcionalmente, ``ano_inicio`` e
+    ``ano_fim``.
+
+    Args:
+        caminho (str): Arquivo CSV
+        delimitador (str): Delimitador do CSV
+
+    Returns:
+        int: Quantidade de feriados cadastrados
+    """
+    quantidade = 0
+    with open(caminho, encoding='utf-8', newline='') as arquivo:
+        for linha in csv.DictReader(arquivo, delimiter=delimitador):
+            ano_inicio = linha.get('ano_inicio') or None
+            ano_fim = linha.get('ano_fim') or None
+            registrar_feriado(
+                linha['local'], linha['nome'], linha['data'],
+                ano_inicio=int(ano_inicio) if ano_inicio else None,
+                ano_fim=int(ano_fim) if ano_fim else None
+            )
+            quantidade += 1
+    return quantidade
+
+
+def limpar_feriados_regionais(restaurar_padrao=False):
+    """
+    Remove todos os feriados estaduais e municipais cadastrados.
+
+    Args:
+        restaurar_padrao (bool): Se os feriados de ``FERIADOS_PADRAO`` devem
+            ser cadastrados novamente
+    """
+    _calendario.limpar()
+    if restaurar_padrao:
+        _carregar_padrao()
+
+
+def feriados_regionais(ano, uf=None, municipio=None):
+    """
+    Retorna os feriados estaduais e municipais de um ano.
+
+    Args:
+        ano (int): Ano
+        uf (str): Sigla da UF
+        municipio (str/int): Código IBGE do município (a UF é deduzida do
+            código)
+
+    Returns:
+        dict: Dicionário com nome_feriado: data_feriado
+    """
+    locais = []
+    if municipio is not None:
+        municipio = normalizar_local(municipio)
+        locais = [UFS_IBGE[municipio[:2]], municipio]
+    elif uf is not None:
+        locais = [normalizar_local(uf)]
+
+    pascoa = _pascoa(ano)
+    feriados = {}
+    for local in locais:
+        for regra in _calendario.regras(local):
+            data = _data_regra(regra, ano, pascoa)
+            if data is not None and data.year == ano:
+                feriados[regra.nome] = data
+    return feriados
+
+
+def eh_feriado_regional(data, uf=None, municipio=None):
+    """
+    Verifica se uma data é feriado estadual ou municipal.
+
+    Não considera os feriados nacionais; veja ``feriados.eh_feriado``.
+
+    Args:
+        data (date): Data a ser verificada
+        uf (str): Sigla da UF
+        municipio (str): Código IBGE do município (a UF é deduzida do código)
+
+    Returns:
+        bool: True se for feriado na UF ou no município
+    """
+    tabela, bits = _calendario.bits(data.year, uf, municipio)
+    return (bits >> (data.toordinal() - tabela.base)) & 1 == 1
+
+
+def datas_feriados_regionais(ano, uf=None, municipio=None):
+    """
+    Retorna as datas dos feriados estaduais e municipais de um ano.
+
+    Args:
+        ano (int): Ano
+        uf (str): Sigla da UF
+        municipio (str): Código IBGE do município
+
+    Returns:
+        list: Datas em ordem crescente
+    """
+    tabela, bits = _calendario.bits(ano, uf, municipio)
+    datas = []
+    dia = 0
+    while bits:
+        if bits & 1:
+            datas.append(date.fromordinal(tabela.base + dia))
+        bits >>= 1
+        dia += 1
+    return datas
+
+
+_carregar_padrao()
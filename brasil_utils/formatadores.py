@@ -2,31 +2,53 @@
 Módulo para formatação de valores brasileiros (moeda, telefone, etc).
 """
 
-import locale
 from datetime import datetime, date
+from decimal import Decimal, Context, ROUND_HALF_EVEN
 import re
+import unicodedata
 
+from .datas import ConversorDatas
+from .metricas import instrumentar
 
-def formatar_real(valor, simbolo=True):
+
+# Converte o formato americano (1,234.56) no brasileiro (1.234,56) numa
+# única passada, sem depender do locale do processo
+_SEPARADORES_BR = str.maketrans(',.', '.,')
+
+_CENTAVO = Decimal('0.01')
+
+_NAO_DIGITO = re.compile(r'\D')
+
+
+def _formatar_decimal(valor, arredondamento):
+    # Precisão suficiente para os dígitos inteiros, os centavos e um possível
+    # "vai um" do arredondamento, sem depender do contexto decimal da thread
+    contexto = Context(prec=max(valor.adjusted() + 4, 1), rounding=arredondamento)
+    return f"{valor.quantize(_CENTAVO, context=contexto):,.2f}"
+
+
+@instrumentar()
+def formatar_real(valor, simbolo=True, arredondamento=ROUND_HALF_EVEN):
     """
     Formata um valor numérico como moeda brasileira (Real).
     
+    Não altera o locale do processo e pode ser usada de várias threads.
+    
     Args:
-        valor (float): Valor a ser formatado
+        valor (float/int/Decimal): Valor a ser formatado
         simbolo (bool): Se deve incluir o símbolo R$
+        arredondamento (str): Modo de arredondamento aplicado a valores
+            ``Decimal`` (ex.: ``decimal.ROUND_HALF_UP``)
         
     Returns:
         str: Valor formatado como moeda brasileira
     """
     try:
-        # Tenta usar a localização brasileira
-        try:
-            locale.setlocale(locale.LC_ALL, 'pt_BR.UTF-8')
-        except locale.Error:
-            # Fallback para formatação manual
-            pass
-        
-        valor_formatado = f"{valor:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
+        if isinstance(valor, Decimal):
+            valor_formatado = _formatar_decimal(valor, arredondamento)
+        else:
+            valor_formatado = f"{valor:,.2f}"
+        valor_formatado = valor_formatado.translate(_SEPARADORES_BR)
         
         if simbolo:
             return f"R$ {valor_formatado}"
@@ -36,6 +58,43 @@ def formatar_real(valor, simbolo=True):
         return str(valor)
 
 
+@instrumentar()
+def formatar_real_lote(valores, simbolo=True, arredondamento=ROUND_HALF_EVEN):
+    """
+    Formata vários valores como moeda brasileira.
+
+    Equivale a chamar formatar_real em cada valor, mas evita o custo por
+    chamada no caso comum de valores float e int.
+
+    Args:
+        valores: Sequência de valores ou array NumPy
+        simbolo (bool): Se deve incluir o símbolo R$
+        arredondamento (str): Modo de arredondamento aplicado a valores
+            ``Decimal``
+
+    Returns:
+        list: Valores formatados, na mesma ordem
+    """
+    if hasattr(valores, 'tolist'):
+        # Arrays NumPy: converte de uma vez para float/int do Python
+        valores = valores.tolist()
+
+    prefixo = "R$ " if simbolo else ""
+    separadores = _SEPARADORES_BR
+    resultado = []
+    adicionar = resultado.append
+
+    for valor in valores:
+        tipo = type(valor)
+        if tipo is float or tipo is int:
+            adicionar(prefixo + format(valor, ',.2f').translate(separadores))
+        else:
+            adicionar(formatar_real(valor, simbolo, arredondamento))
+
+    return resultado
+
+
+@instrumentar()
 def formatar_telefone(telefone):
     """
     Formata um número de telefone brasileiro.
@@ -47,7 +106,7 @@ def formatar_telefone(telefone):
         str: Telefone formatado ou string original se inválido
     """
     # Remove caracteres não numéricos
-    numeros = re.sub(r'\D', '', telefone)
+    numeros = _NAO_DIGITO.sub('', telefone)
     
     # Telefone com código do país (13 dígitos: +55 11 99999-9999)
     if len(numeros) == 13 and numeros.startswith('55'):
@@ -73,6 +132,11 @@ def formatar_telefone(telefone):
     return telefone
 
 
+# O último formato de entrada reconhecido é testado primeiro
+_conversor_datas = ConversorDatas()
+
+
+@instrumentar()
 def formatar_data_brasileira(data, formato="%d/%m/%Y"):
     """
     Formata uma data no padrão brasileiro.
@@ -86,20 +150,10 @@ def formatar_data_brasileira(data, formato="%d/%m/%Y"):
     """
     try:
         if isinstance(data, str):
-            # Tenta diferentes formatos de entrada
-            formatos_entrada = [
-                "%Y-%m-%d",
-                "%d/%m/%Y",
-                "%d-%m-%Y",
-                "%Y/%m/%d"
-            ]
-            
-            for fmt in formatos_entrada:
-                try:
-                    data = datetime.strptime(data, fmt).date()
-                    break
-                except ValueError:
-                    continue
+            # Detecta o formato de entrada (ISO ou brasileiro)
+            convertida = _conversor_datas.converter(data)
+            if convertida is not None:
+                data = convertida
         
         if isinstance(data, datetime):
             data = data.date()
@@ -113,6 +167,7 @@ def formatar_data_brasileira(data, formato="%d/%m/%Y"):
         return str(data)
 
 
+@instrumentar()
 def formatar_porcentagem(valor, casas_decimais=2):
     """
     Formata um valor como porcentagem brasileira.
@@ -135,33 +190,90 @@ def formatar_porcentagem(valor, casas_decimais=2):
         return str(valor)
 
 
+# Letras latinas que não se decompõem em letra base + diacrítico no Unicode
+_LETRAS_SEM_DECOMPOSICAO = {
+    'Ø': 'O', 'ø': 'o', 'Đ': 'D', 'đ': 'd', 'Ð': 'D', 'ð': 'd',
+    'Ħ': 'H', 'ħ': 'h', 'Ł': 'L', 'ł': 'l', 'Ŀ': 'L', 'ŀ': 'l',
+    'Ŧ': 'T', 'ŧ': 't', 'Ƀ': 'B', 'ƀ': 'b', 'Ɨ': 'I', 'ɨ': 'i',
+    'Ƶ': 'Z', 'ƶ': 'z', 'Ɇ': 'E', 'ɇ': 'e', 'ı': 'i',
+}
+
+
+def _montar_tabela_acentos():
+    tabela = {}
+
+    # Diacríticos soltos (texto já decomposto) são simplesmente removidos
+    for codigo in range(0x0300, 0x0370):
+        tabela[codigo] = None
+
+    # Blocos Latin-1, Latin Extended-A/B e Latin Extended Additional
+    faixas = (range(0x00C0, 0x0250), range(0x1E00, 0x1F00))
+    for faixa in faixas:
+        for codigo in faixa:
+            decomposto = unicodedata.normalize('NFD', chr(codigo))
+            sem_acento = ''.join(c for c in decomposto if not unicodedata.combining(c))
+            if sem_acento != chr(codigo) and sem_acento.isascii():
+                tabela[codigo] = sem_acento
+
+    for letra, sem_acento in _LETRAS_SEM_DECOMPOSICAO.items():
+        tabela[ord(letra)] = sem_acento
+
+    return tabela
+
+
+# Tabela de tradução pré-calculada: uma única passada por texto
+_TABELA_ACENTOS = _montar_tabela_acentos()
+
+
+@instrumentar()
 def remover_acentos(texto):
     """
     Remove acentos de um texto.
     
+    Cobre todas as letras latinas com diacríticos (não só as do português).
+    
     Args:
         texto (str): Texto a ser processado
         
     Returns:
         str: Texto sem acentos
     """
-    acentos = {
-        'á': 'a', 'à': 'a', 'ã': 'a', 'â': 'a', 'ä': 'a',
-        'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
-        'í': 'i', 'ì': 'i', 'î': 'i', 'ï': 'i',
-        'ó': 'o', 'ò': 'o', 'õ': 'o', 'ô': 'o', 'ö': 'o',
-        'ú': 'u', 'ù': 'u', 'û': 'u', 'ü': 'u',
-        'ç': 'c', 'ñ': 'n',
-        'Á': 'A', 'À': 'A', 'Ã': 'A', 'Â': 'A', 'Ä': 'A',
-        'É': 'E', 'È': 'E', 'Ê': 'E', 'Ë': 'E',
-        'Í': 'I', 'Ì': 'I', 'Î': 'I', 'Ï': 'I',
-        'Ó': 'O', 'Ò': 'O', 'Õ': 'O', 'Ô': 'O', 'Ö': 'O',
-        'Ú': 'U', 'Ù': 'U', 'Û': 'U', 'Ü': 'U',
-        'Ç': 'C', 'Ñ': 'N'
-    }
-    
-    resultado = texto
-    for acento, sem_acento in acentos.items():
-        resultado = resultado.replace(acento, sem_acento)
-    
-    return resultado
+    if texto.isascii():
+        return texto
+    return texto.translate(_TABELA_ACENTOS)
+
+
+def remover_acentos_linhas(linhas):
+    """
+    Remove acentos de cada linha de um iterável, sob demanda.
+
+    Args:
+        linhas (iterable): Linhas de texto (ex.: um arquivo aberto)
+
+    Yields:
+        str: Linha sem acentos
+    """
+    tabela = _TABELA_ACENTOS
+    for linha in linhas:
+        yield linha if linha.isascii() else linha.translate(tabela)
+
+
+def remover_acentos_arquivo(entrada, saida, encoding='utf-8'):
+    """
+    Remove acentos de um arquivo de texto, linha a linha, com memória constante.
+
+    Args:
+        entrada (str): Arquivo de entrada
+        saida (str): Arquivo de saída
+        encoding (str): Codificação dos arquivos
+
+    Returns:
+        int: Quantidade de linhas processadas
+    """
+    quantidade = 0
+    with open(entrada, encoding=encoding, newline='') as arquivo_entrada, \
+            open(saida, 'w', encoding=encoding, newline='') as arquivo_saida:
+        for linha in remover_acentos_linhas(arquivo_entrada):
+            arquivo_saida.write(linha)
+            quantidade += 1
+    return quantidade
@@ -0,0 +1,283 @@
+"""
+Módulo para geração de CPFs e CNPJs sintéticos (para testes e carga).
+
+Os dígitos verificadores são calculados diretamente, sem sortear e validar
+até acertar. Documentos inválidos têm exatamente um dígito verificador
+alterado, de modo que falham apenas na verificação do dígito. Com a mesma
+semente, o mesmo ``GeradorDocumentos`` produz sempre a mesma sequência.
+
+Em lote (requer NumPy), os documentos são gerados como arrays de bytes de
+largura fixa (dtype ``S11``/``S14``, ou ``S14``/``S18`` formatados), que
+podem ser validados diretamente por ``validar_cpf_lote``/``validar_cnpj_lote``
+ou gravados em arquivo, um documento por linha.
+"""
+
+import random
+
+from ._dependencias import exigir_numpy
+from .validadores import calcular_digitos, calcular_digitos_lote
+
+
+# Modelos de formatação e posição de cada dígito no texto formatado
+_MODELO_CPF = b"000.000.000-00"
+_MODELO_CNPJ = b"00.000.000/0000-00"
+_POSICOES_CPF = (0, 1, 2, 4, 5, 6, 8, 9, 10, 12, 13)
+_POSICOES_CNPJ = (0, 1, 3, 4, 5, 7, 8, 9, 11, 12, 13, 14, 16, 17)
+
+TAMANHO_LOTE_PADRAO = 1_000_000
+
+
+_MENSAGEM_NUMPY = "A geração em lote requer o NumPy."
+
+
+def _completar(digitos, tipo):
+    # Acrescenta os dois dígitos verificadores
+    digitos.extend(map(int, calcular_digitos(''.join(map(str, digitos)), tipo)))
+    return digitos
+
+
+def _digitos_filial(filial):
+    if not 0 < filial < 10000:
+        raise ValueError(f"Número de filial inválido: {filial!r} (use 1 a 9999)")
+    return [int(d) for d in f"{filial:04d}"]
+
+
+class GeradorDocumentos:
+    """
+    Gerador reprodutível de CPFs e CNPJs sintéticos.
+
+    Args:
+        semente (int): Semente do gerador aleatório (None para uma
+            sequência diferente a cada execução)
+    """
+
+    def __init__(self, semente=None):
+        self.semente = semente
+        self._aleatorio = random.Random(semente)
+        self._rng = None
+
+    def _gerador_numpy(self):
+        if self._rng is None:
+            self._rng = exigir_numpy(_MENSAGEM_NUMPY).random.default_rng(self.semente)
+        return self._rng
+
+    def _alterar(self, digitos):
+        # Soma 1 a 9 (módulo 10) a um dos dois dígitos verificadores
+        posicao = len(digitos) - self._aleatorio.randint(1, 2)
+        digitos[posicao] = (digitos[posicao] + self._aleatorio.randint(1, 9)) % 10
+
+    def cpf(self, valido=True, formatado=False):
+        """
+        Gera um CPF.
+
+        Args:
+            valido (bool): Se False, um dos dígitos verificadores é alterado
+            formatado (bool): Se o CPF deve ter pontos e hífen
+
+        Returns:
+            str: CPF gerado
+        """
+        aleatorio = self._aleatorio
+        while True:
+            digitos = _completar([aleatorio.randrange(10) for _ in range(9)], 'cpf')
+            if len(set(digitos)) > 1:
+                break
+        if not valido:
+            self._alterar(digitos)
+
+        texto = ''.join(map(str, digitos))
+        if formatado:
+            return f"{texto[:3]}.{texto[3:6]}.{texto[6:9]}-{texto[9:]}"
+        return texto
+
+    def cnpj(self, valido=True, formatado=False, filial=1):
+        """
+        Gera um CNPJ.
+
+        Args:
+            valido (bool): Se False, um dos dígitos verificadores é alterado
+            formatado (bool): Se o CNPJ deve ter pontos, barra e hífen
+            filial (int): Número do estabelecimento (1 para a matriz, "0001";
+                None para sortear entre 1 e 9999)
+
+        Returns:
+            str: CNPJ gerado
+        """
+        aleatorio = self._aleatorio
+        if filial is None:
+            filial = aleatorio.randint(1, 9999)
+        sufixo = _digitos_filial(filial)
+        while True:
+            digitos = [aleatorio.randrange(10) for _ in range(8)] + sufixo
+            digitos = _completar(digitos, 'cnpj')
+            if len(set(digitos)) > 1:
+                break
+        if not valido:
+            self._alterar(digitos)
+
+        texto = ''.join(map(str, digitos))
+        if formatado:
+            return f"{texto[:2]}.{texto[2:5]}.{texto[5:8]}/{texto[8:12]}-{texto[12:]}"
+        return texto
+
+    def _lote(self, quantidade, base, tipo, proporcao_validos, formatado, modelo, posicoes):
+        np = exigir_numpy(_MENSAGEM_NUMPY)
+        rng = self._gerador_numpy()
+
+        matriz = np.empty((quantidade, base.shape[1] + 2), dtype=np.int64)
+        matriz[:, :-2] = base
+        while True:
+            matriz[:, -2:] = calcular_digitos_lote(matriz[:, :-2], tipo)
+            # Documentos com todos os dígitos iguais são sempre inválidos
+            repetidos = np.flatnonzero((matriz == matriz[:, :1]).all(axis=1))
+            if not repetidos.size:
+                break
+            # Sorteia de novo a raiz (8 primeiros dígitos) desses documentos
+            matriz[repetidos, :8] = rng.integers(0, 10, size=(repetidos.size, 8))
+
+        invalidos = np.flatnonzero(rng.random(quantidade) >= proporcao_validos)
+        colunas = matriz.shape[1] - rng.integers(1, 3, size=invalidos.size)
+        matriz[invalidos, colunas] = (
+            matriz[invalidos, colunas] + rng.integers(1, 10, size=invalidos.size)
+        ) % 10
+
+        if formatado:
+            codigos = np.tile(np.frombuffer(modelo, dtype=np.uint8), (quantidade, 1))
+            codigos[:, list(posicoes)] = matriz + 48
+        else:
+            codigos = (matriz + 48).astype(np.uint8)
+        return codigos
+
+    def _codigos_cpf(self, quantidade, proporcao_validos=1.0, formatado=False):
+        rng = self._gerador_numpy()
+        base = rng.integers(0, 10, size=(quantidade, 9))
+        return self._lote(
+            quantidade, base, 'cpf', proporcao_validos, formatado, _MODELO_CPF, _POSICOES_CPF
+        )
+
+    def _codigos_cnpj(self, quantidade, proporcao_validos=1.0, formatado=False, filial=1):
+        np = exigir_numpy(_MENSAGEM_NUMPY)
+        rng = self._gerador_numpy()
+        base = np.empty((quantidade, 12), dtype=np.int64)
+        base[:, :8] = rng.integers(0, 10, size=(quantidade, 8))
+        if filial is None:
+            numeros = rng.integers(1, 10000, size=quantidade)
+            for coluna, divisor in enumerate((1000, 100, 10, 1)):
+                base[:, 8 + coluna] = numeros // divisor % 10
+        else:
+            base[:, 8:] = _digitos_filial(filial)
+        return self._lote(
+            quantidade, base, 'cnpj', proporcao_validos, formatado, _MODELO_CNPJ,
+            _POSICOES_CNPJ
+        )
+
+    def lote_cpf(self, quantidade, proporcao_validos=1.0, formatado=False):
+        """
+        Gera vários CPFs de uma vez (requer NumPy).
+
+        Args:
+            quantidade (int): Quantidade de CPFs
+            proporcao_validos (float): Fração esperada de CPFs válidos (0 a 1)
+            formatado (bool): Se os CPFs devem ter pontos e hífen
+
+        Returns:
+            numpy.ndarray: Array de bytes (dtype ``S11`` ou ``S14``); use
+            ``.astype(str)`` para obter strings
+        """
+        codigos = self._codigos_cpf(quantidade, proporcao_validos, formatado)
+        return codigos.view(f"S{codigos.shape[1]}").reshape(quantidade)
+
+    def lote_cnpj(self, quantidade, proporcao_validos=1.0, formatado=False, filial=1):
+        """
+        Gera vários CNPJs de uma vez (requer NumPy).
+
+        Args:
+            quantidade (int): Quantidade de CNPJs
+            proporcao_validos (float): Fração esperada de CNPJs válidos (0 a 1)
+            formatado (bool): Se os CNPJs devem ter pontos, barra e hífen
+            filial (int): Número do estabelecimento (None para sortear)
+
+        Returns:
+            numpy.ndarray: Array de bytes (dtype ``S14`` ou ``S18``)
+        """
+        codigos = self._codigos_cnpj(quantidade, proporcao_validos, formatado, filial)
+        return codigos.view(f"S{codigos.shape[1]}").reshape(quantidade)
+
+    def lotes(self, tipo, quantidade, tamanho_lote=TAMANHO_LOTE_PADRAO, **opcoes):
+        """
+        Gera documentos em lotes, sob demanda (requer NumPy).
+
+        Args:
+            tipo (str): "cpf" ou "cnpj"
+            quantidade (int): Quantidade total de documentos
+            tamanho_lote (int): Documentos por lote
+            **opcoes: Repassadas a ``lote_cpf``/``lote_cnpj``
+
+        Yields:
+            numpy.ndarray: Próximo lote
+        """
+        gerar = self._funcao_lote(tipo, 'lote')
+        for inicio in range(0, quantidade, tamanho_lote):
+            yield gerar(min(tamanho_lote, quantidade - inicio), **opcoes)
+
+    def gravar(self, destino, tipo, quantidade, tamanho_lote=TAMANHO_LOTE_PADRAO, **opcoes):
+        """
+        Grava documentos em um arquivo, um por linha (requer NumPy).
+
+        Args:
+            destino (str): Caminho do arquivo
+            tipo (str): "cpf" ou "cnpj"
+            quantidade (int): Quantidade de documentos
+            tamanho_lote (int): Documentos gerados por vez
+            **opcoes: Repassadas a ``lote_cpf``/``lote_cnpj``
+
+        Returns:
+            int: Quantidade de documentos gravados
+        """
+        np = exigir_numpy(_MENSAGEM_NUMPY)
+        gerar = self._funcao_lote(tipo, '_codigos')
+        with open(destino, 'wb') as arquivo:
+            for inicio in range(0, quantidade, tamanho_lote):
+                codigos = gerar(min(tamanho_lote, quantidade - inicio), **opcoes)
+                linhas = np.empty((codigos.shape[0], codigos.shape[1] + 1), dtype=np.uint8)
+                linhas[:, :-1] = codigos
+                linhas[:, -1] = ord('\n')
+                arquivo.write(linhas.tobytes())
+        return quantidade
+
+    def _funcao_lote(self, tipo, prefixo):
+        if tipo not in ('cpf', 'cnpj'):
+            raise ValueError(f"Tipo de documento inválido: {tipo!r} (use 'cpf' ou 'cnpj')")
+        return getattr(self, f"{prefixo}_{tipo}")
+
+
+_gerador = GeradorDocumentos()
+
+
+def gerar_cpf(valido=True, formatado=False):
+    """
+    Gera um CPF aleatório.
+
+    Args:
+        valido (bool): Se False, um dos dígitos verificadores é alterado
+        formatado (bool): Se o CPF deve ter pontos e hífen
+
+    Returns:
+        str: CPF gerado
+    """
+    return _gerador.cpf(valido, formatado)
+
+
+def gerar_cnpj(valido=True, formatado=False, filial=1):
+    """
+    Gera um CNPJ aleatório.
+
+    Args:
+        valido (bool): Se False, um dos dígitos verificadores é alterado
+        formatado (bool): Se o CNPJ deve ter pontos, barra e hífen
+        filial (int): Número do estabelecimento (None para sortear)
+
+    Returns:
+        str: CNPJ gerado
+    """
+    return _gerador.cnpj(valido, formatado, filial)
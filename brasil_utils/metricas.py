@@ -0,0 +1,302 @@
+"""
+Instrumentação opcional das funções da biblioteca.
+
+Desativada por padrão: cada função instrumentada apenas verifica uma flag
+global e chama a original. Com ``ativar_metricas()`` (ou a variável de
+ambiente ``BRASIL_UTILS_METRICAS=1``), passam a ser registrados, por função:
+
+- o número de chamadas por resultado (ex.: ``valido``/``invalido`` nos
+  validadores, ``nao_encontrado`` em ``buscar_cep``, ou o nome da exceção
+  lançada);
+- um histograma de latência, em segundos.
+
+Só a chamada mais externa é registrada: ``formatar_cpf`` chamando
+``validar_cpf``, por exemplo, conta uma chamada de ``formatar_cpf`` apenas.
+
+Os dados podem ser lidos com ``obter_metricas()`` ou exportados no formato
+texto do Prometheus com ``exportar_prometheus()``, inclusive por um servidor
+HTTP local (``iniciar_servidor_metricas``).
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from functools import wraps
+from time import perf_counter
+
+
+# Limites superiores (em segundos) dos baldes do histograma de latência
+LIMITES_LATENCIA = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005,
+    0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0
+)
+
+PREFIXO_PROMETHEUS = "brasil_utils"
+
+_ativo = os.environ.get("BRASIL_UTILS_METRICAS", "") not in ("", "0")
+
+
+class _EstatisticaFuncao:
+    __slots__ = ('resultados', 'baldes', 'soma')
+
+    def __init__(self):
+        self.resultados = {}
+        # Um balde por limite e um último para valores acima de todos eles
+        self.baldes = [0] * (len(LIMITES_LATENCIA) + 1)
+        self.soma = 0.0
+
+
+class _RegistroMetricas:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._funcoes = {}
+        self._contadores = {}
+
+    def registrar(self, nome, resultado, segundos):
+        balde = bisect_left(LIMITES_LATENCIA, segundos)
+        with self._lock:
+            estatistica = self._funcoes.get(nome)
+            if estatistica is None:
+                estatistica = self._funcoes[nome] = _EstatisticaFuncao()
+            resultados = estatistica.resultados
+            resultados[resultado] = resultados.get(resultado, 0) + 1
+            estatistica.baldes[balde] += 1
+            estatistica.soma += segundos
+
+    def incrementar(self, nome, quantidade):
+        with self._lock:
+            self._contadores[nome] = self._contadores.get(nome, 0) + quantidade
+
+    def zerar(self):
+        with self._lock:
+            self._funcoes.clear()
+            self._contadores.clear()
+
+    def copiar(self):
+        with self._lock:
+            funcoes = {}
+            for nome, estatistica in self._funcoes.items():
+                acumulado = 0
+                baldes = {}
+                for limite, quantidade in zip(LIMITES_LATENCIA + (float('inf'),),
+                                              estatistica.baldes):
+                    acumulado += quantidade
+                    baldes[limite] = acumulado
+                funcoes[nome] = {
+                    'chamadas': acumulado,
+                    'resultados': dict(estatistica.resultados),
+                    'latencia': {
+                        'contagem': acumulado,
+                        'soma': estatistica.soma,
+                        'baldes': baldes
+                    }
+                }
+            return {'funcoes': funcoes, 'contadores': dict(self._contadores)}
+
+
+_registro = _RegistroMetricas()
+
+# Marca, por thread, que uma função instrumentada está em execução
+_execucao = threading.local()
+
+
+def ativar_metricas():
+    """Passa a registrar as métricas das funções instrumentadas."""
+    global _ativo
+    _ativo = True
+
+
+def desativar_metricas():
+    """Para de registrar métricas (os valores já coletados são mantidos)."""
+    global _ativo
+    _ativo = False
+
+
+def metricas_ativas():
+    """
+    Indica se as métricas estão sendo registradas.
+
+    Returns:
+        bool: True se ativadas
+    """
+    return _ativo
+
+
+def zerar_metricas():
+    """Descarta todas as métricas coletadas."""
+    _registro.zerar()
+
+
+def registrar_chamada(nome, resultado, segundos):
+    """
+    Registra manualmente uma chamada (ignorado se as métricas estiverem
+    desativadas).
+
+    Args:
+        nome (str): Nome da operação
+        resultado (str): Resultado da chamada (ex.: "ok", "erro")
+        segundos (float): Duração da chamada
+    """
+    if _ativo:
+        _registro.registrar(nome, resultado, segundos)
+
+
+def incrementar(nome, quantidade=1):
+    """
+    Soma a um contador avulso (ignorado se as métricas estiverem
+    desativadas).
+
+    Args:
+        nome (str): Nome do contador
+        quantidade (int): Valor a ser somado
+    """
+    if _ativo:
+        _registro.incrementar(nome, quantidade)
+
+
+def instrumentar(nome=None, classificar=None):
+    """
+    Decorador que registra chamadas, resultado e latência de uma função.
+
+    Chamadas feitas de dentro de outra função instrumentada (na mesma
+    thread) não são registradas.
+
+    Args:
+        nome (str): Nome da métrica (padrão: o nome da função)
+        classificar (callable): Converte o valor retornado no rótulo do
+            resultado (padrão: sempre "ok"); exceções são registradas com o
+            nome da classe e relançadas
+
+    Returns:
+        callable: Decorador
+    """
+    def decorador(funcao):
+        rotulo = nome or funcao.__name__
+
+        @wraps(funcao)
+        def instrumentada(*args, **kwargs):
+            # Chamadas internas de outra função instrumentada não são contadas
+            if not _ativo or getattr(_execucao, 'ativa', False):
+                return funcao(*args, **kwargs)
+            _execucao.ativa = True
+            inicio = perf_counter()
+            try:
+                retorno = funcao(*args, **kwargs)
+            except Exception as erro:
+                _registro.registrar(rotulo, type(erro).__name__, perf_counter() - inicio)
+                raise
+            finally:
+                _execucao.ativa = False
+            duracao = perf_counter() - inicio
+            resultado = classificar(retorno) if classificar is not None else 'ok'
+            _registro.registrar(rotulo, resultado, duracao)
+            return retorno
+
+        return instrumentada
+    return decorador
+
+
+def classificar_validacao(valido):
+    """Rótulo de resultado dos validadores: "valido" ou "invalido"."""
+    return 'valido' if valido else 'invalido'
+
+
+def obter_metricas():
+    """
+    Retorna uma cópia das métricas coletadas.
+
+    Returns:
+        dict: ``{"funcoes": {nome: {"chamadas", "resultados", "latencia"}},
+        "contadores": {nome: valor}}``; os baldes da latência são
+        cumulativos, indexados pelo limite superior em segundos
+    """
+    return _registro.copiar()
+
+
+def _escapar(valor):
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _formatar_limite(limite):
+    return '+Inf' if limite == float('inf') else repr(limite)
+
+
+def exportar_prometheus():
+    """
+    Exporta as métricas no formato texto do Prometheus (versão 0.0.4).
+
+    Returns:
+        str: Métricas ``brasil_utils_chamadas_total``,
+        ``brasil_utils_latencia_segundos`` e ``brasil_utils_<contador>_total``
+    """
+    dados = obter_metricas()
+    funcoes = sorted(dados['funcoes'].items())
+    chamadas = f"{PREFIXO_PROMETHEUS}_chamadas_total"
+    latencia = f"{PREFIXO_PROMETHEUS}_latencia_segundos"
+
+    linhas = [
+        f"# HELP {chamadas} Chamadas das funções instrumentadas, por resultado.",
+        f"# TYPE {chamadas} counter",
+    ]
+    for nome, estatistica in funcoes:
+        for resultado, quantidade in sorted(estatistica['resultados'].items()):
+            linhas.append(
+                f'{chamadas}{{funcao="{_escapar(nome)}",resultado="{_escapar(resultado)}"}} '
+                f'{quantidade}'
+            )
+
+    linhas += [
+        f"# HELP {latencia} Latência das funções instrumentadas.",
+        f"# TYPE {latencia} histogram",
+    ]
+    for nome, estatistica in funcoes:
+        funcao = f'funcao="{_escapar(nome)}"'
+        historico = estatistica['latencia']
+        for limite, quantidade in historico['baldes'].items():
+            linhas.append(
+                f'{latencia}_bucket{{{funcao},le="{_formatar_limite(limite)}"}} {quantidade}'
+            )
+        linhas.append(f"{latencia}_sum{{{funcao}}} {historico['soma']!r}")
+        linhas.append(f"{latencia}_count{{{funcao}}} {historico['contagem']}")
+
+    for nome, valor in sorted(dados['contadores'].items()):
+        metrica = f"{PREFIXO_PROMETHEUS}_{nome}_total"
+        linhas += [f"# TYPE {metrica} counter", f"{metrica} {valor}"]
+
+    return "\n".join(linhas) + "\n"
+
+
+def iniciar_servidor_metricas(porta=9464, endereco="127.0.0.1"):
+    """
+    Inicia, em uma thread de fundo, um servidor HTTP que responde com
+    ``exportar_prometheus()`` (em qualquer caminho, ex.: ``/metrics``).
+
+    Args:
+        porta (int): Porta TCP (0 para escolher uma livre)
+        endereco (str): Endereço de escuta (padrão: apenas local)
+
+    Returns:
+        http.server.ThreadingHTTPServer: Servidor em execução; use
+        ``server_address`` para a porta escolhida e ``shutdown()`` para parar
+    """
+    # Importado apenas aqui: o http.server não é necessário para coletar
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _Manipulador(BaseHTTPRequestHandler):
+        def do_GET(self):
+            corpo = exportar_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def log_message(self, formato, *args):
+            pass
+
+    servidor = ThreadingHTTPServer((endereco, porta), _Manipulador)
+    servidor.daemon_threads = True
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True,
+                              name="brasil_utils-metricas")
+    thread.start()
+    return servidor
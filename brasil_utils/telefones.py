@@ -0,0 +1,198 @@
+"""
+Módulo para interpretação e validação de telefones brasileiros.
+
+Diferente de ``formatadores.formatar_telefone``, que apenas formata, este
+módulo valida o DDD contra a tabela oficial de códigos de área, classifica
+o número (celular, fixo ou 0800) e gera a representação E.164.
+"""
+
+import re
+
+
+# Códigos de área (DDD) em uso no Brasil
+DDDS = frozenset({
+    11, 12, 13, 14, 15, 16, 17, 18, 19,
+    21, 22, 24, 27, 28,
+    31, 32, 33, 34, 35, 37, 38,
+    41, 42, 43, 44, 45, 46, 47, 48, 49,
+    51, 53, 54, 55,
+    61, 62, 63, 64, 65, 66, 67, 68, 69,
+    71, 73, 74, 75, 77, 79,
+    81, 82, 83, 84, 85, 86, 87, 88, 89,
+    91, 92, 93, 94, 95, 96, 97, 98, 99,
+})
+
+CELULAR = 'celular'
+FIXO = 'fixo'
+GRATUITO = 'gratuito'
+
+_NAO_DIGITO = re.compile(r'\D')
+
+# DDDs como texto de dois dígitos, para evitar int() a cada número
+_DDDS_TEXTO = frozenset(str(ddd) for ddd in DDDS)
+
+# Primeiro dígito de um número fixo
+_INICIO_FIXO = frozenset('2345')
+
+
+class TelefoneBR:
+    """
+    Telefone brasileiro já interpretado e validado.
+
+    Args:
+        ddd (str): Código de área com dois dígitos (None para números sem
+            DDD e para 0800)
+        numero (str): Número local (8 ou 9 dígitos) ou, para 0800, os sete
+            dígitos após o prefixo
+        tipo (str): ``CELULAR``, ``FIXO`` ou ``GRATUITO``
+    """
+
+    __slots__ = ('ddd', 'numero', 'tipo')
+
+    def __init__(self, ddd, numero, tipo):
+        self.ddd = ddd
+        self.numero = numero
+        self.tipo = tipo
+
+    @classmethod
+    def analisar(cls, telefone, ddd_padrao=None):
+        """
+        Interpreta um telefone em qualquer formatação.
+
+        Args:
+            telefone (str): Telefone com ou sem DDD, código do país ou
+                formatação
+            ddd_padrao (str): DDD assumido quando o número não tem DDD
+
+        Returns:
+            TelefoneBR: Telefone interpretado ou None se inválido
+        """
+        return _analisar(_NAO_DIGITO.sub('', str(telefone)), ddd_padrao)
+
+    @property
+    def e164(self):
+        """str: Número no formato E.164 (ex.: +5511999887766) ou None sem DDD."""
+        if self.tipo == GRATUITO:
+            return f"+55800{self.numero}"
+        if self.ddd is None:
+            return None
+        return f"+55{self.ddd}{self.numero}"
+
+    @property
+    def formatado(self):
+        """str: Número formatado no padrão brasileiro."""
+        numero = self.numero
+        if self.tipo == GRATUITO:
+            return f"0800 {numero[:3]} {numero[3:]}"
+        local = f"{numero[:-4]}-{numero[-4:]}"
+        if self.ddd is None:
+            return local
+        return f"({self.ddd}) {local}"
+
+    def __eq__(self, outro):
+        if not isinstance(outro, TelefoneBR):
+            return NotImplemented
+        return (self.ddd, self.numero, self.tipo) == (outro.ddd, outro.numero, outro.tipo)
+
+    def __hash__(self):
+        return hash((self.ddd, self.numero, self.tipo))
+
+    def __repr__(self):
+        return f"TelefoneBR(ddd={self.ddd!r}, numero={self.numero!r}, tipo={self.tipo!r})"
+
+
+def _analisar(numeros, ddd_padrao):
+    tamanho = len(numeros)
+
+    if tamanho == 11 and numeros.startswith('0800'):
+        return TelefoneBR(None, numeros[4:], GRATUITO)
+
+    # Código do país (55) ou prefixo de discagem nacional (0)
+    if tamanho in (12, 13) and numeros.startswith('55'):
+        numeros = numeros[2:]
+        tamanho -= 2
+    elif tamanho in (11, 12) and numeros[0] == '0':
+        numeros = numeros[1:]
+        tamanho -= 1
+
+    if tamanho in (10, 11):
+        ddd = numeros[:2]
+        numero = numeros[2:]
+    elif tamanho in (8, 9):
+        ddd = None if ddd_padrao is None else str(ddd_padrao)
+        numero = numeros
+    else:
+        return None
+
+    if ddd is not None and ddd not in _DDDS_TEXTO:
+        return None
+
+    if len(numero) == 9:
+        if numero[0] != '9':
+            return None
+        return TelefoneBR(ddd, numero, CELULAR)
+
+    if numero[0] not in _INICIO_FIXO:
+        return None
+    return TelefoneBR(ddd, numero, FIXO)
+
+
+def analisar_telefone(telefone, ddd_padrao=None):
+    """
+    Interpreta e valida um telefone brasileiro.
+
+    Args:
+        telefone (str): Telefone em qualquer formatação
+        ddd_padrao (str): DDD assumido quando o número não tem DDD
+
+    Returns:
+        TelefoneBR: Telefone interpretado ou None se inválido
+    """
+    return TelefoneBR.analisar(telefone, ddd_padrao)
+
+
+def validar_telefone(telefone):
+    """
+    Valida um telefone brasileiro (DDD, tamanho e prefixo).
+
+    Args:
+        telefone (str): Telefone em qualquer formatação
+
+    Returns:
+        bool: True se o telefone for válido, False caso contrário
+    """
+    return TelefoneBR.analisar(telefone) is not None
+
+
+def analisar_telefones(telefones, ddd_padrao=None):
+    """
+    Interpreta vários telefones de uma vez.
+
+    Args:
+        telefones (iterable): Telefones em qualquer formatação
+        ddd_padrao (str): DDD assumido quando o número não tem DDD
+
+    Returns:
+        list: ``TelefoneBR`` ou None (inválido) para cada entrada
+    """
+    limpar = _NAO_DIGITO.sub
+    analisar = _analisar
+    return [analisar(limpar('', str(telefone)), ddd_padrao) for telefone in telefones]
+
+
+def classificar_telefones(telefones, ddd_padrao=None):
+    """
+    Classifica vários telefones como celular, fixo ou 0800.
+
+    Args:
+        telefones (iterable): Telefones em qualquer formatação
+        ddd_padrao (str): DDD assumido quando o número não tem DDD
+
+    Returns:
+        list: ``CELULAR``, ``FIXO``, ``GRATUITO`` ou None (inválido) para
+        cada entrada
+    """
+    return [
+        telefone.tipo if telefone is not None else None
+        for telefone in analisar_telefones(telefones, ddd_padrao)
+    ]
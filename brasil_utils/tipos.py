@@ -0,0 +1,344 @@
+"""
+Tipos de resultado compactos da biblioteca.
+
+A consulta de CEP trabalha internamente com ``Endereco`` e ``ErroCep``;
+``buscar_cep`` e as demais funções que retornam dicionários ou strings
+apenas convertem estes tipos. As funções que os retornam diretamente
+(``buscar_endereco``, ``listar_feriados``, ``validar_documento``...) evitam
+um dicionário por resultado e as comparações com strings de erro. Os
+contêineres de lote guardam os resultados por coluna.
+"""
+
+from collections import namedtuple
+
+from ._limpeza import limpar_cnpj, limpar_documento
+
+
+# Campos de um endereço, na ordem retornada por buscar_cep
+CAMPOS_ENDERECO = (
+    "cep", "logradouro", "complemento", "bairro", "localidade",
+    "uf", "ibge", "gia", "ddd", "siafi"
+)
+
+CPF = 'cpf'
+CNPJ = 'cnpj'
+
+
+class Endereco(namedtuple('Endereco', CAMPOS_ENDERECO, defaults=("",) * len(CAMPOS_ENDERECO))):
+    """
+    Endereço encontrado para um CEP, com os mesmos campos de buscar_cep.
+
+    Imutável: o mesmo objeto pode ser guardado em cache e entregue a várias
+    chamadas sem cópia.
+
+    Args:
+        cep, logradouro, complemento, bairro, localidade, uf, ibge, gia,
+        ddd, siafi (str): Campos do endereço (padrão: vazio)
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def de_dict(cls, dados):
+        """
+        Cria o endereço a partir de um dicionário no formato de buscar_cep.
+
+        Args:
+            dados (dict): Endereço (campos ausentes ficam vazios)
+
+        Returns:
+            Endereco: Endereço
+        """
+        return cls._make([dados.get(campo) or "" for campo in CAMPOS_ENDERECO])
+
+    def como_dict(self):
+        """
+        Converte o endereço no dicionário retornado por buscar_cep.
+
+        Returns:
+            dict: Endereço
+        """
+        return dict(zip(CAMPOS_ENDERECO, self))
+
+
+# Prefixos das mensagens de erro de buscar_cep e o motivo de cada um
+_MOTIVOS_ERRO_CEP = (
+    ("CEP inválido", "cep_invalido"),
+    ("CEP não encontrado", "nao_encontrado"),
+    ("CEP não disponível no cache", "offline"),
+    ("Erro na consulta", "erro_consulta"),
+    ("Erro inesperado", "erro_inesperado"),
+)
+
+
+class ErroCep(Exception):
+    """
+    Falha na consulta de um CEP.
+
+    Também é usado como valor (sem ser levantado) nos resultados guardados
+    em cache e nos lotes.
+
+    Args:
+        motivo (str): "cep_invalido", "nao_encontrado", "offline",
+            "erro_consulta", "erro_inesperado" ou "erro" (ver
+            ``cep.classificar_resposta_cep``)
+        mensagem (str): Mensagem de erro no formato de buscar_cep
+    """
+
+    def __init__(self, motivo, mensagem):
+        super().__init__(mensagem)
+        self.motivo = motivo
+        self.mensagem = mensagem
+
+    @classmethod
+    def de_mensagem(cls, mensagem):
+        """
+        Cria o erro a partir da mensagem, deduzindo o motivo pelo prefixo.
+
+        Args:
+            mensagem (str): Mensagem no formato de buscar_cep
+
+        Returns:
+            ErroCep: Erro
+        """
+        for prefixo, motivo in _MOTIVOS_ERRO_CEP:
+            if mensagem.startswith(prefixo):
+                return cls(motivo, mensagem)
+        return cls("erro", mensagem)
+
+    def como_dict(self):
+        """
+        Converte o erro no dicionário retornado por buscar_cep.
+
+        Returns:
+            dict: ``{"erro": mensagem}``
+        """
+        return {"erro": self.mensagem}
+
+    def __eq__(self, outro):
+        if not isinstance(outro, ErroCep):
+            return NotImplemented
+        return (self.motivo, self.mensagem) == (outro.motivo, outro.mensagem)
+
+    def __hash__(self):
+        return hash((self.motivo, self.mensagem))
+
+    def __repr__(self):
+        return f"ErroCep(motivo={self.motivo!r}, mensagem={self.mensagem!r})"
+
+
+def resultado_cep(resposta):
+    """
+    Converte uma resposta no formato de buscar_cep em ``Endereco`` ou
+    ``ErroCep``; resultados que já são desses tipos são retornados como estão.
+
+    Permite que backends e caches que ainda trabalham com dicionários
+    continuem funcionando.
+
+    Args:
+        resposta (dict, Endereco ou ErroCep): Resultado de uma consulta
+
+    Returns:
+        Endereco ou ErroCep: Resultado
+    """
+    if isinstance(resposta, (Endereco, ErroCep)):
+        return resposta
+    mensagem = resposta.get("erro")
+    if mensagem is None:
+        return Endereco.de_dict(resposta)
+    return ErroCep.de_mensagem(mensagem)
+
+
+# Feriado em uma data; a data vem primeiro para que as tuplas se ordenem
+# cronologicamente
+Feriado = namedtuple('Feriado', ['data', 'nome'])
+
+
+def _formatar(tipo, numero):
+    if tipo == CPF:
+        return f"{numero[:3]}.{numero[3:6]}.{numero[6:9]}-{numero[9:]}"
+    return f"{numero[:2]}.{numero[2:5]}.{numero[5:8]}/{numero[8:12]}-{numero[12:]}"
+
+
+class DocumentoValidado:
+    """
+    CPF ou CNPJ já limpo e validado.
+
+    Avaliado como booleano, indica se o documento é válido.
+
+    Args:
+        tipo (str): ``CPF`` ou ``CNPJ``
+        numero (str): Documento sem formatação
+        valido (bool): Resultado da validação
+    """
+
+    __slots__ = ('tipo', 'numero', 'valido')
+
+    def __init__(self, tipo, numero, valido):
+        self.tipo = tipo
+        self.numero = numero
+        self.valido = valido
+
+    @property
+    def formatado(self):
+        """str: Documento formatado ou None se inválido."""
+        if not self.valido:
+            return None
+        return _formatar(self.tipo, self.numero)
+
+    def __bool__(self):
+        return self.valido
+
+    def __eq__(self, outro):
+        if not isinstance(outro, DocumentoValidado):
+            return NotImplemented
+        return (self.tipo, self.numero, self.valido) == (outro.tipo, outro.numero, outro.valido)
+
+    def __hash__(self):
+        return hash((self.tipo, self.numero, self.valido))
+
+    def __repr__(self):
+        return (
+            f"DocumentoValidado(tipo={self.tipo!r}, numero={self.numero!r}, "
+            f"valido={self.valido!r})"
+        )
+
+
+class LoteDocumentos:
+    """
+    Resultado da validação de vários documentos, guardado por coluna.
+
+    Os documentos são mantidos como recebidos e o resultado como um array
+    booleano; ``DocumentoValidado`` só é criado ao acessar um item.
+
+    Args:
+        tipo (str): ``CPF`` ou ``CNPJ``
+        documentos (sequence): Documentos, na forma recebida
+        validos (numpy.ndarray): Máscara booleana com o resultado de cada um
+    """
+
+    __slots__ = ('tipo', 'documentos', 'validos')
+
+    def __init__(self, tipo, documentos, validos):
+        self.tipo = tipo
+        self.documentos = documentos
+        self.validos = validos
+
+    def __len__(self):
+        return len(self.validos)
+
+    def __getitem__(self, indice):
+        limpar = limpar_documento if self.tipo == CPF else limpar_cnpj
+        documento = self.documentos[indice]
+        if isinstance(documento, (bytes, bytearray)):
+            # Itens de arrays NumPy 'S' (ex.: dos geradores) são bytes ASCII
+            documento = documento.decode('ascii', 'replace')
+        return DocumentoValidado(self.tipo, limpar(documento), bool(self.validos[indice]))
+
+    def __iter__(self):
+        for indice in range(len(self)):
+            yield self[indice]
+
+    @property
+    def quantidade_validos(self):
+        """int: Quantidade de documentos válidos."""
+        return int(self.validos.sum())
+
+    def filtrar_validos(self):
+        """
+        Lista os documentos válidos, na forma recebida.
+
+        Returns:
+            list: Documentos válidos
+        """
+        return [
+            documento for documento, valido in zip(self.documentos, self.validos.tolist())
+            if valido
+        ]
+
+    def __repr__(self):
+        return (
+            f"LoteDocumentos(tipo={self.tipo!r}, quantidade={len(self)}, "
+            f"validos={self.quantidade_validos})"
+        )
+
+
+class LoteEnderecos:
+    """
+    Resultado da busca de vários CEPs, guardado por coluna.
+
+    Cada campo do endereço é uma lista (vazia nas posições com erro), e os
+    erros ficam em ``erros`` (None onde o CEP foi encontrado).
+
+    Args:
+        ceps (list): CEPs consultados, na forma recebida
+        colunas (dict): Campo do endereço -> lista de valores
+        erros (list): ``ErroCep`` ou None para cada CEP
+    """
+
+    __slots__ = ('ceps', 'colunas', 'erros')
+
+    def __init__(self, ceps, colunas, erros):
+        self.ceps = ceps
+        self.colunas = colunas
+        self.erros = erros
+
+    @classmethod
+    def de_resultados(cls, ceps, resultados):
+        """
+        Monta o lote a partir dos resultados de cada CEP.
+
+        Args:
+            ceps (list): CEPs consultados
+            resultados (iterable): Um ``Endereco`` ou ``ErroCep`` por CEP
+
+        Returns:
+            LoteEnderecos: Lote
+        """
+        colunas = {campo: [] for campo in CAMPOS_ENDERECO}
+        listas = [colunas[campo] for campo in CAMPOS_ENDERECO]
+        erros = []
+        for resultado in resultados:
+            if isinstance(resultado, ErroCep):
+                erros.append(resultado)
+                for lista in listas:
+                    lista.append("")
+            else:
+                erros.append(None)
+                for lista, valor in zip(listas, resultado):
+                    lista.append(valor)
+        return cls(list(ceps), colunas, erros)
+
+    def __len__(self):
+        return len(self.erros)
+
+    def __getitem__(self, indice):
+        erro = self.erros[indice]
+        if erro is not None:
+            return erro
+        return Endereco._make([self.colunas[campo][indice] for campo in CAMPOS_ENDERECO])
+
+    def __iter__(self):
+        for indice in range(len(self)):
+            yield self[indice]
+
+    @property
+    def encontrados(self):
+        """list: True para cada CEP encontrado."""
+        return [erro is None for erro in self.erros]
+
+    def coluna(self, campo):
+        """
+        Retorna os valores de um campo para todos os CEPs.
+
+        Args:
+            campo (str): Campo do endereço (ex.: "localidade")
+
+        Returns:
+            list: Valores ("" onde houve erro)
+        """
+        return self.colunas[campo]
+
+    def __repr__(self):
+        encontrados = sum(erro is None for erro in self.erros)
+        return f"LoteEnderecos(quantidade={len(self)}, encontrados={encontrados})"
@@ -2,22 +2,150 @@
 Módulo para validação de documentos brasileiros (CPF, CNPJ).
 """
 
-import re
+import mmap
+import os
+import unicodedata
+from functools import partial
+from itertools import chain, islice
+from operator import mul
 
+from ._dependencias import carregar_numpy, exigir_numpy
+from ._limpeza import (
+    MAIUSCULAS_BYTES, NAO_ALFANUMERICO_BYTES, NAO_DIGITO_BYTES, limpar_cnpj, limpar_documento
+)
+from ._lotes import agrupar, mapear_lotes
+from .metricas import classificar_validacao, instrumentar
+from .tipos import CNPJ, CPF, DocumentoValidado, LoteDocumentos
 
-def limpar_documento(documento):
+# NumPy é opcional: só é necessário (e importado) na validação em lote
+_MENSAGEM_NUMPY = "A validação em lote requer o NumPy."
+
+
+# Pesos usados no cálculo dos dígitos verificadores
+PESOS_CPF = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+PESOS_CNPJ = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+class _RegraDigitos:
     """
-    Remove caracteres especiais de um documento.
-    
+    Tabela pré-calculada para o cálculo dos dois dígitos verificadores.
+
+    O valor de cada caractere é o seu código ASCII menos 48 ('0' a '9'
+    valem 0 a 9 e 'A' a 'Z' valem 17 a 42, como define a Receita Federal
+    para o CNPJ alfanumérico). Assim a soma ponderada é feita diretamente
+    sobre os bytes do texto, descontando ``48 * soma(pesos)``, que é fixo.
+
+    É a única implementação da regra: a validação em lote, a geração de
+    documentos e ``calcular_digitos`` usam as mesmas instâncias.
+    """
+
+    __slots__ = ('pesos', 'pesos_segundo', 'desconto', 'desconto_segundo')
+
+    def __init__(self, pesos):
+        self.pesos = pesos
+        # O segundo dígito usa os pesos precedidos de mais um; o último peso
+        # (2) é o do primeiro dígito verificador, somado à parte
+        self.pesos_segundo = (pesos[0] + 1,) + pesos[:-1]
+        self.desconto = 48 * sum(pesos)
+        self.desconto_segundo = 48 * sum(self.pesos_segundo)
+
+    def _calcular(self, base):
+        resto = (sum(map(mul, base, self.pesos)) - self.desconto) % 11
+        primeiro = 0 if resto < 2 else 11 - resto
+        resto = (
+            sum(map(mul, base, self.pesos_segundo)) - self.desconto_segundo + 2 * primeiro
+        ) % 11
+        return primeiro, 0 if resto < 2 else 11 - resto
+
+    def digitos(self, base):
+        """
+        Calcula os dígitos verificadores.
+
+        Args:
+            base (bytes): Caracteres ASCII antes dos dígitos verificadores
+
+        Returns:
+            str: Os dois dígitos verificadores
+        """
+        primeiro, segundo = self._calcular(base)
+        return f"{primeiro}{segundo}"
+
+    def confere_bytes(self, documento):
+        """
+        Verifica os dígitos verificadores de um documento ASCII já limpo.
+
+        Args:
+            documento (bytes): Documento sem formatação
+
+        Returns:
+            bool: True se os dois últimos caracteres conferem
+        """
+        primeiro, segundo = self._calcular(documento[:-2])
+        return documento[-2] == 48 + primeiro and documento[-1] == 48 + segundo
+
+    def confere(self, documento):
+        """
+        Verifica os dígitos verificadores de um documento já limpo.
+
+        Args:
+            documento (str): Documento sem formatação
+
+        Returns:
+            bool: True se os dois últimos caracteres conferem
+        """
+        if not documento.isascii():
+            # Dígitos Unicode (aceitos por limpar_documento) viram ASCII
+            documento = ''.join(
+                str(unicodedata.decimal(c)) if c.isdecimal() else c for c in documento
+            )
+        return documento[-2:] == self.digitos(documento[:-2].encode('ascii'))
+
+    def digitos_lote(self, matriz):
+        """
+        Calcula os dígitos verificadores de cada linha de uma matriz (NumPy).
+
+        Args:
+            matriz: Array (N, len(pesos)) com os valores dos caracteres
+                (código ASCII menos 48)
+
+        Returns:
+            tuple: Arrays (N,) com o primeiro e o segundo dígito
+        """
+        np = exigir_numpy(_MENSAGEM_NUMPY)
+        resto = (matriz @ np.array(self.pesos, dtype=np.int64)) % 11
+        primeiro = np.where(resto < 2, 0, 11 - resto)
+        resto = (matriz @ np.array(self.pesos_segundo, dtype=np.int64) + 2 * primeiro) % 11
+        return primeiro, np.where(resto < 2, 0, 11 - resto)
+
+
+_REGRA_CPF = _RegraDigitos(PESOS_CPF)
+_REGRA_CNPJ = _RegraDigitos(PESOS_CNPJ)
+_REGRAS = {'cpf': _REGRA_CPF, 'cnpj': _REGRA_CNPJ}
+
+
+def _regra(tipo):
+    regra = _REGRAS.get(tipo)
+    if regra is None:
+        raise ValueError(f"Tipo de documento inválido: {tipo!r} (use 'cpf' ou 'cnpj')")
+    return regra
+
+
+def calcular_digitos(base, tipo='cpf'):
+    """
+    Calcula os dígitos verificadores de um CPF ou CNPJ.
+
     Args:
-        documento (str): Documento a ser limpo
-        
+        base (str): Os 9 (CPF) ou 12 (CNPJ) primeiros caracteres, sem
+            formatação
+        tipo (str): "cpf" ou "cnpj"
+
     Returns:
-        str: Documento apenas com números
+        str: Os dois dígitos verificadores
     """
-    return re.sub(r'\D', '', str(documento))
+    return _regra(tipo).digitos(base.upper().encode('ascii'))
 
 
+@instrumentar(classificar=classificar_validacao)
 def validar_cpf(cpf):
     """
     Valida um número de CPF brasileiro.
@@ -38,25 +166,17 @@ def validar_cpf(cpf):
     if cpf == cpf[0] * 11:
         return False
     
-    # Calcula o primeiro dígito verificador
-    soma = sum(int(cpf[i]) * (10 - i) for i in range(9))
-    primeiro_digito = 11 - (soma % 11)
-    if primeiro_digito >= 10:
-        primeiro_digito = 0
-    
-    # Calcula o segundo dígito verificador
-    soma = sum(int(cpf[i]) * (11 - i) for i in range(10))
-    segundo_digito = 11 - (soma % 11)
-    if segundo_digito >= 10:
-        segundo_digito = 0
-    
     # Verifica se os dígitos calculados conferem
-    return cpf[-2:] == f"{primeiro_digito}{segundo_digito}"
+    return _REGRA_CPF.confere(cpf)
 
 
+@instrumentar(classificar=classificar_validacao)
 def validar_cnpj(cnpj):
     """
-    Valida um número de CNPJ brasileiro.
+    Valida um número de CNPJ brasileiro, numérico ou alfanumérico.
+
+    No formato alfanumérico as 12 primeiras posições podem ter letras; os
+    dois dígitos verificadores são sempre números.
     
     Args:
         cnpj (str): CNPJ a ser validado
@@ -64,36 +184,21 @@ def validar_cnpj(cnpj):
     Returns:
         bool: True se o CNPJ for válido, False caso contrário
     """
-    cnpj = limpar_documento(cnpj)
+    cnpj = limpar_cnpj(cnpj)
     
-    # Verifica se tem 14 dígitos
+    # Verifica se tem 14 caracteres
     if len(cnpj) != 14:
         return False
     
-    # Verifica se todos os dígitos são iguais
+    # Verifica se todos os caracteres são iguais
     if cnpj == cnpj[0] * 14:
         return False
     
-    # Sequência de pesos para os cálculos
-    pesos = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    
-    # Calcula o primeiro dígito verificador
-    soma = sum(int(cnpj[i]) * pesos[i] for i in range(12))
-    primeiro_digito = 11 - (soma % 11)
-    if primeiro_digito >= 10:
-        primeiro_digito = 0
-    
-    # Calcula o segundo dígito verificador
-    pesos.insert(0, 6)
-    soma = sum(int(cnpj[i]) * pesos[i] for i in range(13))
-    segundo_digito = 11 - (soma % 11)
-    if segundo_digito >= 10:
-        segundo_digito = 0
-    
     # Verifica se os dígitos calculados conferem
-    return cnpj[-2:] == f"{primeiro_digito}{segundo_digito}"
+    return _REGRA_CNPJ.confere(cnpj)
 
 
+@instrumentar()
 def formatar_cpf(cpf):
     """
     Formata um CPF com pontos e hífen.
@@ -110,6 +215,7 @@ def formatar_cpf(cpf):
     return ""
 
 
+@instrumentar()
 def formatar_cnpj(cnpj):
     """
     Formata um CNPJ com pontos, barra e hífen.
@@ -120,7 +226,436 @@ def formatar_cnpj(cnpj):
     Returns:
         str: CNPJ formatado ou string vazia se inválido
     """
-    cnpj = limpar_documento(cnpj)
+    cnpj = limpar_cnpj(cnpj)
     if validar_cnpj(cnpj):
         return f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
     return ""
+
+
+@instrumentar(classificar=classificar_validacao)
+def validar_cpf_bytes(cpf):
+    """
+    Valida um CPF em bytes ASCII, sem convertê-lo em str.
+
+    Args:
+        cpf (bytes, bytearray ou memoryview): CPF com ou sem formatação
+            (ex.: uma fatia de um arquivo mapeado em memória)
+
+    Returns:
+        bool: True se o CPF for válido, False caso contrário
+    """
+    cpf = bytes(cpf).translate(None, NAO_DIGITO_BYTES)
+    if len(cpf) != 11 or cpf.count(cpf[0]) == 11:
+        return False
+    return _REGRA_CPF.confere_bytes(cpf)
+
+
+@instrumentar(classificar=classificar_validacao)
+def validar_cnpj_bytes(cnpj):
+    """
+    Valida um CNPJ (numérico ou alfanumérico) em bytes ASCII, sem
+    convertê-lo em str.
+
+    Args:
+        cnpj (bytes, bytearray ou memoryview): CNPJ com ou sem formatação
+
+    Returns:
+        bool: True se o CNPJ for válido, False caso contrário
+    """
+    cnpj = bytes(cnpj)
+    limpo = cnpj.translate(MAIUSCULAS_BYTES, NAO_ALFANUMERICO_BYTES)
+    # Mesma regra de limpar_cnpj: letras só num corpo de 14 caracteres
+    cnpj = limpo if len(limpo) == 14 else cnpj.translate(None, NAO_DIGITO_BYTES)
+    if len(cnpj) != 14 or cnpj.count(cnpj[0]) == 14:
+        return False
+    return _REGRA_CNPJ.confere_bytes(cnpj)
+
+
+def _codigos_lote(documentos):
+    """
+    Converte uma coleção de documentos em um fluxo de códigos de caracteres.
+
+    Aceita sequências (str, int...), arrays NumPy de strings (dtype ``U``,
+    ``S`` ou ``object``) e buffers de bytes com um documento por linha.
+
+    Args:
+        documentos: Coleção de documentos
+
+    Returns:
+        tuple: (codigos, registros, quantidade, reprocessar) onde ``codigos``
+        é um array 1D com os códigos dos caracteres, ``registros`` indica a
+        qual documento cada código pertence e ``reprocessar`` lista os
+        pares (índice, texto) que precisam da validação escalar
+    """
+    np = exigir_numpy(_MENSAGEM_NUMPY)
+    if isinstance(documentos, (bytes, bytearray, memoryview)):
+        # Buffer bruto: um documento por linha, tratado como ASCII
+        codigos = np.frombuffer(documentos, dtype=np.uint8)
+        quebras = codigos == ord('\n')
+        registros = np.cumsum(quebras) - quebras
+        quantidade = int(quebras.sum())
+        if codigos.size and not quebras[-1]:
+            quantidade += 1
+        return codigos, registros, quantidade, []
+
+    if not (isinstance(documentos, np.ndarray) and documentos.dtype.kind in 'US'):
+        documentos = np.array(
+            [d if isinstance(d, str) else str(d) for d in documentos],
+            dtype=str,
+        )
+    documentos = np.ascontiguousarray(documentos).reshape(-1)
+    quantidade = documentos.shape[0]
+    largura = documentos.dtype.itemsize
+    if documentos.dtype.kind == 'U':
+        largura //= 4
+        matriz = documentos.view(np.uint32)
+    else:
+        matriz = documentos.view(np.uint8)
+    matriz = matriz.reshape(quantidade, largura)
+
+    # Dígitos Unicode fora do ASCII também são aceitos por limpar_documento;
+    # esses casos raros seguem pelo caminho escalar para manter o resultado
+    reprocessar = [
+        (indice, str(documentos[indice]))
+        for indice in np.flatnonzero((matriz > 127).any(axis=1))
+    ]
+
+    registros = np.repeat(np.arange(quantidade), largura)
+    return matriz.reshape(-1), registros, quantidade, reprocessar
+
+
+def _matriz_digitos(documentos, tamanho, alfanumerico=False):
+    """
+    Extrai uma matriz (N, tamanho) com os valores dos caracteres dos
+    documentos que têm exatamente ``tamanho`` dígitos (ou letras e dígitos,
+    se ``alfanumerico``).
+
+    O valor de cada caractere é o código ASCII menos 48, como no cálculo
+    escalar (ver ``_RegraDigitos``).
+
+    Args:
+        documentos: Coleção de documentos (ver ``_codigos_lote``)
+        tamanho (int): Quantidade de caracteres esperada
+        alfanumerico (bool): Se letras também fazem parte do documento
+
+    Returns:
+        tuple: (matriz, indices, quantidade, reprocessar)
+    """
+    np = exigir_numpy(_MENSAGEM_NUMPY)
+    codigos, registros, quantidade, reprocessar = _codigos_lote(documentos)
+
+    validos = (codigos >= 48) & (codigos <= 57)
+    candidatos = np.bincount(registros[validos], minlength=quantidade) == tamanho
+    selecionados = validos & candidatos[registros]
+    if alfanumerico:
+        # Mesma regra de limpar_cnpj: as letras só contam nos documentos com
+        # exatamente ``tamanho`` letras e dígitos; nos demais, só os dígitos
+        maiusculas = codigos & 0xDF
+        letras = (maiusculas >= 65) & (maiusculas <= 90)
+        if letras.any():
+            codigos = np.where(letras, maiusculas, codigos)
+            alfanumericos = validos | letras
+            com_letras = np.bincount(
+                registros[alfanumericos], minlength=quantidade
+            ) == tamanho
+            selecionados = np.where(com_letras[registros], alfanumericos, selecionados)
+            candidatos |= com_letras
+    matriz = (codigos[selecionados].astype(np.int64) - 48).reshape(-1, tamanho)
+
+    return matriz, np.flatnonzero(candidatos), quantidade, reprocessar
+
+
+def calcular_digitos_lote(matriz, tipo='cpf'):
+    """
+    Calcula os dígitos verificadores de vários CPFs ou CNPJs (requer NumPy).
+
+    Args:
+        matriz: Array (N, 9) para CPF ou (N, 12) para CNPJ com o valor de
+            cada caractere (0 a 9; letras do CNPJ valem o código ASCII menos 48)
+        tipo (str): "cpf" ou "cnpj"
+
+    Returns:
+        numpy.ndarray: Array (N, 2) com os dois dígitos de cada documento
+    """
+    regra = _regra(tipo)
+    np = exigir_numpy(_MENSAGEM_NUMPY)
+    primeiro, segundo = regra.digitos_lote(np.asarray(matriz, dtype=np.int64))
+    return np.stack([primeiro, segundo], axis=1)
+
+
+def _conferir_matriz(matriz, regra):
+    # Mesmas regras da versão escalar, aplicadas a todas as linhas de uma vez
+    repetidos = (matriz == matriz[:, :1]).all(axis=1)
+    primeiro, segundo = regra.digitos_lote(matriz[:, :-2])
+    return ~repetidos & (matriz[:, -2] == primeiro) & (matriz[:, -1] == segundo)
+
+
+def _validar_lote(documentos, tamanho, regra, validar_escalar, alfanumerico=False):
+    np = exigir_numpy(_MENSAGEM_NUMPY)
+    matriz, indices, quantidade, reprocessar = _matriz_digitos(
+        documentos, tamanho, alfanumerico
+    )
+
+    resultado = np.zeros(quantidade, dtype=bool)
+    resultado[indices] = _conferir_matriz(matriz, regra)
+
+    for indice, texto in reprocessar:
+        resultado[indice] = validar_escalar(texto)
+
+    return resultado
+
+
+@instrumentar()
+def validar_cpf_lote(cpfs):
+    """
+    Valida vários CPFs de uma vez usando operações vetorizadas do NumPy.
+
+    Args:
+        cpfs: Sequência de CPFs, array NumPy de strings ou buffer de bytes
+            com um CPF por linha
+
+    Returns:
+        numpy.ndarray: Máscara booleana com o resultado de cada CPF
+    """
+    return _validar_lote(cpfs, 11, _REGRA_CPF, validar_cpf)
+
+
+@instrumentar()
+def validar_cnpj_lote(cnpjs):
+    """
+    Valida vários CNPJs (numéricos ou alfanuméricos) de uma vez usando
+    operações vetorizadas do NumPy.
+
+    Args:
+        cnpjs: Sequência de CNPJs, array NumPy de strings ou buffer de bytes
+            com um CNPJ por linha
+
+    Returns:
+        numpy.ndarray: Máscara booleana com o resultado de cada CNPJ
+    """
+    return _validar_lote(cnpjs, 14, _REGRA_CNPJ, validar_cnpj, alfanumerico=True)
+
+
+@instrumentar()
+def validar_documento(documento, tipo=None):
+    """
+    Valida um CPF ou CNPJ e retorna o documento limpo junto com o resultado.
+
+    Args:
+        documento (str): CPF ou CNPJ, com ou sem formatação
+        tipo (str): 'cpf', 'cnpj' ou None para deduzir pelo tamanho (11
+            dígitos: CPF; caso contrário: CNPJ)
+
+    Returns:
+        DocumentoValidado: Documento validado (verdadeiro se válido)
+
+    Raises:
+        ValueError: Se o tipo não for suportado
+    """
+    if tipo is None:
+        numero = limpar_cnpj(documento)
+        tipo = CPF if len(numero) == 11 and numero.isdigit() else CNPJ
+    if tipo == CPF:
+        return DocumentoValidado(CPF, limpar_documento(documento), validar_cpf(documento))
+    if tipo == CNPJ:
+        return DocumentoValidado(CNPJ, limpar_cnpj(documento), validar_cnpj(documento))
+    raise ValueError(f"Tipo de documento não suportado: {tipo}")
+
+
+@instrumentar()
+def validar_documentos(documentos, tipo='cpf'):
+    """
+    Valida vários documentos do mesmo tipo de uma vez (ver validar_cpf_lote).
+
+    Args:
+        documentos (iterable): CPFs ou CNPJs
+        tipo (str): 'cpf' ou 'cnpj'
+
+    Returns:
+        LoteDocumentos: Documentos e máscara booleana com o resultado
+
+    Raises:
+        ValueError: Se o tipo não for suportado
+    """
+    if tipo not in (CPF, CNPJ):
+        raise ValueError(f"Tipo de documento não suportado: {tipo}")
+    if not hasattr(documentos, '__getitem__') or isinstance(documentos, (bytes, bytearray, str)):
+        documentos = list(documentos)
+    validar = validar_cpf_lote if tipo == CPF else validar_cnpj_lote
+    return LoteDocumentos(tipo, documentos, validar(documentos))
+
+
+# tipo -> (caracteres do documento, regra dos dígitos, aceita letras); o
+# CEP só precisa ter 8 dígitos
+_TIPOS_REGISTRO = {
+    'cpf': (11, _REGRA_CPF, False),
+    'cnpj': (14, _REGRA_CNPJ, True),
+    'cep': (8, None, False),
+}
+
+# Registros validados por vez em validar_registros
+TAMANHO_BLOCO_REGISTROS = 1 << 20
+
+
+def _validar_campos(campos, tipo):
+    """
+    Valida os documentos de uma matriz (N, largura) de bytes ASCII, que pode
+    ser uma visão (sem cópia) de um buffer maior.
+    """
+    np = exigir_numpy(_MENSAGEM_NUMPY)
+    tamanho, regra, alfanumerico = _TIPOS_REGISTRO[tipo]
+
+    validos = (campos >= 48) & (campos <= 57)
+    candidatos = np.count_nonzero(validos, axis=1) == tamanho
+    if alfanumerico:
+        # Letras só num corpo de exatamente ``tamanho`` caracteres (ver
+        # limpar_cnpj)
+        maiusculas = campos & 0xDF
+        letras = (maiusculas >= 65) & (maiusculas <= 90)
+        if letras.any():
+            campos = np.where(letras, maiusculas, campos)
+            alfanumericos = validos | letras
+            com_letras = np.count_nonzero(alfanumericos, axis=1) == tamanho
+            validos = np.where(com_letras[:, None], alfanumericos, validos)
+            candidatos |= com_letras
+    if regra is None:
+        return candidatos
+
+    # Cada linha candidata tem exatamente ``tamanho`` caracteres válidos
+    matriz = (campos[candidatos][validos[candidatos]].astype(np.int64) - 48)
+    resultado = np.zeros(campos.shape[0], dtype=bool)
+    resultado[candidatos] = _conferir_matriz(matriz.reshape(-1, tamanho), regra)
+    return resultado
+
+
+def validar_registros(dados, largura, inicio=0, tamanho=None, tipo='cpf',
+                      tamanho_bloco=TAMANHO_BLOCO_REGISTROS):
+    """
+    Valida CPFs, CNPJs ou CEPs em registros de largura fixa, direto dos
+    bytes (requer NumPy).
+
+    Os registros são lidos como uma matriz sobre o próprio buffer, sem
+    cópia: um arquivo mapeado em memória (mmap) é validado sem que seja
+    criada uma str por linha. Os bytes são tratados como ASCII.
+
+    Args:
+        dados (bytes, bytearray, memoryview ou mmap): Registros concatenados
+        largura (int): Tamanho de cada registro em bytes, incluindo a quebra
+            de linha, se houver (o último registro pode vir sem ela)
+        inicio (int): Posição do documento dentro do registro
+        tamanho (int): Bytes ocupados pelo documento (padrão: até o fim do
+            registro)
+        tipo (str): "cpf", "cnpj" ou "cep"
+        tamanho_bloco (int): Registros validados por vez (limita a memória
+            temporária)
+
+    Returns:
+        numpy.ndarray: Máscara booleana com o resultado de cada registro
+    """
+    if tipo not in _TIPOS_REGISTRO:
+        raise ValueError(f"Tipo de documento inválido: {tipo!r} (use 'cpf', 'cnpj' ou 'cep')")
+    if tamanho is None:
+        tamanho = largura - inicio
+    if inicio < 0 or tamanho < 1 or inicio + tamanho > largura:
+        raise ValueError(
+            f"Campo fora do registro: início {inicio}, tamanho {tamanho}, largura {largura}"
+        )
+    np = exigir_numpy(_MENSAGEM_NUMPY)
+
+    codigos = np.frombuffer(dados, dtype=np.uint8)
+    quantidade, resto = divmod(codigos.size, largura)
+    incompleto = resto >= inicio + tamanho
+    campos = codigos[:quantidade * largura].reshape(quantidade, largura)[
+        :, inicio:inicio + tamanho
+    ]
+
+    resultado = np.empty(quantidade + incompleto, dtype=bool)
+    for bloco in range(0, quantidade, tamanho_bloco):
+        fim = min(bloco + tamanho_bloco, quantidade)
+        resultado[bloco:fim] = _validar_campos(campos[bloco:fim], tipo)
+    if incompleto:
+        ultimo = quantidade * largura + inicio
+        resultado[-1] = _validar_campos(codigos[ultimo:ultimo + tamanho].reshape(1, -1), tipo)[0]
+    return resultado
+
+
+def validar_arquivo_registros(caminho, largura, inicio=0, tamanho=None, tipo='cpf',
+                              tamanho_bloco=TAMANHO_BLOCO_REGISTROS):
+    """
+    Valida os documentos de um arquivo de registros de largura fixa,
+    mapeado em memória (requer NumPy).
+
+    Args:
+        caminho (str): Arquivo a ser validado
+        largura, inicio, tamanho, tipo, tamanho_bloco: Como em
+            ``validar_registros``
+
+    Returns:
+        numpy.ndarray: Máscara booleana com o resultado de cada registro
+    """
+    with open(caminho, 'rb') as arquivo:
+        if os.fstat(arquivo.fileno()).st_size == 0:
+            # Arquivo vazio não pode ser mapeado
+            return validar_registros(b'', largura, inicio, tamanho, tipo, tamanho_bloco)
+        with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            return validar_registros(mapa, largura, inicio, tamanho, tipo, tamanho_bloco)
+
+
+# Abaixo desta quantidade de documentos a validação roda no processo atual,
+# pois o custo de comunicação entre processos supera o ganho
+LIMITE_SEQUENCIAL = 20000
+
+
+def _validar_bloco(tipo, bloco):
+    if carregar_numpy() is not None:
+        validar_lote = validar_cpf_lote if tipo == 'cpf' else validar_cnpj_lote
+        return validar_lote(bloco).tolist()
+    validar = validar_cpf if tipo == 'cpf' else validar_cnpj
+    return [validar(documento) for documento in bloco]
+
+
+def validar_em_paralelo(iteravel, tipo='cpf', workers=None, chunk_size=10000,
+                        limite_sequencial=LIMITE_SEQUENCIAL):
+    """
+    Valida um grande volume de CPFs ou CNPJs usando vários processos.
+
+    Os documentos são lidos sob demanda e divididos em blocos distribuídos
+    num pool de processos; os resultados são entregues na ordem de entrada,
+    sem carregar todo o conjunto em memória. Entradas pequenas são
+    validadas no próprio processo.
+
+    Args:
+        iteravel (iterable): Documentos a serem validados
+        tipo (str): "cpf" ou "cnpj"
+        workers (int): Quantidade de processos (padrão: número de núcleos)
+        chunk_size (int): Documentos por bloco enviado a cada processo
+        limite_sequencial (int): Até esta quantidade de documentos não é
+            usado o pool de processos
+
+    Returns:
+        iterator: Resultado (bool) de cada documento, na ordem de entrada
+
+    Raises:
+        ValueError: Se o tipo, ``workers`` ou ``chunk_size`` forem inválidos
+            (já na chamada, antes de o primeiro resultado ser pedido)
+    """
+    if tipo not in ('cpf', 'cnpj'):
+        raise ValueError(f"Tipo de documento inválido: {tipo!r} (use 'cpf' ou 'cnpj')")
+    if workers is not None and workers < 1:
+        raise ValueError("A quantidade de processos deve ser positiva")
+    if chunk_size < 1:
+        raise ValueError("O tamanho do lote deve ser positivo")
+
+    return _validar_em_paralelo(iteravel, tipo, workers or os.cpu_count() or 1,
+                                chunk_size, limite_sequencial)
+
+
+def _validar_em_paralelo(iteravel, tipo, processos, chunk_size, limite_sequencial):
+    iterador = iter(iteravel)
+    inicio = list(islice(iterador, limite_sequencial + 1))
+    if len(inicio) <= limite_sequencial:
+        processos = 1
+
+    blocos = agrupar(chain(inicio, iterador), chunk_size)
+    for resultados in mapear_lotes(partial(_validar_bloco, tipo), blocos, processos):
+        yield from resultados
@@ -73,36 +73,31 @@ def exemplos_formatadores():
 
 
 def exemplos_feriados():
-    """Exemplos de cálculo de feriados (requer python-dateutil)"""
+    """Exemplos de cálculo de feriados"""
     print("\n=== FERIADOS NACIONAIS ===")
     
-    try:
-        from brasil_utils import feriados
-        from datetime import date
-        
-        ano_atual = date.today().year
-        todos_feriados_ano = feriados.todos_feriados(ano_atual)
-        
-        print(f"Feriados nacionais de {ano_atual}:")
-        for nome, data_feriado in sorted(todos_feriados_ano.items(), key=lambda x: x[1]):
-            print(f"- {nome}: {data_feriado.strftime('%d/%m/%Y')}")
-        
-        # Verifica se hoje é feriado
-        hoje = date.today()
-        if feriados.eh_feriado(hoje):
-            print(f"\nHoje ({hoje.strftime('%d/%m/%Y')}) é feriado!")
-        else:
-            print(f"\nHoje ({hoje.strftime('%d/%m/%Y')}) não é feriado.")
-        
-        # Próximo feriado
-        proximo = feriados.proximo_feriado()
-        if proximo:
-            nome_feriado, data_feriado = proximo
-            print(f"Próximo feriado: {nome_feriado} em {data_feriado.strftime('%d/%m/%Y')}")
-    
-    except ImportError:
-        print("Módulo de feriados não disponível. Instale python-dateutil com:")
-        print("pip install python-dateutil")
+    from brasil_utils import feriados
+    from datetime import date
+    
+    ano_atual = date.today().year
+    todos_feriados_ano = feriados.todos_feriados(ano_atual)
+    
+    print(f"Feriados nacionais de {ano_atual}:")
+    for nome, data_feriado in sorted(todos_feriados_ano.items(), key=lambda x: x[1]):
+        print(f"- {nome}: {data_feriado.strftime('%d/%m/%Y')}")
+    
+    # Verifica se hoje é feriado
+    hoje = date.today()
+    if feriados.eh_feriado(hoje):
+        print(f"\nHoje ({hoje.strftime('%d/%m/%Y')}) é feriado!")
+    else:
+        print(f"\nHoje ({hoje.strftime('%d/%m/%Y')}) não é feriado.")
+    
+    # Próximo feriado
+    proximo = feriados.proximo_feriado()
+    if proximo:
+        nome_feriado, data_feriado = proximo
+        print(f"Próximo feriado: {nome_feriado} em {data_feriado.strftime('%d/%m/%Y')}")
 
 
 if __name__ == "__main__":
@@ -17,5 +17,8 @@ setup(
     url="https://github.com/samuellcs/simple-package-template",
     packages=find_packages(),
     install_requires=requirements,
+    entry_points={
+        "console_scripts": ["brasil-utils=brasil_utils.cli:main"],
+    },
     python_requires='>=3.8',
 )
\ No newline at end of file
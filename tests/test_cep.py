@@ -0,0 +1,110 @@
+"""
+Testes unitários para o módulo cep do brasil_utils
+"""
+
+import threading
+import time
+import unittest
+
+from brasil_utils import cep, metricas
+from brasil_utils.tipos import Endereco
+
+
+class TestValidarCepBytes(unittest.TestCase):
+
+    def test_validar_cep_bytes(self):
+        """Testa que a validação de bytes confere com a de str"""
+        for valor in ["01310-100", "01310100", "0131010", "013101000", "", "CEP 01310.100"]:
+            with self.subTest(cep=valor):
+                self.assertEqual(cep.validar_cep_bytes(valor.encode()), cep.validar_cep(valor))
+        self.assertTrue(cep.validar_cep_bytes(memoryview(b"xx01310-100xx")[2:11]))
+
+
+class _BackendLento:
+    """Backend que só responde quando liberado pelo teste"""
+
+    def __init__(self, erro=None):
+        self.chamadas = 0
+        self.liberar = threading.Event()
+        self.erro = erro
+
+    def consultar(self, cep_limpo):
+        self.chamadas += 1
+        self.liberar.wait(5)
+        if self.erro is not None:
+            raise self.erro
+        return Endereco(cep=f"{cep_limpo[:5]}-{cep_limpo[5:]}")
+
+
+class TestCoalescencia(unittest.TestCase):
+
+    def setUp(self):
+        metricas.zerar_metricas()
+        metricas.ativar_metricas()
+
+    def tearDown(self):
+        metricas.desativar_metricas()
+        metricas.zerar_metricas()
+
+    def _consultar_em_threads(self, backend, ceps):
+        resultados = [None] * len(ceps)
+        coalescidas = cep._em_andamento.coalescidas
+
+        def consultar(indice):
+            try:
+                resultados[indice] = cep.buscar_cep(ceps[indice], backend=backend)
+            except Exception as erro:
+                resultados[indice] = erro
+
+        threads = [threading.Thread(target=consultar, args=(i,)) for i in range(len(ceps))]
+        for thread in threads:
+            thread.start()
+
+        # Libera o backend só quando todas as outras chamadas estão esperando
+        limite = time.monotonic() + 5
+        while (cep._em_andamento.coalescidas - coalescidas < len(ceps) - 1
+               and time.monotonic() < limite):
+            time.sleep(0.001)
+        backend.liberar.set()
+
+        for thread in threads:
+            thread.join(5)
+        return resultados
+
+    def test_consulta_unica(self):
+        """Testa que chamadas simultâneas ao mesmo CEP compartilham a consulta"""
+        backend = _BackendLento()
+        ceps = ["01310-100", "01310100", " 01310.100 "] * 3
+        resultados = self._consultar_em_threads(backend, ceps)
+
+        self.assertEqual(backend.chamadas, 1)
+        self.assertEqual(resultados, [Endereco(cep="01310-100").como_dict()] * len(ceps))
+        # Cada chamada recebe o próprio dicionário
+        self.assertEqual(len({id(resultado) for resultado in resultados}), len(ceps))
+        self.assertEqual(
+            metricas.obter_metricas()['contadores']['consultas_cep_coalescidas'], len(ceps) - 1
+        )
+
+    def test_erro_compartilhado(self):
+        """Testa que a exceção da consulta chega a todas as chamadas"""
+        backend = _BackendLento(erro=RuntimeError("falha no backend"))
+        resultados = self._consultar_em_threads(backend, ["01310100"] * 4)
+
+        self.assertEqual(backend.chamadas, 1)
+        for resultado in resultados:
+            self.assertIsInstance(resultado, RuntimeError)
+
+    def test_ceps_diferentes(self):
+        """Testa que CEPs diferentes não são agrupados"""
+        backend = _BackendLento()
+        backend.liberar.set()
+        cep.buscar_cep("01310100", backend=backend)
+        cep.buscar_cep("01310100", backend=backend)
+        cep.buscar_cep("20040020", backend=backend)
+
+        self.assertEqual(backend.chamadas, 3)
+        self.assertNotIn('consultas_cep_coalescidas', metricas.obter_metricas()['contadores'])
+
+
+if __name__ == '__main__':
+    unittest.main()
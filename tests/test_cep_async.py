@@ -0,0 +1,206 @@
+"""
+Testes unitários para o módulo cep_async do brasil_utils
+"""
+
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from brasil_utils.cep_async import AsyncCepClient, _ler_resposta, buscar_ceps_async
+
+
+ENDERECOS = {
+    "01310100": {
+        "cep": "01310-100", "logradouro": "Avenida Paulista", "complemento": "",
+        "bairro": "Bela Vista", "localidade": "São Paulo", "uf": "SP",
+        "ibge": "3550308", "gia": "1004", "ddd": "11", "siafi": "7107"
+    },
+    "20040020": {
+        "cep": "20040-020", "logradouro": "Rua da Assembleia", "bairro": "Centro",
+        "localidade": "Rio de Janeiro", "uf": "RJ", "ibge": "3304557"
+    },
+}
+
+
+class _ServidorViaCep(BaseHTTPRequestHandler):
+    """Imitação local do ViaCEP, com suporte a keep-alive"""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.conexoes += 1
+
+    def do_GET(self):
+        cep = self.path.split("/")[2]
+        with self.server.lock:
+            self.server.requisicoes += 1
+            falhar = self.server.falhas_restantes > 0
+            if falhar:
+                self.server.falhas_restantes -= 1
+
+        if falhar:
+            status, dados = 503, {}
+        else:
+            status, dados = 200, ENDERECOS.get(cep, {"erro": "true"})
+
+        corpo = json.dumps(dados).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+def iniciar_servidor():
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), _ServidorViaCep)
+    servidor.daemon_threads = True
+    servidor.lock = threading.Lock()
+    servidor.conexoes = 0
+    servidor.requisicoes = 0
+    servidor.falhas_restantes = 0
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{servidor.server_address[1]}/ws/{{cep}}/json/"
+    return servidor, url
+
+
+class TestLerResposta(unittest.TestCase):
+
+    def _ler(self, dados):
+        async def executar():
+            leitor = asyncio.StreamReader()
+            # Sem feed_eof: a conexão keep-alive continua aberta
+            leitor.feed_data(dados)
+            return await asyncio.wait_for(_ler_resposta(leitor), 1)
+        return asyncio.run(executar())
+
+    def test_respostas_sem_corpo(self):
+        """Testa 204, 304 e 1xx sem Content-Length numa conexão mantida aberta"""
+        for status in (b"204 No Content", b"304 Not Modified"):
+            with self.subTest(status=status):
+                resposta = self._ler(b"HTTP/1.1 " + status + b"\r\nServer: x\r\n\r\n")
+                self.assertEqual((resposta.corpo, resposta.reutilizavel), (b"", True))
+
+        resposta = self._ler(
+            b"HTTP/1.1 100 Continue\r\n\r\n"
+            b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}"
+        )
+        self.assertEqual((resposta.status, resposta.corpo), (200, b"{}"))
+
+
+class TestAsyncCepClient(unittest.TestCase):
+
+    def setUp(self):
+        self.servidor, self.url = iniciar_servidor()
+
+    def tearDown(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+    def test_buscar_formato_normalizado(self):
+        """Testa que o resultado tem o mesmo formato de buscar_cep"""
+        async def executar():
+            async with AsyncCepClient(self.url) as cliente:
+                return (
+                    await cliente.buscar("01310-100"),
+                    await cliente.buscar("99999999"),
+                    await cliente.buscar("123"),
+                )
+
+        encontrado, nao_encontrado, invalido = asyncio.run(executar())
+        self.assertEqual(encontrado, ENDERECOS["01310100"])
+        self.assertEqual(nao_encontrado, {"erro": "CEP não encontrado"})
+        self.assertEqual(invalido, {"erro": "CEP inválido"})
+
+    def test_buscar_varios_reaproveita_conexoes(self):
+        """Testa o pool de conexões e o limite de requisições simultâneas"""
+        ceps = ["01310100", "20040020", "99999999"] * 20
+
+        async def executar():
+            resultados = []
+            async for item in buscar_ceps_async(ceps, url=self.url, limite_conexoes=4):
+                resultados.append(item)
+            return resultados
+
+        resultados = asyncio.run(executar())
+        self.assertEqual(len(resultados), len(ceps))
+        self.assertEqual(sorted(cep for cep, _ in resultados), sorted(ceps))
+        for cep, resultado in resultados:
+            self.assertEqual(resultado.get("cep"), ENDERECOS.get(cep, {}).get("cep"))
+        self.assertLessEqual(self.servidor.conexoes, 4)
+
+    def test_conexoes_abertas(self):
+        """Testa que o contador cai quando as conexões são fechadas"""
+        async def executar():
+            cliente = AsyncCepClient(self.url)
+            await cliente.buscar("01310100")
+            await cliente.buscar("20040020")
+            abertas = cliente.conexoes_abertas
+            await cliente.fechar()
+            return abertas, cliente.conexoes_abertas
+
+        self.assertEqual(asyncio.run(executar()), (1, 0))
+
+    def test_repete_com_espera(self):
+        """Testa nova tentativa após erro temporário do servidor"""
+        self.servidor.falhas_restantes = 2
+
+        async def executar():
+            async with AsyncCepClient(self.url, espera_inicial=0.01) as cliente:
+                return await cliente.buscar("20040020")
+
+        self.assertEqual(asyncio.run(executar())["localidade"], "Rio de Janeiro")
+        self.assertEqual(self.servidor.requisicoes, 3)
+
+    def test_consultas_simultaneas_compartilhadas(self):
+        """Testa que buscas simultâneas ao mesmo CEP fazem uma só requisição"""
+        async def executar():
+            async with AsyncCepClient(self.url) as cliente:
+                resultados = await asyncio.gather(
+                    *(cliente.buscar(cep) for cep in ["01310-100", "01310100"] * 5),
+                    cliente.buscar("20040020")
+                )
+                return resultados, cliente.coalescidas
+
+        resultados, coalescidas = asyncio.run(executar())
+        self.assertEqual(self.servidor.requisicoes, 2)
+        self.assertEqual(coalescidas, 9)
+        self.assertEqual(resultados[:10], [ENDERECOS["01310100"]] * 10)
+        self.assertEqual(resultados[10]["localidade"], "Rio de Janeiro")
+
+    def test_cancelamento_nao_afeta_outras_buscas(self):
+        """Testa que cancelar uma busca não cancela a consulta compartilhada"""
+        self.servidor.falhas_restantes = 1
+
+        async def executar():
+            async with AsyncCepClient(self.url, espera_inicial=0.05) as cliente:
+                primeira = asyncio.ensure_future(cliente.buscar("20040020"))
+                segunda = asyncio.ensure_future(cliente.buscar("20040020"))
+                await asyncio.sleep(0.01)
+                primeira.cancel()
+                return await segunda, primeira.cancelled()
+
+        resultado, cancelada = asyncio.run(executar())
+        self.assertTrue(cancelada)
+        self.assertEqual(resultado["localidade"], "Rio de Janeiro")
+        self.assertEqual(self.servidor.requisicoes, 2)
+
+    def test_desiste_apos_tentativas(self):
+        """Testa o erro retornado quando todas as tentativas falham"""
+        self.servidor.falhas_restantes = 10
+
+        async def executar():
+            async with AsyncCepClient(self.url, tentativas=2, espera_inicial=0.01) as cliente:
+                return await cliente.buscar("20040020")
+
+        self.assertEqual(asyncio.run(executar()), {"erro": "Erro na consulta: HTTP 503"})
+
+
+if __name__ == '__main__':
+    unittest.main()
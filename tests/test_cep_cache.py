@@ -0,0 +1,98 @@
+"""
+Testes unitários para o módulo cep_cache do brasil_utils
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from brasil_utils import cep
+from brasil_utils.cep_cache import CacheCep
+
+
+ENDERECO = {
+    "cep": "01310-100", "logradouro": "Avenida Paulista", "complemento": "",
+    "bairro": "Bela Vista", "localidade": "São Paulo", "uf": "SP",
+    "ibge": "3550308", "gia": "1004", "ddd": "11", "siafi": "7107"
+}
+
+
+def consulta_falsa(cep_limpo):
+    if cep_limpo == "01310100":
+        return dict(ENDERECO)
+    if cep_limpo == "88888888":
+        return {"erro": "Erro na consulta: sem rede"}
+    return {"erro": "CEP não encontrado"}
+
+
+class TestCacheCep(unittest.TestCase):
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, "ceps.sqlite")
+        patcher = mock.patch.object(cep, "_consultar_viacep", side_effect=consulta_falsa)
+        self.consulta = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def test_acerto_em_memoria(self):
+        """Testa que a segunda consulta não vai à rede"""
+        with CacheCep() as cache:
+            self.assertEqual(cep.buscar_cep("01310-100", cache=cache), ENDERECO)
+            self.assertEqual(cep.buscar_cep("01310100", cache=cache), ENDERECO)
+            self.assertEqual(self.consulta.call_count, 1)
+
+            estatisticas = cache.estatisticas()
+            self.assertEqual(estatisticas['acertos_memoria'], 1)
+            self.assertEqual(estatisticas['falhas'], 1)
+            self.assertEqual(estatisticas['consultas_rede'], 1)
+            self.assertEqual(estatisticas['taxa_acerto'], 0.5)
+
+    def test_persistencia_e_modo_offline(self):
+        """Testa que o cache em disco sobrevive a uma nova instância"""
+        with CacheCep(self.caminho) as cache:
+            cep.buscar_cep("01310100", cache=cache)
+
+        with CacheCep(self.caminho) as cache:
+            self.assertEqual(cep.buscar_cep("01310100", cache=cache, offline=True), ENDERECO)
+            self.assertEqual(cache.estatisticas()['acertos_disco'], 1)
+            self.assertIn("offline", cep.buscar_cep("20040020", cache=cache, offline=True)["erro"])
+        self.assertEqual(self.consulta.call_count, 1)
+
+    def test_cache_negativo_e_erros_de_rede(self):
+        """Testa que "CEP não encontrado" é guardado e erros de rede não"""
+        with CacheCep() as cache:
+            cep.buscar_cep("99999999", cache=cache)
+            cep.buscar_cep("99999999", cache=cache)
+            cep.buscar_cep("88888888", cache=cache)
+            cep.buscar_cep("88888888", cache=cache)
+        self.assertEqual(self.consulta.call_count, 3)
+
+    def test_validade_expirada(self):
+        """Testa que entradas vencidas voltam a consultar a rede"""
+        with CacheCep(self.caminho, ttl=0.05) as cache:
+            cep.buscar_cep("01310100", cache=cache)
+            time.sleep(0.1)
+            cep.buscar_cep("01310100", cache=cache)
+            self.assertEqual(cache.estatisticas()['expirados'], 1)
+        self.assertEqual(self.consulta.call_count, 2)
+
+    def test_cache_padrao(self):
+        """Testa o cache definido por definir_cache_cep"""
+        cache = CacheCep()
+        cep.definir_cache_cep(cache)
+        self.addCleanup(cep.definir_cache_cep, None)
+
+        cep.buscar_cep("01310100")
+        resultado = cep.buscar_cep("01310100")
+        resultado["uf"] = "RJ"
+        self.assertEqual(cep.buscar_cep("01310100")["uf"], "SP")
+        self.assertEqual(self.consulta.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
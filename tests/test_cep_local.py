@@ -0,0 +1,90 @@
+"""
+Testes unitários para o módulo cep_local do brasil_utils
+"""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from brasil_utils import cep
+from brasil_utils.cep_local import BaseCepLocal, construir_indice_cep
+
+
+REGISTROS = [
+    {"cep": "01310-100", "logradouro": "Avenida Paulista", "bairro": "Bela Vista",
+     "localidade": "São Paulo", "uf": "SP", "ibge": "3550308"},
+    {"cep": "01310-200", "logradouro": "Avenida Paulista", "bairro": "Bela Vista",
+     "localidade": "São Paulo", "uf": "SP", "ibge": "3550308"},
+    {"cep": "01311000", "logradouro": "Avenida Paulista", "bairro": "Cerqueira César",
+     "localidade": "São Paulo", "uf": "SP", "ibge": "3550308"},
+    {"cep": "20040-020", "logradouro": "Rua da Assembleia", "bairro": "Centro",
+     "localidade": "Rio de Janeiro", "uf": "RJ", "ibge": "3304557"},
+    {"cep": "123", "logradouro": "CEP inválido, deve ser ignorado"},
+]
+
+
+class TestBaseCepLocal(unittest.TestCase):
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.diretorio.cleanup)
+        self.indice = os.path.join(self.diretorio.name, "ceps.idx")
+
+        origem = os.path.join(self.diretorio.name, "ceps.jsonl")
+        with open(origem, "w", encoding="utf-8") as arquivo:
+            for registro in reversed(REGISTROS):
+                arquivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self.assertEqual(construir_indice_cep(origem, self.indice), 4)
+
+    def test_buscar(self):
+        """Testa a busca exata e o formato do resultado"""
+        with BaseCepLocal(self.indice) as base:
+            endereco = base.buscar("20040020")
+            self.assertEqual(endereco["cep"], "20040-020")
+            self.assertEqual(endereco["localidade"], "Rio de Janeiro")
+            self.assertEqual(endereco["complemento"], "")
+            self.assertEqual(set(endereco), set(cep.CAMPOS_ENDERECO))
+            self.assertIsNone(base.buscar("99999999"))
+            self.assertIn("01310-100", base)
+            self.assertEqual(len(base), 4)
+
+    def test_buscar_prefixo(self):
+        """Testa a consulta por prefixo de CEP"""
+        with BaseCepLocal(self.indice) as base:
+            self.assertEqual([e["cep"] for e in base.buscar_prefixo("01310")],
+                             ["01310-100", "01310-200"])
+            self.assertEqual(len(list(base.buscar_prefixo("0"))), 3)
+            self.assertEqual(list(base.buscar_prefixo("9")), [])
+
+    def test_origem_csv(self):
+        """Testa a construção a partir de CSV"""
+        origem = os.path.join(self.diretorio.name, "ceps.csv")
+        with open(origem, "w", encoding="utf-8", newline="") as arquivo:
+            escritor = csv.DictWriter(arquivo, fieldnames=["cep", "logradouro", "uf"])
+            escritor.writeheader()
+            escritor.writerow({"cep": "70040-010", "logradouro": "Eixo Monumental", "uf": "DF"})
+
+        construir_indice_cep(origem, self.indice)
+        with BaseCepLocal(self.indice) as base:
+            self.assertEqual(base.buscar("70040010")["uf"], "DF")
+
+    def test_backend_de_buscar_cep(self):
+        """Testa o uso transparente como backend de buscar_cep"""
+        with BaseCepLocal(self.indice) as base:
+            cep.definir_backend_cep(base)
+            self.addCleanup(cep.definir_backend_cep, None)
+            self.assertEqual(cep.buscar_cep("01310-100")["uf"], "SP")
+            self.assertEqual(cep.buscar_cep("99999-999"), {"erro": "CEP não encontrado"})
+
+    def test_indice_invalido(self):
+        """Testa a recusa de arquivos que não são índices"""
+        with open(self.indice, "wb") as arquivo:
+            arquivo.write(b"nao e um indice")
+        with self.assertRaises(ValueError):
+            BaseCepLocal(self.indice)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,393 @@
+"""
+Testes unitários para o módulo cep_provedores do brasil_utils
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from concurrent.futures import ALL_COMPLETED, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from brasil_utils import cep, cep_provedores
+from brasil_utils.cep_local import construir_indice_cep
+from brasil_utils.cep_provedores import (
+    DisjuntorCircuito, ProvedorArquivo, ProvedorBrasilApi, ProvedorOpenCep, ProvedorViaCep,
+    ResolvedorCep, buscar_ceps
+)
+from brasil_utils.tipos import Endereco, ErroCep
+
+
+PAULISTA = {
+    "cep": "01310-100", "logradouro": "Avenida Paulista", "complemento": "",
+    "bairro": "Bela Vista", "localidade": "São Paulo", "uf": "SP",
+    "ibge": "3550308", "gia": "1004", "ddd": "11", "siafi": "7107"
+}
+
+# Respostas de cada provedor para o CEP 01310-100
+RESPOSTAS = {
+    "viacep": PAULISTA,
+    "opencep": {campo: PAULISTA[campo] for campo in
+                ("cep", "logradouro", "complemento", "bairro", "localidade", "uf", "ibge")},
+    "brasilapi": {"cep": "01310100", "state": "SP", "city": "São Paulo",
+                  "neighborhood": "Bela Vista", "street": "Avenida Paulista",
+                  "service": "correios"},
+}
+
+
+class _ServidorProvedor(BaseHTTPRequestHandler):
+    """Imitação local de um provedor de CEP"""
+
+    def do_GET(self):
+        servidor = self.server
+        with servidor.lock:
+            servidor.requisicoes += 1
+            falhar = servidor.falhas_restantes > 0
+            if falhar:
+                servidor.falhas_restantes -= 1
+        time.sleep(servidor.atraso)
+
+        cep_limpo = self.path.rstrip("/").split("/")[-1]
+        if falhar:
+            status, dados = 503, {}
+        elif cep_limpo != "01310100":
+            # O ViaCEP responde 200 com {"erro": true}; os demais, 404
+            status, dados = (200, {"erro": True}) if servidor.formato == "viacep" else (404, {})
+        else:
+            status, dados = 200, RESPOSTAS[servidor.formato]
+
+        corpo = json.dumps(dados).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+def iniciar_servidor(formato, atraso=0.0):
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), _ServidorProvedor)
+    servidor.daemon_threads = True
+    servidor.lock = threading.Lock()
+    servidor.formato = formato
+    servidor.atraso = atraso
+    servidor.requisicoes = 0
+    servidor.falhas_restantes = 0
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
+
+
+def url(servidor):
+    return f"http://127.0.0.1:{servidor.server_address[1]}/{{cep}}"
+
+
+class _ProvedorMemoria:
+    """Provedor que responde sempre o mesmo resultado, contando as consultas"""
+
+    def __init__(self, nome, resultado, barreira=None):
+        self.nome = nome
+        self.resultado = resultado
+        self.barreira = barreira
+        self.chamadas = 0
+
+    def consultar(self, cep_limpo):
+        self.chamadas += 1
+        if self.barreira is not None:
+            self.barreira.wait(5)
+        return self.resultado
+
+
+class _BaseVazia(_ProvedorMemoria):
+    """Base local sem registros: falsa num teste de verdade"""
+
+    def __len__(self):
+        return 0
+
+
+def _esperar_todos(pendentes, timeout=None, return_when=None):
+    # Torna determinístico o caso de várias consultas prontas de uma vez
+    return wait(pendentes, timeout, ALL_COMPLETED)
+
+
+class _Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+class TestDisjuntorCircuito(unittest.TestCase):
+
+    def test_ciclo(self):
+        """Testa a abertura, o teste meio aberto e o fechamento"""
+        relogio = _Relogio()
+        disjuntor = DisjuntorCircuito(limite_falhas=3, tempo_reabertura=10, relogio=relogio)
+
+        for _ in range(2):
+            disjuntor.registrar_falha()
+        self.assertEqual(disjuntor.estado, "fechado")
+        disjuntor.registrar_falha()
+        self.assertEqual(disjuntor.estado, "aberto")
+        self.assertFalse(disjuntor.permite())
+
+        relogio.agora = 10
+        self.assertEqual(disjuntor.estado, "meio_aberto")
+        self.assertTrue(disjuntor.permite())
+        self.assertFalse(disjuntor.permite())  # apenas uma consulta de teste
+
+        # A consulta de teste falhou: volta a abrir
+        disjuntor.registrar_falha()
+        self.assertEqual(disjuntor.estado, "aberto")
+
+        relogio.agora = 20
+        self.assertTrue(disjuntor.permite())
+        disjuntor.registrar_sucesso()
+        self.assertEqual(disjuntor.estado, "fechado")
+        self.assertTrue(disjuntor.permite())
+
+    def test_sucesso_zera_falhas(self):
+        """Testa que só falhas seguidas abrem o disjuntor"""
+        disjuntor = DisjuntorCircuito(limite_falhas=2)
+        disjuntor.registrar_falha()
+        disjuntor.registrar_sucesso()
+        disjuntor.registrar_falha()
+        self.assertEqual(disjuntor.estado, "fechado")
+
+
+class TestProvedores(unittest.TestCase):
+
+    def setUp(self):
+        self.servidores = {}
+        for formato in ("viacep", "brasilapi", "opencep"):
+            self.servidores[formato] = iniciar_servidor(formato)
+
+    def tearDown(self):
+        for servidor in self.servidores.values():
+            servidor.shutdown()
+            servidor.server_close()
+
+    def test_formato_normalizado(self):
+        """Testa que todos os provedores respondem com Endereco ou ErroCep"""
+        classes = {"viacep": ProvedorViaCep, "brasilapi": ProvedorBrasilApi,
+                   "opencep": ProvedorOpenCep}
+        for formato, classe in classes.items():
+            with self.subTest(provedor=formato):
+                provedor = classe(url(self.servidores[formato]))
+                endereco = provedor.consultar("01310100")
+                self.assertIsInstance(endereco, Endereco)
+                for campo in ("cep", "logradouro", "bairro", "localidade", "uf"):
+                    self.assertEqual(getattr(endereco, campo), PAULISTA[campo])
+                self.assertEqual(
+                    provedor.consultar("99999999"), ErroCep("nao_encontrado", "CEP não encontrado")
+                )
+                provedor.fechar()
+
+    def test_erro_http(self):
+        """Testa o erro retornado quando o provedor falha"""
+        servidor = self.servidores["viacep"]
+        servidor.falhas_restantes = 1
+        resultado = ProvedorViaCep(url(servidor)).consultar("01310100")
+        self.assertEqual(cep.classificar_resposta_cep(resultado), "erro_consulta")
+
+    def test_sessao_unica_entre_threads(self):
+        """Testa que threads simultâneas compartilham uma única sessão"""
+        import requests
+
+        criadas = []
+        barreira = threading.Barrier(8)
+
+        class _Sessao(requests.Session):
+            def __init__(self):
+                time.sleep(0.01)
+                super().__init__()
+                criadas.append(self)
+
+        provedor = ProvedorViaCep()
+        sessoes = []
+
+        def obter():
+            barreira.wait(5)
+            sessoes.append(provedor._obter_sessao())
+
+        with mock.patch.object(requests, "Session", _Sessao):
+            threads = [threading.Thread(target=obter) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        provedor.fechar()
+
+        self.assertEqual(len(criadas), 1)
+        self.assertEqual({id(sessao) for sessao in sessoes}, {id(criadas[0])})
+
+    def test_provedor_arquivo(self):
+        """Testa o provedor baseado em uma base local"""
+        with tempfile.TemporaryDirectory() as diretorio:
+            origem = os.path.join(diretorio, "ceps.jsonl")
+            with open(origem, "w", encoding="utf-8") as arquivo:
+                arquivo.write(json.dumps(PAULISTA) + "\n")
+            indice = os.path.join(diretorio, "ceps.idx")
+            construir_indice_cep(origem, indice)
+
+            provedor = ProvedorArquivo(indice)
+            try:
+                self.assertEqual(provedor.consultar("01310100").logradouro, "Avenida Paulista")
+                self.assertEqual(provedor.consultar("99999999").motivo, "nao_encontrado")
+            finally:
+                provedor.fechar()
+
+
+class TestResolvedorCep(unittest.TestCase):
+
+    def setUp(self):
+        self.servidores = []
+
+    def tearDown(self):
+        for servidor in self.servidores:
+            servidor.shutdown()
+            servidor.server_close()
+
+    def _resolvedor(self, formatos_atrasos, **opcoes):
+        provedores = []
+        for indice, (formato, atraso) in enumerate(formatos_atrasos):
+            servidor = iniciar_servidor(formato, atraso)
+            self.servidores.append(servidor)
+            provedores.append(ProvedorViaCep(url(servidor), nome=f"{formato}{indice}")
+                              if formato == "viacep" else
+                              ProvedorBrasilApi(url(servidor), nome=f"{formato}{indice}"))
+        resolvedor = ResolvedorCep(provedores, **opcoes)
+        self.addCleanup(resolvedor.fechar)
+        return resolvedor
+
+    def test_failover(self):
+        """Testa a consulta ao próximo provedor quando o primeiro falha"""
+        resolvedor = self._resolvedor([("viacep", 0), ("brasilapi", 0)], atraso_hedge=None)
+        self.servidores[0].falhas_restantes = 1
+
+        self.assertEqual(resolvedor.buscar("01310-100")["localidade"], "São Paulo")
+        self.assertEqual([s.requisicoes for s in self.servidores], [1, 1])
+
+        # Resposta definitiva do primeiro provedor: o segundo não é consultado
+        self.assertEqual(resolvedor.buscar("99999-999"), {"erro": "CEP não encontrado"})
+        self.assertEqual([s.requisicoes for s in self.servidores], [2, 1])
+        self.assertEqual(resolvedor.buscar("123"), {"erro": "CEP inválido"})
+
+    def test_hedge(self):
+        """Testa a consulta em paralelo quando o primeiro provedor demora"""
+        resolvedor = self._resolvedor([("viacep", 1.0), ("brasilapi", 0)], atraso_hedge=0.05)
+
+        inicio = time.monotonic()
+        resultado = resolvedor.buscar("01310100")
+        self.assertLess(time.monotonic() - inicio, 0.8)
+        self.assertEqual(resultado["logradouro"], "Avenida Paulista")
+        self.assertEqual([s.requisicoes for s in self.servidores], [1, 1])
+
+    def test_timeout(self):
+        """Testa o tempo máximo de uma busca"""
+        resolvedor = self._resolvedor([("viacep", 1.0)], timeout=0.1)
+        resultado = resolvedor.buscar("01310100")
+        self.assertEqual(resultado, {"erro": "Erro na consulta: tempo esgotado após 0.1s"})
+
+    def test_disjuntor_evita_provedor(self):
+        """Testa que o provedor com o disjuntor aberto não é consultado"""
+        resolvedor = self._resolvedor(
+            [("viacep", 0), ("brasilapi", 0)], atraso_hedge=None, limite_falhas=2
+        )
+        self.servidores[0].falhas_restantes = 100
+
+        for _ in range(4):
+            self.assertEqual(resolvedor.buscar("01310100")["uf"], "SP")
+        self.assertEqual(resolvedor.disjuntores["viacep0"].estado, "aberto")
+        self.assertEqual([s.requisicoes for s in self.servidores], [2, 4])
+
+    def test_todos_indisponiveis(self):
+        """Testa o erro quando todos os provedores falham"""
+        resolvedor = self._resolvedor([("viacep", 0), ("brasilapi", 0)], limite_falhas=1)
+        for servidor in self.servidores:
+            servidor.falhas_restantes = 100
+
+        # Erro do último provedor consultado
+        resultado = resolvedor.buscar("01310100")
+        self.assertEqual(cep.classificar_resposta_cep(resultado), "erro_consulta")
+        self.assertEqual([s.requisicoes for s in self.servidores], [1, 1])
+        self.assertIn("disjuntores abertos", resolvedor.buscar("01310100")["erro"])
+
+    def test_nomes_repetidos(self):
+        """Testa que cada provedor precisa de um nome próprio"""
+        with self.assertRaises(ValueError):
+            ResolvedorCep([ProvedorViaCep(), ProvedorViaCep()])
+
+    def test_buscar_ceps(self):
+        """Testa a busca em lote, na ordem recebida e sem consultas repetidas"""
+        resolvedor = self._resolvedor([("viacep", 0)])
+        ceps = ["01310-100", "99999999", "123", "01310100"] * 5
+
+        resultados = buscar_ceps(ceps, resolvedor=resolvedor)
+        self.assertEqual(len(resultados), len(ceps))
+        self.assertEqual(resultados[:4], [
+            PAULISTA, {"erro": "CEP não encontrado"}, {"erro": "CEP inválido"}, PAULISTA
+        ])
+        self.assertEqual(resultados[4:], resultados[:4] * 4)
+        self.assertEqual(self.servidores[0].requisicoes, 2)
+
+    def test_prontos_juntos(self):
+        """Testa que respostas prontas juntas disparam no máximo um provedor"""
+        falha = ErroCep("erro_consulta", "Erro na consulta: 503")
+        encontrado = Endereco.de_dict(PAULISTA)
+        casos = [
+            # Falha e resposta definitiva juntas: nenhum provedor a mais
+            ([falha, encontrado, encontrado], [1, 1, 0]),
+            # Duas falhas juntas: apenas o próximo provedor
+            ([falha, falha, encontrado, encontrado], [1, 1, 1, 0]),
+        ]
+        for resultados, chamadas in casos:
+            with self.subTest(chamadas=chamadas):
+                barreira = threading.Barrier(2)
+                provedores = [
+                    _ProvedorMemoria(f"p{i}", r, barreira if i < 2 else None)
+                    for i, r in enumerate(resultados)
+                ]
+                resolvedor = ResolvedorCep(provedores, atraso_hedge=0.2)
+                self.addCleanup(resolvedor.fechar)
+                with mock.patch.object(cep_provedores, "wait", _esperar_todos):
+                    self.assertEqual(resolvedor.consultar("01310100"), encontrado)
+                self.assertEqual([p.chamadas for p in provedores], chamadas)
+
+    def test_base_vazia_como_backend(self):
+        """Testa que uma base local vazia continua sendo o backend padrão"""
+        base = _BaseVazia("local", ErroCep("nao_encontrado", "CEP não encontrado"))
+        cep.definir_backend_cep(base)
+        try:
+            self.assertEqual(buscar_ceps(["01310100"]), [{"erro": "CEP não encontrado"}])
+            self.assertEqual(base.chamadas, 1)
+        finally:
+            cep.definir_backend_cep(None)
+
+    def test_fechar_resolvedor_padrao(self):
+        """Testa o encerramento do resolvedor padrão (registrado no atexit)"""
+        resolvedor = cep_provedores._obter_resolvedor_padrao()
+        resolvedor._obter_executor()
+        cep_provedores._fechar_resolvedor_padrao()
+        self.assertIsNone(resolvedor._executor)
+        self.assertIsNot(cep_provedores._obter_resolvedor_padrao(), resolvedor)
+        cep_provedores._fechar_resolvedor_padrao()
+
+    def test_backend_de_buscar_cep(self):
+        """Testa o resolvedor como backend de buscar_cep"""
+        resolvedor = self._resolvedor([("brasilapi", 0)])
+        cep.definir_backend_cep(resolvedor)
+        try:
+            self.assertEqual(cep.buscar_cep("01310-100")["bairro"], "Bela Vista")
+            self.assertEqual(buscar_ceps(["01310100"])[0]["bairro"], "Bela Vista")
+        finally:
+            cep.definir_backend_cep(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Testes unitários para a linha de comando do brasil_utils
+"""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from brasil_utils.cli import (
+    main, limpar_arquivo, interpretar_regra, formatar_valor, validar_valor
+)
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.diretorio.cleanup)
+
+    def caminho(self, nome):
+        return os.path.join(self.diretorio.name, nome)
+
+    def escrever_csv(self, nome, linhas):
+        with open(self.caminho(nome), 'w', encoding='utf-8', newline='') as arquivo:
+            escritor = csv.DictWriter(arquivo, fieldnames=list(linhas[0]))
+            escritor.writeheader()
+            escritor.writerows(linhas)
+
+    def ler_csv(self, nome):
+        with open(self.caminho(nome), encoding='utf-8', newline='') as arquivo:
+            return list(csv.DictReader(arquivo))
+
+    def test_interpretar_regra(self):
+        """Testa a expansão de atalhos e operações"""
+        self.assertEqual(interpretar_regra("doc:cpf"), ("doc", ("validar_cpf", "formatar_cpf")))
+        self.assertEqual(interpretar_regra("fone:formatar_telefone"),
+                         ("fone", ("formatar_telefone",)))
+        with self.assertRaises(ValueError):
+            interpretar_regra("doc:inexistente")
+        with self.assertRaises(ValueError):
+            interpretar_regra("sem_operacao")
+
+    def test_limpar_csv(self):
+        """Testa a limpeza de CSV com arquivo de rejeitados"""
+        self.escrever_csv('entrada.csv', [
+            {'nome': 'Ana', 'cpf': '12345678909', 'fone': '11999887766', 'valor': '1234.5'},
+            {'nome': 'Bia', 'cpf': '11111111111', 'fone': '11999887766', 'valor': '10'},
+            {'nome': 'Caio', 'cpf': '111.444.777-35', 'fone': '123', 'valor': '10'},
+            {'nome': 'Davi', 'cpf': '111.444.777-35', 'fone': '1133334444', 'valor': '1.000,00'},
+        ])
+
+        codigo = main([
+            'limpar', self.caminho('entrada.csv'),
+            '-c', 'cpf:cpf', '-c', 'fone:telefone', '-c', 'valor:real',
+            '--tamanho-lote', '2'
+        ])
+        self.assertEqual(codigo, 0)
+
+        limpas = self.ler_csv('entrada.limpo.csv')
+        self.assertEqual([l['nome'] for l in limpas], ['Ana', 'Davi'])
+        self.assertEqual(limpas[0]['cpf'], '123.456.789-09')
+        self.assertEqual(limpas[0]['fone'], '(11) 99988-7766')
+        self.assertEqual(limpas[0]['valor'], 'R$ 1.234,50')
+        self.assertEqual(limpas[1]['valor'], 'R$ 1.000,00')
+
+        rejeitadas = self.ler_csv('entrada.rejeitados.csv')
+        self.assertEqual([(l['nome'], l['erro']) for l in rejeitadas],
+                         [('Bia', 'cpf: validar_cpf'), ('Caio', 'fone: validar_telefone')])
+        self.assertEqual(rejeitadas[0]['cpf'], '11111111111')
+
+    def test_valores(self):
+        """Testa os separadores decimais e a recusa de valores não finitos"""
+        casos = [
+            ('1234.5', 'R$ 1.234,50'), ('1.234,56', 'R$ 1.234,56'), ('1,234.56', 'R$ 1.234,56'),
+            ('1,5', 'R$ 1,50'), ('1.234.567,8', 'R$ 1.234.567,80'),
+        ]
+        for valor, esperado in casos:
+            with self.subTest(valor=valor):
+                self.assertTrue(validar_valor(valor))
+                self.assertEqual(formatar_valor(valor), esperado)
+
+        for valor in ('nan', 'inf', '-Infinity', 'abc', ''):
+            with self.subTest(valor=valor):
+                self.assertFalse(validar_valor(valor))
+
+    def test_telefones_formatados_como_validados(self):
+        """Testa a formatação dos telefones aceitos pela validação"""
+        fones = ['0800 123 4567', '+55 11 3222-1234', '011 99999-8888']
+        self.escrever_csv('fones.csv', [{'fone': fone} for fone in fones])
+
+        aceitas, recusadas = limpar_arquivo(
+            self.caminho('fones.csv'), self.caminho('saida.csv'),
+            self.caminho('rejeitados.csv'), ['fone:telefone']
+        )
+        self.assertEqual((aceitas, recusadas), (3, 0))
+        self.assertEqual([l['fone'] for l in self.ler_csv('saida.csv')],
+                         ['0800 123 4567', '(11) 3222-1234', '(11) 99999-8888'])
+
+    def test_limpar_jsonl_em_paralelo(self):
+        """Testa JSONL com lotes distribuídos entre processos, mantendo a ordem"""
+        with open(self.caminho('entrada.jsonl'), 'w', encoding='utf-8') as arquivo:
+            for i in range(50):
+                cep = '01310100' if i % 5 else '0131'
+                arquivo.write(json.dumps({'id': i, 'cep': cep}) + '\n')
+
+        aceitas, recusadas = limpar_arquivo(
+            self.caminho('entrada.jsonl'), self.caminho('saida.jsonl'),
+            self.caminho('rejeitados.jsonl'), ['cep:cep'],
+            tamanho_lote=7, processos=2
+        )
+        self.assertEqual((aceitas, recusadas), (40, 10))
+
+        with open(self.caminho('saida.jsonl'), encoding='utf-8') as arquivo:
+            linhas = [json.loads(linha) for linha in arquivo]
+        self.assertEqual([l['id'] for l in linhas], [i for i in range(50) if i % 5])
+        self.assertEqual(linhas[0]['cep'], '01310-100')
+
+
+if __name__ == '__main__':
+    unittest.main()
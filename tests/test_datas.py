@@ -0,0 +1,70 @@
+"""
+Testes unitários para o módulo datas do brasil_utils
+"""
+
+import unittest
+from datetime import date, datetime
+
+from brasil_utils.datas import ConversorDatas, converter_data, converter_datas, FORMATOS_PADRAO
+from brasil_utils.formatadores import formatar_data_brasileira
+from brasil_utils.feriados import eh_feriado
+
+
+def converter_strptime(texto, formatos=FORMATOS_PADRAO):
+    """Implementação de referência com strptime"""
+    for formato in formatos:
+        try:
+            return datetime.strptime(texto, formato).date()
+        except ValueError:
+            continue
+    return None
+
+
+class TestDatas(unittest.TestCase):
+
+    TEXTOS = [
+        "2024-12-25", "25/12/2024", "25-12-2024", "2024/12/25",
+        "2024-1-5", "5/1/2024", "2024-02-29", "2023-02-29", "2000-02-29", "1900-02-29",
+        "31/04/2024", "00/01/2024", "2024-13-01", "2024-12-25T10:00", "24-12-25",
+        "", "abc", "2024--12", "12/25/2024", "2024/12-25", "0000-01-01",
+    ]
+
+    def test_confere_com_strptime(self):
+        """Testa que o resultado confere com datetime.strptime"""
+        for texto in self.TEXTOS:
+            with self.subTest(texto=texto):
+                self.assertEqual(converter_data(texto), converter_strptime(texto))
+
+    def test_conversor_memoriza_formato(self):
+        """Testa a memorização do formato detectado"""
+        conversor = ConversorDatas()
+        self.assertEqual(conversor.converter("25/12/2024"), date(2024, 12, 25))
+        self.assertEqual(conversor.formato, "%d/%m/%Y")
+        self.assertEqual(conversor.converter("01/01/2025"), date(2025, 1, 1))
+        self.assertEqual(conversor.converter("2025-01-02"), date(2025, 1, 2))
+        self.assertEqual(conversor.formato, "%Y-%m-%d")
+
+    def test_formatos_restritos(self):
+        """Testa conversor limitado a alguns formatos"""
+        conversor = ConversorDatas(("%Y-%m-%d",))
+        self.assertIsNone(conversor.converter("25/12/2024"))
+        with self.assertRaises(ValueError):
+            ConversorDatas(("%m/%d/%Y",))
+
+    def test_lote(self):
+        """Testa a conversão de uma coluna inteira"""
+        self.assertEqual(converter_datas(self.TEXTOS),
+                         [converter_strptime(texto) for texto in self.TEXTOS])
+
+    def test_uso_em_formatadores_e_feriados(self):
+        """Testa formatar_data_brasileira e eh_feriado com texto"""
+        self.assertEqual(formatar_data_brasileira("2024-12-25"), "25/12/2024")
+        self.assertEqual(formatar_data_brasileira("25-12-2024", "%Y-%m-%d"), "2024-12-25")
+        self.assertEqual(formatar_data_brasileira("data inválida"), "data inválida")
+        self.assertTrue(eh_feriado("25/12/2024"))
+        self.assertTrue(eh_feriado("2024-12-25"))
+        self.assertFalse(eh_feriado("25-12-2024"))
+
+
+if __name__ == '__main__':
+    unittest.main()
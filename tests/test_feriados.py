@@ -0,0 +1,272 @@
+"""
+Testes unitários para o módulo feriados do brasil_utils
+"""
+
+import unittest
+from datetime import date, datetime, timedelta
+
+from brasil_utils.feriados import (
+    CalendarioUteis, dias_uteis_entre, eh_feriado, todos_feriados, feriados_ordenados,
+    configurar_cache_feriados, limpar_cache_feriados, estatisticas_cache_feriados,
+    TAMANHO_CACHE_PADRAO, dias_uteis_entre_lote, adicionar_dias_uteis_lote, calcular_pascoa,
+    _pascoa_gregoriana, LinhaDoTempoFeriados, proximo_feriado, feriados_por_mes
+)
+from brasil_utils._tabela_feriados import ANO_INICIAL, ANO_FINAL
+from brasil_utils.tipos import Feriado
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _somar_dias_uteis(data, dias):
+    """Implementação de referência, dia a dia"""
+    passo = 1 if dias > 0 else -1
+    while dias:
+        data += timedelta(days=passo)
+        if data.weekday() < 5 and not eh_feriado(data):
+            dias -= passo
+    return data
+
+
+class TestPascoa(unittest.TestCase):
+
+    def test_datas_conhecidas(self):
+        """Testa a Páscoa de anos conhecidos, dentro e fora da tabela"""
+        conhecidas = [
+            date(1818, 3, 22), date(1900, 4, 15), date(1943, 4, 25), date(2000, 4, 23),
+            date(2024, 3, 31), date(2025, 4, 20), date(2038, 4, 25), date(2200, 4, 6),
+            date(2285, 3, 22), date(3000, 4, 13),
+        ]
+        for pascoa in conhecidas:
+            self.assertEqual(calcular_pascoa(pascoa.year), pascoa)
+            self.assertEqual(pascoa.weekday(), 6)
+
+    def test_tabela_confere_com_algoritmo(self):
+        """Testa a tabela pré-calculada contra o cálculo"""
+        for ano in range(ANO_INICIAL, ANO_FINAL + 1):
+            self.assertEqual(calcular_pascoa(ano), _pascoa_gregoriana(ano), ano)
+
+    def test_feriados_moveis(self):
+        """Testa os feriados derivados da Páscoa"""
+        feriados = todos_feriados(2025)
+        self.assertEqual(feriados['Sexta-feira Santa'], date(2025, 4, 18))
+        self.assertEqual(feriados['Corpus Christi'], date(2025, 6, 19))
+        self.assertEqual(
+            todos_feriados(2250)['Sexta-feira Santa'], calcular_pascoa(2250) - timedelta(days=2)
+        )
+
+
+class TestCalendarioUteis(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.calendario = CalendarioUteis(2020, 2026)
+
+    def test_dias_uteis_entre_confere_com_funcao(self):
+        """Testa que a contagem confere com dias_uteis_entre"""
+        pares = [
+            (date(2024, 1, 1), date(2024, 12, 31)),
+            (date(2024, 2, 9), date(2024, 2, 14)),
+            (date(2025, 5, 1), date(2025, 5, 1)),
+            (date(2026, 1, 5), date(2020, 3, 2)),
+            (datetime(2023, 4, 6, 15), date(2023, 4, 10)),
+        ]
+        for inicio, fim in pares:
+            with self.subTest(inicio=inicio, fim=fim):
+                self.assertEqual(
+                    self.calendario.dias_uteis_entre(inicio, fim),
+                    dias_uteis_entre(inicio, fim)
+                )
+
+    def test_adicionar_dias_uteis(self):
+        """Testa soma e subtração de dias úteis"""
+        datas = [date(2024, 12, 24), date(2024, 2, 10), date(2025, 4, 18)]
+        for data in datas:
+            for dias in (-7, -1, 1, 3, 30):
+                with self.subTest(data=data, dias=dias):
+                    self.assertEqual(
+                        self.calendario.adicionar_dias_uteis(data, dias),
+                        _somar_dias_uteis(data, dias)
+                    )
+        self.assertEqual(self.calendario.adicionar_dias_uteis(date(2024, 2, 10), 0),
+                         date(2024, 2, 10))
+
+    def test_proximo_e_anterior_dia_util(self):
+        """Testa próximo dia útil e dia útil anterior"""
+        # Sexta-feira Santa de 2024 (29/03) seguida de fim de semana
+        self.assertEqual(self.calendario.proximo_dia_util(date(2024, 3, 28)),
+                         date(2024, 4, 1))
+        self.assertEqual(self.calendario.dia_util_anterior(date(2024, 4, 1)),
+                         date(2024, 3, 28))
+        self.assertFalse(self.calendario.eh_dia_util(date(2024, 12, 25)))
+        self.assertTrue(self.calendario.eh_dia_util(date(2024, 12, 26)))
+
+    def test_fora_do_intervalo(self):
+        """Testa datas fora do intervalo do calendário"""
+        with self.assertRaises(ValueError):
+            self.calendario.dias_uteis_entre(date(2019, 12, 31), date(2020, 1, 2))
+        with self.assertRaises(ValueError):
+            self.calendario.adicionar_dias_uteis(date(2026, 12, 30), 5)
+
+
+
+class TestCacheFeriados(unittest.TestCase):
+
+    def setUp(self):
+        limpar_cache_feriados()
+
+    def tearDown(self):
+        configurar_cache_feriados(TAMANHO_CACHE_PADRAO)
+        limpar_cache_feriados()
+
+    def test_estatisticas_acertos_e_falhas(self):
+        """Testa a contagem de acertos e falhas do cache"""
+        todos_feriados(2024)
+        eh_feriado(date(2024, 12, 25))
+        feriados_ordenados(2024)
+        estatisticas = estatisticas_cache_feriados()
+        self.assertEqual(estatisticas['falhas'], 1)
+        self.assertEqual(estatisticas['acertos'], 2)
+        self.assertEqual(estatisticas['tamanho'], 1)
+
+    def test_limite_e_invalidacao(self):
+        """Testa a remoção do ano menos usado e a invalidação explícita"""
+        configurar_cache_feriados(2)
+        for ano in (2020, 2021, 2022):
+            todos_feriados(ano)
+        self.assertEqual(estatisticas_cache_feriados()['tamanho'], 2)
+
+        todos_feriados(2020)
+        self.assertEqual(estatisticas_cache_feriados()['falhas'], 4)
+
+        limpar_cache_feriados(2020)
+        self.assertEqual(estatisticas_cache_feriados()['tamanho'], 1)
+
+    def test_resultado_imutavel(self):
+        """Testa que o resultado compartilhado não pode ser alterado"""
+        feriados = todos_feriados(2024)
+        with self.assertRaises(TypeError):
+            feriados['Novo'] = date(2024, 6, 1)
+        self.assertEqual(feriados_ordenados(2024)[0], Feriado(date(2024, 1, 1), 'Ano Novo'))
+        self.assertEqual(feriados_ordenados(2024)[-1], Feriado(date(2024, 12, 25), 'Natal'))
+
+
+class TestLinhaDoTempoFeriados(unittest.TestCase):
+
+    def setUp(self):
+        self.linha = LinhaDoTempoFeriados(2023, 2026)
+        self.feriados = sorted(
+            Feriado(data, nome)
+            for ano in range(2023, 2027) for nome, data in todos_feriados(ano).items()
+        )
+
+    def test_proximo_e_anterior(self):
+        """Testa próximo e anterior contra a lista completa, dia a dia"""
+        data = date(2023, 1, 1)
+        while data < date(2026, 12, 25):
+            esperado = next(item for item in self.feriados if item.data > data)
+            self.assertEqual(self.linha.proximo(data), esperado)
+            self.assertEqual(proximo_feriado(data), (esperado.nome, esperado.data))
+            if data > date(2023, 1, 1):
+                esperado = [item for item in self.feriados if item.data < data][-1]
+                self.assertEqual(self.linha.anterior(data), esperado)
+            data += timedelta(days=1)
+
+    def test_consultas_por_intervalo(self):
+        """Testa entre, proximos e por_mes"""
+        self.assertEqual(
+            self.linha.entre(date(2024, 12, 25), date(2025, 3, 4)),
+            [Feriado(date(2024, 12, 25), 'Natal'), Feriado(date(2025, 1, 1), 'Ano Novo'),
+             Feriado(date(2025, 3, 4), 'Carnaval')]
+        )
+        self.assertEqual(
+            self.linha.entre(date(2025, 3, 4), date(2024, 12, 25)),
+            self.linha.entre(date(2024, 12, 25), date(2025, 3, 4))
+        )
+        self.assertEqual(self.linha.entre(date(2024, 1, 2), date(2024, 1, 31)), [])
+        self.assertEqual(
+            self.linha.proximos(date(2024, 11, 1), 3),
+            [Feriado(date(2024, 11, 2), 'Finados'),
+             Feriado(date(2024, 11, 15), 'Proclamação da República'),
+             Feriado(date(2024, 12, 25), 'Natal')]
+        )
+        self.assertEqual(len(self.linha.proximos(date(2026, 12, 1), 5)), 1)
+
+        for ano in range(2023, 2027):
+            for mes in range(1, 13):
+                esperado = {n: d for n, d in todos_feriados(ano).items() if d.month == mes}
+                self.assertEqual({f.nome: f.data for f in self.linha.por_mes(ano, mes)}, esperado)
+                self.assertEqual(feriados_por_mes(ano, mes), esperado)
+
+    def test_limites(self):
+        """Testa consultas fora do intervalo e a função fora da tabela"""
+        with self.assertRaises(ValueError):
+            self.linha.proximo(date(2027, 1, 1))
+        with self.assertRaises(ValueError):
+            self.linha.proximo(date(2026, 12, 26))
+        with self.assertRaises(ValueError):
+            self.linha.anterior(date(2023, 1, 1))
+        self.assertEqual(proximo_feriado(date(2200, 12, 26)), ('Ano Novo', date(2201, 1, 1)))
+        self.assertEqual(len(self.linha), len(self.feriados))
+
+    def test_regional(self):
+        """Testa a linha do tempo com feriados municipais"""
+        linha = LinhaDoTempoFeriados(2024, 2024, municipio='3550308')
+        self.assertEqual(
+            linha.proximo(date(2024, 1, 1)), Feriado(date(2024, 1, 25), 'Aniversário de São Paulo')
+        )
+        self.assertEqual(
+            linha.por_mes(2024, 7), [Feriado(date(2024, 7, 9), 'Revolução Constitucionalista')]
+        )
+        self.assertIsInstance(self.linha.anterior(date(2024, 1, 2)), Feriado)
+
+
+@unittest.skipIf(np is None, "NumPy não instalado")
+class TestDiasUteisLote(unittest.TestCase):
+
+    def setUp(self):
+        self.calendario = CalendarioUteis(2020, 2030)
+        inicio = date(2024, 12, 18)
+        self.datas = [inicio + timedelta(days=i) for i in range(20)]
+
+    def test_contagem_confere_com_escalar(self):
+        """Testa a contagem em lote contra dias_uteis_entre"""
+        fins = [d + timedelta(days=(i * 37) % 90 - 45) for i, d in enumerate(self.datas)]
+        resultado = dias_uteis_entre_lote(self.datas, fins)
+        esperado = [dias_uteis_entre(a, b) for a, b in zip(self.datas, fins)]
+        self.assertEqual(resultado.tolist(), esperado)
+
+        resultado = dias_uteis_entre_lote(self.datas, fins, incluir_feriados=True)
+        esperado = [dias_uteis_entre(a, b, True) for a, b in zip(self.datas, fins)]
+        self.assertEqual(resultado.tolist(), esperado)
+
+    def test_soma_confere_com_calendario(self):
+        """Testa a soma em lote contra CalendarioUteis, inclusive em fins de semana"""
+        for dias in (-400, -3, -1, 0, 1, 2, 5, 400):
+            resultado = adicionar_dias_uteis_lote(np.array(self.datas, dtype='datetime64[D]'), dias)
+            esperado = [self.calendario.adicionar_dias_uteis(d, dias) for d in self.datas]
+            self.assertEqual(resultado.astype(object).tolist(), esperado, dias)
+
+    def test_dias_por_elemento_e_nat(self):
+        """Testa dias diferentes por data e datas ausentes"""
+        resultado = adicionar_dias_uteis_lote(
+            np.array(['2024-12-21', '2024-12-24', 'NaT'], dtype='datetime64[ns]'), [3, 1, 1]
+        )
+        self.assertEqual(resultado[0], np.datetime64('2024-12-26'))
+        self.assertEqual(resultado[1], np.datetime64('2024-12-26'))
+        self.assertTrue(np.isnat(resultado[2]))
+
+    def test_contagem_com_nat(self):
+        """Testa que pares com NaT resultam em -1 sem afetar os demais"""
+        resultado = dias_uteis_entre_lote(
+            ['2024-01-01', 'NaT', '2024-01-08'], ['2024-01-05', '2024-01-05', 'NaT']
+        )
+        esperado = dias_uteis_entre(date(2024, 1, 1), date(2024, 1, 5))
+        self.assertEqual(resultado.tolist(), [esperado, -1, -1])
+        self.assertEqual(dias_uteis_entre_lote(['NaT'], ['NaT']).tolist(), [-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
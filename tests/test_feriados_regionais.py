@@ -0,0 +1,146 @@
+"""
+Testes unitários para o módulo feriados_regionais do brasil_utils
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+from brasil_utils.feriados import (
+    eh_feriado, todos_feriados, CalendarioUteis, configurar_cache_feriados, TAMANHO_CACHE_PADRAO,
+    estatisticas_cache_feriados, limpar_cache_feriados
+)
+from brasil_utils.feriados_regionais import (
+    registrar_feriado, carregar_feriados, limpar_feriados_regionais, feriados_regionais,
+    datas_feriados_regionais
+)
+
+SAO_PAULO = '3550308'
+CAMPINAS = '3509502'
+RIO = '3304557'
+
+
+class TestFeriadosRegionais(unittest.TestCase):
+
+    def tearDown(self):
+        limpar_feriados_regionais(restaurar_padrao=True)
+
+    def test_camadas(self):
+        """Testa feriados nacionais, estaduais e municipais em camadas"""
+        revolucao = date(2024, 7, 9)
+        aniversario = date(2024, 1, 25)
+
+        self.assertFalse(eh_feriado(revolucao))
+        self.assertTrue(eh_feriado(revolucao, uf='SP'))
+        self.assertTrue(eh_feriado(revolucao, uf='sp'))
+        self.assertFalse(eh_feriado(revolucao, uf='RJ'))
+
+        # O município herda os feriados da UF indicada pelo código IBGE
+        self.assertTrue(eh_feriado(revolucao, municipio=SAO_PAULO))
+        self.assertTrue(eh_feriado(revolucao, municipio=int(CAMPINAS)))
+        self.assertTrue(eh_feriado(aniversario, municipio=SAO_PAULO))
+        self.assertFalse(eh_feriado(aniversario, municipio=CAMPINAS))
+        self.assertFalse(eh_feriado(aniversario, uf='SP'))
+
+        # Os feriados nacionais continuam valendo
+        self.assertTrue(eh_feriado(date(2024, 12, 25), municipio=RIO))
+        self.assertTrue(eh_feriado("20/01/2024", municipio=RIO))
+
+    def test_local_invalido(self):
+        """Testa UF e código IBGE inválidos"""
+        with self.assertRaises(ValueError):
+            eh_feriado(date(2024, 7, 9), uf='XX')
+        with self.assertRaises(ValueError):
+            eh_feriado(date(2024, 7, 9), municipio='9999999')
+        with self.assertRaises(ValueError):
+            registrar_feriado('SP', 'Inválido', '31/02')
+
+    def test_registrar_e_listar(self):
+        """Testa o cadastro de feriados fixos, móveis e com vigência"""
+        registrar_feriado(CAMPINAS, 'Aniversário de Campinas', '14/07', ano_inicio=2020)
+        registrar_feriado(CAMPINAS, 'Dia Móvel', 'pascoa+1')
+
+        self.assertTrue(eh_feriado(date(2024, 7, 14), municipio=CAMPINAS))
+        self.assertFalse(eh_feriado(date(2019, 7, 14), municipio=CAMPINAS))
+        self.assertTrue(eh_feriado(date(2024, 4, 1), municipio=CAMPINAS))
+
+        self.assertEqual(feriados_regionais(2024, municipio=CAMPINAS), {
+            'Revolução Constitucionalista': date(2024, 7, 9),
+            'Aniversário de Campinas': date(2024, 7, 14),
+            'Dia Móvel': date(2024, 4, 1),
+        })
+        self.assertEqual(
+            datas_feriados_regionais(2024, municipio=CAMPINAS),
+            [date(2024, 4, 1), date(2024, 7, 9), date(2024, 7, 14)]
+        )
+
+        feriados = todos_feriados(2024, municipio=CAMPINAS)
+        self.assertEqual(feriados['Natal'], date(2024, 12, 25))
+        self.assertEqual(feriados['Aniversário de Campinas'], date(2024, 7, 14))
+        self.assertNotIn('Aniversário de Campinas', todos_feriados(2024))
+
+    def test_carregar_arquivo(self):
+        """Testa a carga de feriados a partir de CSV"""
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, 'feriados.csv')
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                arquivo.write("local,nome,data,ano_inicio,ano_fim\n")
+                arquivo.write("MG,Teste Estadual,10/10,,\n")
+                arquivo.write("3106200,Teste Municipal,11/10,2024,2024\n")
+            self.assertEqual(carregar_feriados(caminho), 2)
+
+        self.assertTrue(eh_feriado(date(2024, 10, 10), uf='MG'))
+        self.assertTrue(eh_feriado(date(2024, 10, 11), municipio='3106200'))
+        self.assertFalse(eh_feriado(date(2025, 10, 11), municipio='3106200'))
+
+    def test_limpar(self):
+        """Testa a remoção dos feriados cadastrados"""
+        limpar_feriados_regionais()
+        self.assertFalse(eh_feriado(date(2024, 7, 9), uf='SP'))
+        self.assertEqual(feriados_regionais(2024, municipio=SAO_PAULO), {})
+
+    def test_cache_de_anos_limitado(self):
+        """Testa o limite das tabelas compiladas por ano"""
+        configurar_cache_feriados(3)
+        try:
+            for ano in range(2020, 2030):
+                self.assertTrue(eh_feriado(date(ano, 7, 9), uf='SP'))
+            self.assertEqual(estatisticas_cache_feriados()['regionais']['tamanho'], 3)
+
+            # Cadastro novo: as tabelas são descartadas e recompiladas
+            registrar_feriado('SP', 'Teste', '10/07')
+            self.assertEqual(estatisticas_cache_feriados()['regionais']['tamanho'], 0)
+            self.assertTrue(eh_feriado(date(2028, 7, 10), uf='SP'))
+
+            configurar_cache_feriados(0)
+            eh_feriado(date(2024, 7, 9), uf='SP')
+            self.assertEqual(estatisticas_cache_feriados()['regionais']['tamanho'], 0)
+        finally:
+            configurar_cache_feriados(TAMANHO_CACHE_PADRAO)
+
+    def test_limpar_cache_inclui_regionais(self):
+        """Testa que limpar_cache_feriados também esvazia o cache regional"""
+        limpar_cache_feriados()
+        eh_feriado(date(2024, 7, 9), uf='SP')
+        eh_feriado(date(2024, 7, 9), uf='SP')
+        regionais = estatisticas_cache_feriados()['regionais']
+        self.assertEqual((regionais['tamanho'], regionais['acertos']), (1, 1))
+
+        limpar_cache_feriados()
+        regionais = estatisticas_cache_feriados()['regionais']
+        self.assertEqual((regionais['tamanho'], regionais['acertos']), (0, 0))
+        self.assertTrue(eh_feriado(date(2024, 7, 9), uf='SP'))
+
+    def test_calendario_uteis(self):
+        """Testa CalendarioUteis com feriados municipais"""
+        calendario = CalendarioUteis(2024, 2024, municipio=SAO_PAULO)
+        inicio = date(2024, 1, 1)
+        for dia in range(366):
+            data = inicio + timedelta(days=dia)
+            esperado = data.weekday() < 5 and not eh_feriado(data, municipio=SAO_PAULO)
+            self.assertEqual(calendario.eh_dia_util(data), esperado, data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Testes unitários para o módulo formatadores do brasil_utils
+"""
+
+import locale
+import os
+import tempfile
+import unittest
+from decimal import Decimal, ROUND_HALF_UP
+
+from brasil_utils.formatadores import (
+    formatar_real, formatar_real_lote,
+    remover_acentos, remover_acentos_linhas, remover_acentos_arquivo
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestFormatarReal(unittest.TestCase):
+
+    def test_formatar_real(self):
+        """Testa a formatação de valores float e int"""
+        self.assertEqual(formatar_real(1234.56), "R$ 1.234,56")
+        self.assertEqual(formatar_real(1234567.891), "R$ 1.234.567,89")
+        self.assertEqual(formatar_real(0.5, simbolo=False), "0,50")
+        self.assertEqual(formatar_real(-1000), "R$ -1.000,00")
+        self.assertEqual(formatar_real("abc"), "abc")
+
+    def test_formatar_real_decimal(self):
+        """Testa valores Decimal com modo de arredondamento explícito"""
+        self.assertEqual(formatar_real(Decimal("2.345")), "R$ 2,34")
+        self.assertEqual(formatar_real(Decimal("2.345"), arredondamento=ROUND_HALF_UP), "R$ 2,35")
+        self.assertEqual(formatar_real(Decimal("999.995"), arredondamento=ROUND_HALF_UP),
+                         "R$ 1.000,00")
+        self.assertEqual(formatar_real(Decimal("1e30")),
+                         "R$ 1.000.000.000.000.000.000.000.000.000.000,00")
+
+    def test_nao_altera_locale(self):
+        """Testa que o locale do processo não é alterado"""
+        antes = locale.setlocale(locale.LC_ALL)
+        formatar_real(1234.56)
+        self.assertEqual(locale.setlocale(locale.LC_ALL), antes)
+
+    def test_formatar_real_lote(self):
+        """Testa que o lote confere com a formatação individual"""
+        valores = [0, 1.005, -2.5, 1e9, Decimal("3.333"), "x"]
+        self.assertEqual(formatar_real_lote(valores), [formatar_real(v) for v in valores])
+        self.assertEqual(formatar_real_lote(valores, simbolo=False),
+                         [formatar_real(v, simbolo=False) for v in valores])
+
+    @unittest.skipIf(np is None, "NumPy não instalado")
+    def test_formatar_real_lote_numpy(self):
+        """Testa arrays NumPy"""
+        valores = np.array([1234.56, 0.1, -7.0])
+        self.assertEqual(formatar_real_lote(valores), ["R$ 1.234,56", "R$ 0,10", "R$ -7,00"])
+
+
+
+class TestRemoverAcentos(unittest.TestCase):
+
+    def test_portugues(self):
+        """Testa as letras acentuadas do português"""
+        self.assertEqual(remover_acentos("São João do Açaí"), "Sao Joao do Acai")
+        self.assertEqual(remover_acentos("ÁÀÃÂÄ éèêë ÍÌÎÏ óòõôö ÚÙÛÜ çÇ ñÑ"),
+                         "AAAAA eeee IIII ooooo UUUU cC nN")
+
+    def test_outras_linguas(self):
+        """Testa diacríticos latinos além do português"""
+        self.assertEqual(remover_acentos("Łódź Øresund Dvořák Ýmir ẞ"), "Lodz Oresund Dvorak Ymir ẞ")
+
+    def test_texto_decomposto(self):
+        """Testa texto com diacríticos combinantes (NFD)"""
+        self.assertEqual(remover_acentos("Jose\u0301 Conceic\u0327a\u0303o"), "Jose Conceicao")
+
+    def test_linhas_e_arquivo(self):
+        """Testa as variantes em fluxo"""
+        linhas = ["Ação\n", "plain\n", "Ênio\n"]
+        self.assertEqual(list(remover_acentos_linhas(iter(linhas))),
+                         ["Acao\n", "plain\n", "Enio\n"])
+
+        with tempfile.TemporaryDirectory() as diretorio:
+            entrada = os.path.join(diretorio, "entrada.txt")
+            saida = os.path.join(diretorio, "saida.txt")
+            with open(entrada, "w", encoding="utf-8") as arquivo:
+                arquivo.writelines(linhas)
+            self.assertEqual(remover_acentos_arquivo(entrada, saida), 3)
+            with open(saida, encoding="utf-8") as arquivo:
+                self.assertEqual(arquivo.read(), "Acao\nplain\nEnio\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
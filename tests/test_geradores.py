@@ -0,0 +1,119 @@
+"""
+Testes unitários para o módulo geradores do brasil_utils
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from brasil_utils.geradores import GeradorDocumentos, gerar_cpf, gerar_cnpj
+from brasil_utils.validadores import (
+    validar_cpf, validar_cnpj, validar_cpf_lote, validar_cnpj_lote, limpar_documento
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestGeradores(unittest.TestCase):
+
+    def test_cpf_valido_e_invalido(self):
+        """Testa CPFs válidos e com dígito verificador alterado"""
+        gerador = GeradorDocumentos(1)
+        for _ in range(500):
+            self.assertTrue(validar_cpf(gerador.cpf()))
+            invalido = gerador.cpf(valido=False)
+            self.assertFalse(validar_cpf(invalido))
+            self.assertEqual(len(invalido), 11)
+
+    def test_cnpj_valido_e_filial(self):
+        """Testa CNPJs válidos, inválidos e com número de filial"""
+        gerador = GeradorDocumentos(2)
+        for _ in range(500):
+            self.assertTrue(validar_cnpj(gerador.cnpj()))
+            self.assertFalse(validar_cnpj(gerador.cnpj(valido=False)))
+            self.assertTrue(validar_cnpj(gerador.cnpj(filial=None)))
+
+        cnpj = gerador.cnpj(formatado=True, filial=12)
+        self.assertRegex(cnpj, r'^\d{2}\.\d{3}\.\d{3}/0012-\d{2}$')
+        self.assertEqual(gerador.cnpj()[8:12], '0001')
+        with self.assertRaises(ValueError):
+            gerador.cnpj(filial=10000)
+
+    def test_formatado(self):
+        """Testa a saída formatada"""
+        self.assertRegex(gerar_cpf(formatado=True), r'^\d{3}\.\d{3}\.\d{3}-\d{2}$')
+        self.assertTrue(validar_cnpj(gerar_cnpj(formatado=True)))
+
+    def test_reprodutivel(self):
+        """Testa que a mesma semente gera a mesma sequência"""
+        primeiro = GeradorDocumentos(42)
+        segundo = GeradorDocumentos(42)
+        self.assertEqual(
+            [primeiro.cpf() for _ in range(20)], [segundo.cpf() for _ in range(20)]
+        )
+
+
+@unittest.skipIf(np is None, "NumPy não instalado")
+class TestGeradoresLote(unittest.TestCase):
+
+    def test_lote_cpf(self):
+        """Testa CPFs em lote contra o validador escalar"""
+        cpfs = GeradorDocumentos(3).lote_cpf(5000, proporcao_validos=0.5)
+        self.assertEqual(cpfs.dtype, np.dtype('S11'))
+        esperado = [validar_cpf(cpf.decode()) for cpf in cpfs]
+        self.assertEqual(validar_cpf_lote(cpfs).tolist(), esperado)
+        self.assertTrue(1500 < sum(esperado) < 3500)
+
+    def test_lote_sem_validadores_carregados(self):
+        """Testa o lote num processo novo, sem usar o NumPy de validadores"""
+        codigo = (
+            "from brasil_utils.geradores import GeradorDocumentos\n"
+            "print(GeradorDocumentos(1).lote_cpf(3).dtype)\n"
+        )
+        saida = subprocess.run(
+            [sys.executable, "-c", codigo], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(saida.stdout.strip(), "|S11")
+
+    def test_lote_cnpj_formatado(self):
+        """Testa CNPJs formatados em lote, com filial sorteada"""
+        cnpjs = GeradorDocumentos(4).lote_cnpj(5000, formatado=True, filial=None)
+        self.assertEqual(cnpjs.dtype, np.dtype('S18'))
+        self.assertTrue(validar_cnpj_lote(cnpjs).all())
+        self.assertTrue(all(validar_cnpj(cnpj.decode()) for cnpj in cnpjs[:500]))
+        self.assertGreater(len({cnpj[11:15] for cnpj in cnpjs}), 100)
+
+        self.assertFalse(validar_cnpj_lote(GeradorDocumentos(4).lote_cnpj(100, 0.0)).any())
+
+    def test_lotes_reprodutiveis(self):
+        """Testa a reprodutibilidade e a divisão em lotes"""
+        lotes = list(GeradorDocumentos(5).lotes('cpf', 25, tamanho_lote=10))
+        self.assertEqual([len(lote) for lote in lotes], [10, 10, 5])
+        self.assertEqual(
+            GeradorDocumentos(6).lote_cpf(100).tolist(), GeradorDocumentos(6).lote_cpf(100).tolist()
+        )
+        with self.assertRaises(ValueError):
+            next(GeradorDocumentos().lotes('rg', 10))
+
+    def test_gravar(self):
+        """Testa a gravação em arquivo, um documento por linha"""
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, 'cnpjs.txt')
+            gerador = GeradorDocumentos(7)
+            self.assertEqual(gerador.gravar(caminho, 'cnpj', 1001, tamanho_lote=300,
+                                            formatado=True), 1001)
+            with open(caminho, encoding='ascii') as arquivo:
+                linhas = arquivo.read().splitlines()
+
+        self.assertEqual(len(linhas), 1001)
+        self.assertTrue(all(len(linha) == 18 and validar_cnpj(linha) for linha in linhas))
+        self.assertEqual(len(limpar_documento(linhas[0])), 14)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Testes da importação sob demanda do brasil_utils
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+import brasil_utils
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Dependências que não devem ser carregadas só por importar o pacote
+PESADAS = ('requests', 'urllib3', 'dateutil', 'numpy', 'asyncio', 'sqlite3', 'ssl')
+
+
+def modulos_carregados(codigo):
+    """Executa o código num interpretador novo e retorna os módulos carregados"""
+    programa = (
+        "import json, sys\n"
+        f"{codigo}\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+    saida = subprocess.run(
+        [sys.executable, "-c", programa], capture_output=True, text=True, check=True
+    ).stdout
+    return set(json.loads(saida))
+
+
+class TestImportacao(unittest.TestCase):
+
+    def test_importar_pacote(self):
+        """Testa que importar o pacote não carrega submódulos nem dependências"""
+        carregados = modulos_carregados("import brasil_utils")
+        self.assertIn('brasil_utils', carregados)
+        self.assertEqual([m for m in carregados if m.startswith('brasil_utils.')], [])
+        for nome in PESADAS:
+            self.assertNotIn(nome, carregados)
+
+    def test_validar_cpf_nao_carrega_dependencias(self):
+        """Testa que validar um CPF ou consultar feriados não carrega dependências"""
+        carregados = modulos_carregados(
+            "import brasil_utils\n"
+            "assert brasil_utils.validar_cpf('529.982.247-25')\n"
+            "assert brasil_utils.formatar_cep('01310100') == '01310-100'\n"
+            "brasil_utils.buscar_cep\n"
+            "from datetime import date\n"
+            "assert brasil_utils.eh_feriado(date(2024, 3, 29))\n"
+        )
+        for nome in PESADAS:
+            self.assertNotIn(nome, carregados)
+
+    def test_validadores_sem_cep(self):
+        """Testa que os validadores não carregam o módulo de consulta de CEP"""
+        carregados = modulos_carregados("import brasil_utils.validadores")
+        self.assertNotIn('brasil_utils.cep', carregados)
+
+    @unittest.skipIf(numpy is None, "NumPy não instalado")
+    def test_dependencias_carregadas_no_uso(self):
+        """Testa que o NumPy é carregado na primeira operação em lote"""
+        carregados = modulos_carregados(
+            "import brasil_utils\n"
+            "assert brasil_utils.validar_cpf_lote(['529.982.247-25']).all()\n"
+        )
+        self.assertIn('numpy', carregados)
+        self.assertNotIn('requests', carregados)
+
+    @unittest.skipIf(numpy is None, "NumPy não instalado")
+    def test_importacao_com_asterisco_preserva_numpy(self):
+        """Testa que os módulos não exportam um ``np`` próprio"""
+        programa = (
+            "import numpy as np\n"
+            "from brasil_utils.validadores import *\n"
+            "from brasil_utils.feriados import *\n"
+            "from brasil_utils.geradores import *\n"
+            "validar_cpf_lote(['529.982.247-25'])\n"
+            "dias_uteis_entre_lote(['2024-01-01'], ['2024-01-05'])\n"
+            "assert np is not None and np.__name__ == 'numpy'\n"
+        )
+        subprocess.run([sys.executable, "-c", programa], check=True)
+
+    def test_exportacoes(self):
+        """Testa que todos os nomes de __all__ podem ser importados"""
+        for nome in brasil_utils.__all__:
+            self.assertIsNotNone(getattr(brasil_utils, nome), nome)
+            self.assertIn(nome, dir(brasil_utils))
+
+        from brasil_utils import validar_cpf
+        from brasil_utils.validadores import validar_cpf as original
+        self.assertIs(validar_cpf, original)
+
+        with self.assertRaises(AttributeError):
+            brasil_utils.nao_existe
+        with self.assertRaises(ImportError):
+            from brasil_utils import nao_existe  # noqa: F401
+
+
+if __name__ == '__main__':
+    unittest.main()
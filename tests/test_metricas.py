@@ -0,0 +1,154 @@
+"""
+Testes unitários para o módulo metricas do brasil_utils
+"""
+
+import unittest
+import urllib.request
+from datetime import date
+from unittest.mock import patch
+
+from brasil_utils import cep, metricas
+from brasil_utils.feriados import eh_feriado
+from brasil_utils.formatadores import formatar_real
+from brasil_utils.validadores import (
+    formatar_cpf, validar_cpf, validar_cnpj, validar_documento, validar_documentos
+)
+
+
+class TestMetricas(unittest.TestCase):
+
+    def setUp(self):
+        metricas.zerar_metricas()
+        metricas.ativar_metricas()
+
+    def tearDown(self):
+        metricas.desativar_metricas()
+        metricas.zerar_metricas()
+
+    def _funcao(self, nome):
+        return metricas.obter_metricas()['funcoes'][nome]
+
+    def test_desativadas(self):
+        """Testa que nada é registrado com as métricas desativadas"""
+        metricas.desativar_metricas()
+        self.assertFalse(metricas.metricas_ativas())
+        validar_cpf("529.982.247-25")
+        metricas.incrementar('teste')
+        self.assertEqual(metricas.obter_metricas(), {'funcoes': {}, 'contadores': {}})
+
+    def test_resultados_validadores(self):
+        """Testa a contagem de chamadas por resultado"""
+        validar_cpf("529.982.247-25")
+        validar_cpf("111.111.111-11")
+        validar_cpf("123")
+        validar_cnpj("11.222.333/0001-81")
+
+        cpf = self._funcao('validar_cpf')
+        self.assertEqual(cpf['chamadas'], 3)
+        self.assertEqual(cpf['resultados'], {'valido': 1, 'invalido': 2})
+        self.assertEqual(self._funcao('validar_cnpj')['resultados'], {'valido': 1})
+
+    def test_chamadas_aninhadas(self):
+        """Testa que cada chamada pública é contada uma única vez"""
+        formatar_cpf("52998224725")
+        validar_documento("529.982.247-25")
+        validar_documento("11.222.333/0001-81")
+        validar_documentos(["52998224725", "123"])
+
+        funcoes = metricas.obter_metricas()['funcoes']
+        self.assertEqual(
+            {nome: estatistica['chamadas'] for nome, estatistica in funcoes.items()},
+            {'formatar_cpf': 1, 'validar_documento': 2, 'validar_documentos': 1}
+        )
+
+        # Fora das funções instrumentadas, a contagem volta ao normal
+        validar_cpf("52998224725")
+        self.assertEqual(self._funcao('validar_cpf')['chamadas'], 1)
+
+    def test_histograma(self):
+        """Testa o histograma cumulativo de latência"""
+        for _ in range(5):
+            formatar_real(1234.5)
+
+        latencia = self._funcao('formatar_real')['latencia']
+        self.assertEqual(latencia['contagem'], 5)
+        self.assertGreater(latencia['soma'], 0)
+        baldes = list(latencia['baldes'].values())
+        self.assertEqual(baldes, sorted(baldes))
+        self.assertEqual(latencia['baldes'][float('inf')], 5)
+
+    def test_excecao(self):
+        """Testa que exceções são contadas pelo nome da classe e relançadas"""
+        with self.assertRaises(AttributeError):
+            eh_feriado(12345)
+        eh_feriado(date(2024, 12, 25))
+        eh_feriado(date(2024, 12, 26))
+
+        self.assertEqual(
+            self._funcao('eh_feriado')['resultados'],
+            {'AttributeError': 1, 'feriado': 1, 'dia_comum': 1}
+        )
+
+    def test_buscar_cep(self):
+        """Testa a separação entre chamadas e consultas à API"""
+        encontrado = {campo: "" for campo in cep.CAMPOS_ENDERECO}
+        respostas = [encontrado, {"erro": "CEP não encontrado"}]
+        with patch.object(cep, "_consultar_viacep", side_effect=respostas):
+            cep.buscar_cep("01310-100")
+            cep.buscar_cep("99999-999")
+            cep.buscar_cep("123")
+
+        self.assertEqual(
+            self._funcao('buscar_cep')['resultados'],
+            {'ok': 1, 'nao_encontrado': 1, 'cep_invalido': 1}
+        )
+        self.assertEqual(self._funcao('consulta_cep')['chamadas'], 2)
+
+    def test_classificar_resposta_cep(self):
+        """Testa os rótulos das respostas de buscar_cep"""
+        casos = {
+            "CEP inválido": 'cep_invalido',
+            "CEP não disponível no cache (modo offline)": 'offline',
+            "Erro na consulta: timeout": 'erro_consulta',
+            "Outro erro": 'erro',
+        }
+        for erro, esperado in casos.items():
+            with self.subTest(erro=erro):
+                self.assertEqual(cep.classificar_resposta_cep({"erro": erro}), esperado)
+        self.assertEqual(cep.classificar_resposta_cep({"cep": "01310-100"}), 'ok')
+
+    def test_exportar_prometheus(self):
+        """Testa o formato texto do Prometheus"""
+        validar_cpf("529.982.247-25")
+        metricas.incrementar('eventos', 3)
+        texto = metricas.exportar_prometheus()
+
+        self.assertIn('# TYPE brasil_utils_chamadas_total counter', texto)
+        self.assertIn(
+            'brasil_utils_chamadas_total{funcao="validar_cpf",resultado="valido"} 1', texto
+        )
+        self.assertIn('# TYPE brasil_utils_latencia_segundos histogram', texto)
+        self.assertIn(
+            'brasil_utils_latencia_segundos_bucket{funcao="validar_cpf",le="+Inf"} 1', texto
+        )
+        self.assertIn('brasil_utils_latencia_segundos_count{funcao="validar_cpf"} 1', texto)
+        self.assertIn('brasil_utils_eventos_total 3', texto)
+        self.assertTrue(texto.endswith('\n'))
+
+    def test_servidor(self):
+        """Testa o endpoint HTTP local"""
+        validar_cpf("529.982.247-25")
+        servidor = metricas.iniciar_servidor_metricas(0)
+        try:
+            porta = servidor.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{porta}/metrics", timeout=5) as resposta:
+                self.assertIn('text/plain', resposta.headers['Content-Type'])
+                corpo = resposta.read().decode('utf-8')
+        finally:
+            servidor.shutdown()
+            servidor.server_close()
+        self.assertIn('funcao="validar_cpf"', corpo)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Testes unitários para o módulo telefones do brasil_utils
+"""
+
+import unittest
+
+from brasil_utils.telefones import (
+    TelefoneBR, analisar_telefone, analisar_telefones, classificar_telefones,
+    validar_telefone, CELULAR, FIXO, GRATUITO
+)
+
+
+class TestTelefones(unittest.TestCase):
+
+    def test_formatos_validos(self):
+        """Testa os formatos aceitos e a classificação"""
+        casos = [
+            ("11999887766", TelefoneBR("11", "999887766", CELULAR)),
+            ("(21) 3333-4444", TelefoneBR("21", "33334444", FIXO)),
+            ("+55 11 99988-7766", TelefoneBR("11", "999887766", CELULAR)),
+            ("551133334444", TelefoneBR("11", "33334444", FIXO)),
+            ("011 99988-7766", TelefoneBR("11", "999887766", CELULAR)),
+            ("0800 123 4567", TelefoneBR(None, "1234567", GRATUITO)),
+            ("99988-7766", TelefoneBR(None, "999887766", CELULAR)),
+            ("3333-4444", TelefoneBR(None, "33334444", FIXO)),
+        ]
+        for texto, esperado in casos:
+            with self.subTest(texto=texto):
+                self.assertEqual(analisar_telefone(texto), esperado)
+
+    def test_formatos_invalidos(self):
+        """Testa DDDs inexistentes, prefixos e tamanhos inválidos"""
+        for texto in ("2099988776", "(10) 99988-7766", "11899887766", "1193334444",
+                      "123", "", "abc", "11999887766123"):
+            with self.subTest(texto=texto):
+                self.assertIsNone(analisar_telefone(texto))
+                self.assertFalse(validar_telefone(texto))
+
+    def test_e164_e_formatado(self):
+        """Testa as representações de saída"""
+        celular = analisar_telefone("(11) 99988-7766")
+        self.assertEqual(celular.e164, "+5511999887766")
+        self.assertEqual(celular.formatado, "(11) 99988-7766")
+
+        self.assertEqual(analisar_telefone("0800 123 4567").e164, "+558001234567")
+        self.assertEqual(analisar_telefone("0800 123 4567").formatado, "0800 123 4567")
+        self.assertIsNone(analisar_telefone("3333-4444").e164)
+        self.assertEqual(analisar_telefone("3333-4444", ddd_padrao=61).e164, "+556133334444")
+
+    def test_slots(self):
+        """Testa que a representação não tem __dict__"""
+        with self.assertRaises(AttributeError):
+            analisar_telefone("11999887766").extra = 1
+
+    def test_lote(self):
+        """Testa a interpretação e a classificação em lote"""
+        telefones = ["11999887766", "1133334444", "08001234567", "123"]
+        self.assertEqual(analisar_telefones(telefones),
+                         [analisar_telefone(t) for t in telefones])
+        self.assertEqual(classificar_telefones(telefones), [CELULAR, FIXO, GRATUITO, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
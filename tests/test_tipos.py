@@ -0,0 +1,197 @@
+"""
+Testes unitários para os tipos de resultado do brasil_utils
+"""
+
+import unittest
+from datetime import date
+
+from brasil_utils import cep, feriados, validadores
+from brasil_utils.geradores import GeradorDocumentos
+from brasil_utils.cep_cache import CacheCep
+from brasil_utils.cep_provedores import buscar_ceps, buscar_enderecos
+from brasil_utils.tipos import (
+    CAMPOS_ENDERECO, Endereco, ErroCep, Feriado, LoteEnderecos, resultado_cep
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+PAULISTA = {
+    "cep": "01310-100", "logradouro": "Avenida Paulista", "complemento": "",
+    "bairro": "Bela Vista", "localidade": "São Paulo", "uf": "SP",
+    "ibge": "3550308", "gia": "1004", "ddd": "11", "siafi": "7107"
+}
+
+
+class _Backend:
+    """Backend em memória que responde com Endereco ou ErroCep"""
+
+    def consultar(self, cep_limpo):
+        if cep_limpo == "01310100":
+            return Endereco(**PAULISTA)
+        return ErroCep("nao_encontrado", "CEP não encontrado")
+
+
+class _BackendDict:
+    """Backend antigo, no formato de buscar_cep"""
+
+    def consultar(self, cep_limpo):
+        if cep_limpo == "01310100":
+            return dict(PAULISTA)
+        return {"erro": "CEP não encontrado"}
+
+
+class TestEndereco(unittest.TestCase):
+
+    def test_compatibilidade_dict(self):
+        """Testa a conversão de e para o formato de buscar_cep"""
+        endereco = Endereco.de_dict(PAULISTA)
+        self.assertEqual(endereco.localidade, "São Paulo")
+        self.assertEqual(endereco.como_dict(), PAULISTA)
+        self.assertEqual(Endereco.de_dict({"cep": "01310-100"}).uf, "")
+        self.assertEqual(endereco, Endereco(**PAULISTA))
+        self.assertEqual(len({endereco, Endereco(**PAULISTA)}), 1)
+        self.assertFalse(hasattr(endereco, "__dict__"))
+        with self.assertRaises(AttributeError):
+            endereco.uf = "RJ"
+
+    def test_resultado_cep(self):
+        """Testa a conversão das respostas em dicionário"""
+        self.assertEqual(resultado_cep(PAULISTA), Endereco(**PAULISTA))
+        erro = resultado_cep({"erro": "Erro na consulta: sem rede"})
+        self.assertEqual((erro.motivo, erro.mensagem), ("erro_consulta", "Erro na consulta: sem rede"))
+        self.assertEqual(resultado_cep({"erro": "outro"}).motivo, "erro")
+        endereco = Endereco(**PAULISTA)
+        self.assertIs(resultado_cep(endereco), endereco)
+
+    def test_backend_dict(self):
+        """Testa que backends que retornam dicionários continuam aceitos"""
+        for backend in (_Backend(), _BackendDict()):
+            with self.subTest(backend=type(backend).__name__):
+                self.assertEqual(cep.buscar_endereco("01310100", backend=backend).uf, "SP")
+                self.assertEqual(cep.buscar_cep("01310100", backend=backend), PAULISTA)
+                self.assertEqual(
+                    cep.buscar_cep("99999999", backend=backend), {"erro": "CEP não encontrado"}
+                )
+
+    def test_cache_sem_copia(self):
+        """Testa que o cache guarda e entrega o próprio Endereco"""
+        with CacheCep() as cache:
+            primeiro = cep.buscar_endereco("01310100", cache=cache, backend=_Backend())
+            self.assertIsInstance(cache.obter("01310100"), Endereco)
+            self.assertIs(cep.buscar_endereco("01310100", cache=cache, offline=True), primeiro)
+            self.assertEqual(cep.buscar_cep("01310100", cache=cache, offline=True), PAULISTA)
+
+    def test_buscar_endereco(self):
+        """Testa buscar_endereco com o mesmo backend de buscar_cep"""
+        backend = _Backend()
+        self.assertEqual(
+            cep.buscar_endereco("01310-100", backend=backend),
+            Endereco.de_dict(cep.buscar_cep("01310-100", backend=backend))
+        )
+
+        casos = [("99999999", "nao_encontrado"), ("123", "cep_invalido")]
+        for valor, motivo in casos:
+            with self.subTest(cep=valor):
+                with self.assertRaises(ErroCep) as contexto:
+                    cep.buscar_endereco(valor, backend=backend)
+                self.assertEqual(contexto.exception.motivo, motivo)
+                self.assertEqual(
+                    contexto.exception.como_dict(), cep.buscar_cep(valor, backend=backend)
+                )
+
+    def test_buscar_enderecos(self):
+        """Testa o lote por colunas contra buscar_ceps"""
+        ceps = ["01310-100", "99999999", "123", "01310100"]
+        lote = buscar_enderecos(ceps, resolvedor=_Backend())
+
+        self.assertEqual(len(lote), 4)
+        self.assertEqual(lote.encontrados, [True, False, False, True])
+        self.assertEqual(lote.coluna("uf"), ["SP", "", "", "SP"])
+        self.assertEqual(lote[0], Endereco.de_dict(PAULISTA))
+        self.assertEqual(lote[1].motivo, "nao_encontrado")
+        self.assertEqual(lote[2].motivo, "cep_invalido")
+        self.assertEqual(
+            [item.como_dict() for item in lote], buscar_ceps(ceps, resolvedor=_Backend())
+        )
+
+    def test_lote_vazio(self):
+        """Testa o lote sem CEPs"""
+        lote = LoteEnderecos.de_resultados([], [])
+        self.assertEqual(len(lote), 0)
+        self.assertEqual(set(lote.colunas), set(CAMPOS_ENDERECO))
+
+
+class TestFeriado(unittest.TestCase):
+
+    def test_listar_feriados(self):
+        """Testa que listar_feriados tem o mesmo conteúdo de todos_feriados"""
+        for ano, uf, municipio in [(2024, None, None), (2025, "SP", None), (2025, None, "3550308")]:
+            with self.subTest(ano=ano, uf=uf, municipio=municipio):
+                lista = feriados.listar_feriados(ano, uf, municipio)
+                self.assertEqual(
+                    {nome: data for data, nome in lista},
+                    feriados.todos_feriados(ano, uf, municipio)
+                )
+                self.assertEqual(list(lista), sorted(lista))
+
+        natal = [f for f in feriados.listar_feriados(2024) if f.nome == "Natal"][0]
+        self.assertEqual(natal, Feriado(date(2024, 12, 25), "Natal"))
+        self.assertIs(feriados.listar_feriados(2024), feriados.listar_feriados(2024))
+
+
+class TestDocumentoValidado(unittest.TestCase):
+
+    def test_validar_documento(self):
+        """Testa a validação com tipo deduzido ou informado"""
+        cpf = validadores.validar_documento("529.982.247-25")
+        self.assertTrue(cpf)
+        self.assertEqual((cpf.tipo, cpf.numero), ("cpf", "52998224725"))
+        self.assertEqual(cpf.formatado, validadores.formatar_cpf("52998224725"))
+
+        cnpj = validadores.validar_documento("12.ABC.345/01DE-35")
+        self.assertTrue(cnpj)
+        self.assertEqual((cnpj.tipo, cnpj.numero), ("cnpj", "12ABC34501DE35"))
+        self.assertEqual(cnpj.formatado, validadores.formatar_cnpj("12ABC34501DE35"))
+
+        invalido = validadores.validar_documento("529.982.247-26", tipo="cpf")
+        self.assertFalse(invalido)
+        self.assertIsNone(invalido.formatado)
+
+        with self.assertRaises(ValueError):
+            validadores.validar_documento("52998224725", tipo="rg")
+
+    def test_validar_documentos(self):
+        """Testa o lote contra a validação individual"""
+        cpfs = ["529.982.247-25", "52998224726", "123", "111.444.777-35"]
+        lote = validadores.validar_documentos(iter(cpfs))
+
+        self.assertEqual(len(lote), 4)
+        self.assertEqual(lote.quantidade_validos, 2)
+        self.assertEqual(lote.filtrar_validos(), ["529.982.247-25", "111.444.777-35"])
+        self.assertEqual(list(lote), [validadores.validar_documento(c, "cpf") for c in cpfs])
+
+        cnpjs = validadores.validar_documentos(["11.222.333/0001-81", "12ABC34501DE35"], "cnpj")
+        self.assertEqual(cnpjs.filtrar_validos(), ["11.222.333/0001-81", "12ABC34501DE35"])
+
+        with self.assertRaises(ValueError):
+            validadores.validar_documentos(cpfs, tipo="rg")
+
+    @unittest.skipIf(np is None, "NumPy não instalado")
+    def test_lote_de_bytes(self):
+        """Testa o acesso aos itens de um lote criado a partir de um array 'S'"""
+        cnpjs = np.array([b"12.ABC.345/01DE-35", b"11222333000181"], dtype='S18')
+        lote = validadores.validar_documentos(cnpjs, "cnpj")
+        self.assertEqual([d.numero for d in lote], ["12ABC34501DE35", "11222333000181"])
+        self.assertEqual(lote[0].formatado, "12.ABC.345/01DE-35")
+
+        cpfs = GeradorDocumentos(1).lote_cpf(3)
+        self.assertEqual([d.numero for d in validadores.validar_documentos(cpfs)],
+                         [cpf.decode() for cpf in cpfs])
+
+
+if __name__ == '__main__':
+    unittest.main()
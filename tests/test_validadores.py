@@ -3,7 +3,17 @@ Testes unitários para o módulo validadores do brasil_utils
 """
 
 import unittest
-from brasil_utils.validadores import validar_cpf, validar_cnpj, formatar_cpf, formatar_cnpj
+from brasil_utils.validadores import (
+    validar_cpf, validar_cnpj, formatar_cpf, formatar_cnpj,
+    validar_cpf_lote, validar_cnpj_lote, validar_em_paralelo, validar_cpf_bytes,
+    validar_cnpj_bytes, validar_registros, validar_arquivo_registros, calcular_digitos,
+    calcular_digitos_lote
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestValidadores(unittest.TestCase):
@@ -70,6 +80,207 @@ class TestValidadores(unittest.TestCase):
         self.assertEqual(formatar_cnpj("11.222.333/0001-81"), "11.222.333/0001-81")
         self.assertEqual(formatar_cnpj("11111111111111"), "")  # CNPJ inválido
 
+    def test_cnpj_alfanumerico(self):
+        """Testa o CNPJ alfanumérico (letras nas 12 primeiras posições)"""
+        self.assertTrue(validar_cnpj("12.ABC.345/01DE-35"))
+        self.assertTrue(validar_cnpj("12ABC34501DE35"))
+        self.assertTrue(validar_cnpj("12abc34501de35"))
+        self.assertFalse(validar_cnpj("12.ABC.345/01DE-36"))
+        self.assertFalse(validar_cnpj("12.ABC.345/01DE-3A"))
+        self.assertFalse(validar_cnpj("AAAAAAAAAAAAAA"))
+        self.assertEqual(formatar_cnpj("12abc34501de35"), "12.ABC.345/01DE-35")
+        self.assertEqual(formatar_cnpj("12ABC34501DE36"), "")
+
+    def test_calcular_digitos(self):
+        """Testa o cálculo dos dígitos verificadores"""
+        self.assertEqual(calcular_digitos("529982247"), "25")
+        self.assertEqual(calcular_digitos("112223330001", "cnpj"), "81")
+        self.assertEqual(calcular_digitos("12abc34501de", "cnpj"), "35")
+        with self.assertRaises(ValueError):
+            calcular_digitos("529982247", "rg")
+
+    def test_cnpj_com_rotulo(self):
+        """Testa CNPJ numérico precedido de rótulo (letras fora do corpo)"""
+        self.assertTrue(validar_cnpj("CNPJ: 11.222.333/0001-81"))
+        self.assertTrue(validar_cnpj("cnpj 11222333000181"))
+        self.assertTrue(validar_cnpj("11.222.333/0001-81 (matriz)"))
+        self.assertFalse(validar_cnpj("CNPJ: 11.222.333/0001-82"))
+        self.assertEqual(formatar_cnpj("CNPJ: 11.222.333/0001-81"), "11.222.333/0001-81")
+
+
+
+@unittest.skipIf(np is None, "NumPy não instalado")
+class TestValidacaoLote(unittest.TestCase):
+
+    CPFS = [
+        "123.456.789-09", "12345678909", "111.444.777-35",
+        "123.456.789-10", "11111111111", "123456789", "123456789012", "",
+        "cpf: 123.456.789-09", 12345678909, "١٢٣٤٥٦٧٨٩٠٩"
+    ]
+    CNPJS = [
+        "11.222.333/0001-81", "", "11222333000181", "11.222.333/0001-82",
+        "11111111111111", "1122233300018", "12.ABC.345/01DE-35", "12abc34501de35",
+        "12.ABC.345/01DE-36", "AAAAAAAAAAAAAA", "12ABC34501DE3X",
+        "CNPJ: 11.222.333/0001-81", "cnpj 11222333000182", "CNPJ: 12.ABC.345/01DE-35"
+    ]
+
+    def test_validar_cpf_lote_sequencia(self):
+        """Testa que o lote de CPFs confere com a validação escalar"""
+        esperado = [validar_cpf(cpf) for cpf in self.CPFS]
+        self.assertEqual(validar_cpf_lote(self.CPFS).tolist(), esperado)
+
+    def test_validar_cnpj_lote_sequencia(self):
+        """Testa que o lote de CNPJs confere com a validação escalar"""
+        esperado = [validar_cnpj(cnpj) for cnpj in self.CNPJS]
+        self.assertEqual(validar_cnpj_lote(self.CNPJS).tolist(), esperado)
+
+    def test_validar_lote_array_numpy(self):
+        """Testa arrays NumPy de strings unicode e de bytes"""
+        cpfs = [str(cpf) for cpf in self.CPFS if str(cpf).isascii()]
+        esperado = [validar_cpf(cpf) for cpf in cpfs]
+        self.assertEqual(validar_cpf_lote(np.array(cpfs)).tolist(), esperado)
+        self.assertEqual(validar_cpf_lote(np.array(cpfs, dtype='S')).tolist(), esperado)
+
+    def test_validar_lote_buffer_bytes(self):
+        """Testa buffer de bytes com um documento por linha"""
+        buffer = "\n".join(self.CNPJS).encode()
+        esperado = [validar_cnpj(cnpj) for cnpj in self.CNPJS]
+        self.assertEqual(validar_cnpj_lote(buffer).tolist(), esperado)
+
+    def test_calcular_digitos_lote(self):
+        """Testa que o cálculo em lote confere com o escalar"""
+        for tipo, bases in (('cpf', ["529982247", "111444777", "000000001"]),
+                            ('cnpj', ["112223330001", "12ABC34501DE"])):
+            with self.subTest(tipo=tipo):
+                matriz = np.frombuffer("".join(bases).encode(), dtype=np.uint8).reshape(
+                    len(bases), -1
+                ).astype(np.int64) - 48
+                esperado = [[int(d) for d in calcular_digitos(b, tipo)] for b in bases]
+                self.assertEqual(calcular_digitos_lote(matriz, tipo).tolist(), esperado)
+
+    def test_validar_lote_vazio(self):
+        """Testa lote vazio"""
+        self.assertEqual(len(validar_cpf_lote([])), 0)
+
+
+class TestValidacaoBytes(unittest.TestCase):
+
+    CPFS = TestValidacaoLote.CPFS[:9]
+    CNPJS = TestValidacaoLote.CNPJS
+
+    def test_validar_bytes(self):
+        """Testa que a validação de bytes confere com a de str"""
+        for cpf in self.CPFS:
+            with self.subTest(cpf=cpf):
+                esperado = validar_cpf(cpf)
+                self.assertEqual(validar_cpf_bytes(cpf.encode()), esperado)
+                self.assertEqual(validar_cpf_bytes(bytearray(cpf.encode())), esperado)
+        for cnpj in self.CNPJS:
+            with self.subTest(cnpj=cnpj):
+                self.assertEqual(validar_cnpj_bytes(cnpj.encode()), validar_cnpj(cnpj))
+
+    def test_validar_memoryview(self):
+        """Testa fatias de memoryview, sem cópia do buffer"""
+        buffer = memoryview(b"529.982.247-25|11.222.333/0001-81")
+        self.assertTrue(validar_cpf_bytes(buffer[:14]))
+        self.assertTrue(validar_cnpj_bytes(buffer[15:]))
+        self.assertFalse(validar_cpf_bytes(buffer[1:14]))
+
+
+@unittest.skipIf(np is None, "NumPy não instalado")
+class TestValidacaoRegistros(unittest.TestCase):
+
+    def _registros(self, documentos, largura):
+        # Registro: código de 4 dígitos, "|", documento alinhado à esquerda, "\n"
+        return b"".join(
+            f"{indice:04d}|{documento:<{largura}}\n".encode()
+            for indice, documento in enumerate(documentos)
+        )
+
+    def test_validar_registros(self):
+        """Testa registros de largura fixa contra a validação escalar"""
+        for tipo, documentos, validar, largura in (
+            ('cpf', TestValidacaoBytes.CPFS, validar_cpf, 19),
+            ('cnpj', TestValidacaoBytes.CNPJS, validar_cnpj, 24),
+        ):
+            with self.subTest(tipo=tipo):
+                dados = self._registros(documentos, largura)
+                esperado = [validar(documento) for documento in documentos]
+                resultado = validar_registros(dados, largura + 6, 5, largura, tipo=tipo)
+                self.assertEqual(resultado.tolist(), esperado)
+                # Blocos pequenos e último registro sem quebra de linha
+                resultado = validar_registros(
+                    dados[:-1], largura + 6, 5, largura, tipo=tipo, tamanho_bloco=2
+                )
+                self.assertEqual(resultado.tolist(), esperado)
+
+    def test_validar_registros_cep(self):
+        """Testa a validação de CEPs em registros"""
+        dados = bytearray(b"01310-100|0131-0100|1234567  |ABCDEFGHI|")
+        self.assertEqual(
+            validar_registros(dados, 10, tamanho=9, tipo='cep').tolist(),
+            [True, True, False, False]
+        )
+
+    def test_validar_arquivo_registros(self):
+        """Testa a validação de um arquivo mapeado em memória"""
+        import os
+        import tempfile
+
+        documentos = TestValidacaoBytes.CPFS * 50
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, "cpfs.txt")
+            with open(caminho, "wb") as arquivo:
+                arquivo.write(self._registros(documentos, 19))
+            resultado = validar_arquivo_registros(caminho, 25, 5, 19)
+            self.assertEqual(resultado.tolist(), [validar_cpf(cpf) for cpf in documentos])
+
+            open(caminho, "wb").close()
+            self.assertEqual(len(validar_arquivo_registros(caminho, 25, 5, 19)), 0)
+
+    def test_campo_fora_do_registro(self):
+        """Testa os parâmetros inválidos"""
+        with self.assertRaises(ValueError):
+            validar_registros(b"", 10, 5, 6)
+        with self.assertRaises(ValueError):
+            validar_registros(b"", 10, tipo='rg')
+
+
+
+class TestValidacaoParalela(unittest.TestCase):
+
+    DOCUMENTOS = ["123.456.789-09", "11111111111", "111.444.777-35", "", "123456789"]
+
+    def test_entrada_pequena_no_processo_atual(self):
+        """Testa a validação sem pool de processos"""
+        esperado = [validar_cpf(cpf) for cpf in self.DOCUMENTOS]
+        self.assertEqual(list(validar_em_paralelo(iter(self.DOCUMENTOS))), esperado)
+
+    def test_pool_de_processos_preserva_ordem(self):
+        """Testa a distribuição em blocos entre processos"""
+        cnpjs = ["11.222.333/0001-81", "11.222.333/0001-82", "11222333000181"] * 40
+        esperado = [validar_cnpj(cnpj) for cnpj in cnpjs]
+        resultado = validar_em_paralelo(
+            (cnpj for cnpj in cnpjs), tipo='cnpj', workers=2,
+            chunk_size=7, limite_sequencial=10
+        )
+        self.assertEqual(list(resultado), esperado)
+
+    def test_tipo_invalido(self):
+        """Testa tipo de documento desconhecido"""
+        with self.assertRaises(ValueError):
+            validar_em_paralelo([], tipo='rg')
+
+    def test_argumentos_verificados_na_chamada(self):
+        """Testa que argumentos inválidos falham antes de consumir a entrada"""
+        consumidos = []
+        documentos = (consumidos.append(cpf) or cpf for cpf in self.DOCUMENTOS)
+        for argumentos in ({'workers': 0}, {'workers': -2}, {'chunk_size': 0}):
+            with self.subTest(**argumentos):
+                with self.assertRaises(ValueError):
+                    validar_em_paralelo(documentos, **argumentos)
+        self.assertEqual(consumidos, [])
+
 
 if __name__ == '__main__':
     unittest.main()